@@ -0,0 +1,538 @@
+import csv
+import json
+import logging
+import math
+import statistics
+import time
+from statistics import NormalDist
+from typing import Any, Dict, List, Optional, Tuple
+
+from BenchmarkEnvironment import capture_environment, write_metadata_header
+from FibonacciBenchmark import FibonacciBenchmark
+from src.Strategies.FibonacciStrategy import small_n_table
+
+_NORMAL = NormalDist()
+
+# Estimated time, variance of that estimate and number of samples behind it
+Estimate = Tuple[float, float, int]
+
+
+class CurveFit:
+    """
+    Power law t = scale * n^exponent, fitted to the per-n times of one strategy on a log-log scale.
+
+    Used to predict the time of n values that have not been measured, together with the
+    variance of the prediction.
+    """
+
+    def __init__(self, points: List[Tuple[int, float]], noise: float):
+        """
+        Fit the curve.
+
+        :param points: (n, time) pairs.
+        :param noise: Relative measurement noise; the residual variance is never assumed to be smaller.
+        """
+        coordinates = [(math.log(max(n, 1)), math.log(t)) for n, t in points if t > 0]
+        self.count = len(coordinates)
+        self.mean_x = sum(x for x, _ in coordinates) / self.count if self.count else 0.0
+        mean_y = sum(y for _, y in coordinates) / self.count if self.count else 0.0
+        self.sxx = sum((x - self.mean_x) ** 2 for x, _ in coordinates)
+        self.exponent = (sum((x - self.mean_x) * (y - mean_y) for x, y in coordinates) / self.sxx
+                         if self.sxx > 0 else 0.0)
+        self.intercept = mean_y - self.exponent * self.mean_x
+
+        if self.count > 2 and self.sxx > 0:
+            residuals = sum((y - self.intercept - self.exponent * x) ** 2 for x, y in coordinates)
+            self.residual_variance = max(residuals / (self.count - 2), noise ** 2)
+        else:
+            self.residual_variance = None
+
+    @property
+    def scale(self) -> float:
+        return math.exp(self.intercept)
+
+    def predict(self, n: int) -> Tuple[float, float]:
+        """
+        Predict the time at n.
+
+        :param n: Input size.
+        :return: Predicted time and the relative variance of the prediction.
+        """
+        x = math.log(max(n, 1))
+        if self.residual_variance is None:
+            # Too few points for a residual estimate: treat the prediction as a guess
+            log_variance = 1.0
+        else:
+            log_variance = self.residual_variance * (1 / self.count + (x - self.mean_x) ** 2 / self.sxx)
+        return math.exp(self.intercept + self.exponent * x), log_variance
+
+
+class AdaptiveBenchmark:
+    """
+    Time-budgeted benchmark that spends its measurements where they reduce uncertainty most.
+
+    Instead of timing every strategy at every n, the run starts with a few seed points per
+    strategy and then repeatedly scores every (strategy, n) candidate on the grid of
+    run_benchmark. The score is the expected gain in confidence from one more sample,
+    divided by the expected cost of taking it:
+
+    - for every other strategy, the confidence that the two are correctly ordered at n (or
+      correctly known to be tied within `tolerance`), which concentrates samples around
+      crossover points;
+    - the confidence that the strategy's curve is known within `tolerance` at n.
+
+    Unmeasured points are predicted from a power-law fit of each strategy's curve, so a point
+    is only measured if that improves on the fit. The run stops when every comparison and
+    every curve point has reached the target confidence, or when the wall-clock budget is spent.
+
+    Scoring is quadratic in the number of strategies, so on long grids candidates are scored
+    on an evenly spaced subset of at most `max_schedule_points` n values, which is also the
+    resolution of the reported confidence and crossovers. The time spent
+    scheduling comes out of the budget like the measurements do: every batch takes enough
+    samples that their expected cost is at least SCHEDULING_RATIO times the last scheduling pass.
+    """
+
+    DEFAULT_NOISE = 0.1
+    MIN_NOISE = 0.001
+    # Variance of the median relative to the variance of the mean for normally distributed samples
+    MEDIAN_VARIANCE_FACTOR = math.pi / 2
+    # Minimum ratio of measuring to scheduling time per batch
+    SCHEDULING_RATIO = 4
+
+    def __init__(self, max_n: int, spread: int, timeout: float, budget: float, target_confidence: float = 0.95,
+                 tolerance: float = 0.05, seed_points: int = 6, batch_size: Optional[int] = None,
+                 disable_gc: bool = False, max_schedule_points: int = 200, use_small_n_table: bool = False):
+        """
+        Initialize the AdaptiveBenchmark.
+
+        :param max_n: Maximum Fibonacci number to calculate.
+        :param spread: Step size between Fibonacci numbers.
+        :param timeout: Maximum execution time for each calculation.
+        :param budget: Total wall-clock time for the run in seconds.
+        :param target_confidence: Confidence at which the run stops early.
+        :param tolerance: Relative time difference below which strategies count as tied, and the
+                          relative precision targeted for every curve point.
+        :param seed_points: Number of geometrically spaced n values every strategy is first measured at.
+        :param batch_size: Minimum number of measurements taken between two scheduling passes
+                           (defaults to the number of strategies).
+        :param disable_gc: Disable the garbage collector during timed regions.
+        :param max_schedule_points: Maximum number of n values per strategy that are scored and measured.
+        :param use_small_n_table: Serve n below the small-n table limit from the table (off by default).
+        """
+        self.max_n = max_n
+        self.spread = spread
+        self.timeout = min(timeout, budget)
+        self.budget = budget
+        self.target_confidence = target_confidence
+        self.tolerance = tolerance
+        self.seed_points = max(2, seed_points)
+        self.batch_size = batch_size
+        self.benchmark = FibonacciBenchmark(max_n=max_n, spread=spread, timeout=self.timeout, disable_gc=disable_gc,
+                                            use_small_n_table=use_small_n_table)
+        self.grid = list(range(0, max_n, spread))
+        stride = max(1, math.ceil(len(self.grid) / max_schedule_points))
+        self.schedule_grid = self.grid[::stride]
+        self.samples: Dict[str, Dict[int, List[float]]] = {}
+        self.limits: Dict[str, int] = {}
+        self.metadata: Dict[str, Any] = {}
+        self.report: Dict[str, Any] = {}
+        self._overhead: Optional[float] = None
+        self._deadline = 0.0
+        self._scheduling_time = 0.0
+        self._last_scheduling_time = 0.0
+
+    def _remaining(self) -> float:
+        """Seconds left in the budget."""
+        return self._deadline - time.perf_counter()
+
+    def _measure(self, strategy: Any, n: int) -> bool:
+        """
+        Take one sample of a strategy at n.
+
+        :param strategy: Strategy object to time.
+        :param n: Input size.
+        :return: False if the calculation timed out; n and above are then excluded for the strategy
+                 unless it was only cut short by the end of the budget.
+        """
+        name = strategy.__class__.__name__
+        # Never wait for a calculation beyond the end of the budget
+        self.benchmark.timeout = max(0.0, min(self.timeout, self._remaining()))
+        started = time.perf_counter()
+        measurements, complete = self.benchmark.measure_range(strategy.execute, n, n + 1)
+        elapsed = time.perf_counter() - started
+        if not complete:
+            if self._remaining() > 0:
+                self.limits[name] = min(self.limits[name], n)
+            return False
+
+        execution_time = measurements[0][1]
+        self.samples[name].setdefault(n, []).append(execution_time)
+        # Smoothed cost of a measurement beyond the timed region (thread hand-off, bookkeeping)
+        overhead = max(0.0, elapsed - execution_time)
+        self._overhead = overhead if self._overhead is None else 0.9 * self._overhead + 0.1 * overhead
+        return True
+
+    def _noise(self, name: str) -> float:
+        """
+        Relative measurement noise of a strategy, pooled over all repeated points.
+
+        Short calculations are prone to outliers (scheduling, page faults), so the spread of points
+        with three or more samples is taken from their median absolute deviation.
+
+        :param name: Name of the strategy.
+        :return: Pooled relative standard deviation.
+        """
+        squares, degrees_of_freedom = 0.0, 0
+        for times in self.samples[name].values():
+            center = statistics.median(times)
+            if len(times) < 2 or center <= 0:
+                continue
+            if len(times) == 2:
+                deviation = abs(times[0] - times[1]) / math.sqrt(2)
+            else:
+                deviation = 1.4826 * statistics.median(abs(t - center) for t in times)
+            squares += (len(times) - 1) * (deviation / center) ** 2
+            degrees_of_freedom += len(times) - 1
+        if not degrees_of_freedom:
+            return self.DEFAULT_NOISE
+        return max(math.sqrt(squares / degrees_of_freedom), self.MIN_NOISE)
+
+    def _estimates(self, grid: List[int]) -> Tuple[Dict[str, Dict[int, Estimate]], Dict[str, float], Dict[str, CurveFit]]:
+        """
+        Estimate every strategy's time at every n of a grid that it can still be measured at.
+
+        Measured points use their sample median; the others are predicted by the curve fit and left
+        out if the prediction exceeds the timeout.
+
+        :param grid: Ascending n values to estimate.
+        :return: Estimates per strategy and n, the noise per strategy and the curve fits.
+        """
+        estimates, noises, fits = {}, {}, {}
+        for name, cells in self.samples.items():
+            limit = self.limits[name]
+            noise = noises[name] = self._noise(name)
+            fit = fits[name] = CurveFit(
+                [(n, statistics.median(times)) for n, times in cells.items() if n < limit], noise)
+            by_n = estimates[name] = {}
+            for n in grid:
+                if n >= limit:
+                    break
+                times = cells.get(n)
+                if times:
+                    median = statistics.median(times)
+                    by_n[n] = (median, self.MEDIAN_VARIANCE_FACTOR * (noise * median) ** 2 / len(times), len(times))
+                elif fit.count:
+                    mean, log_variance = fit.predict(n)
+                    if mean <= self.timeout:
+                        by_n[n] = (mean, mean * mean * log_variance, 0)
+        return estimates, noises, fits
+
+    def _pair_confidence(self, first: Estimate, second: Estimate, first_variance: Optional[float] = None) -> float:
+        """
+        Probability that the ordering of two strategies at the same n is resolved.
+
+        Resolved means that either the faster one is identified correctly or both are known to be
+        within the tolerance of each other.
+
+        :param first: Estimate of the first strategy.
+        :param second: Estimate of the second strategy.
+        :param first_variance: Variance to use for the first estimate instead of its own.
+        :return: The confidence.
+        """
+        variance = (first[1] if first_variance is None else first_variance) + second[1]
+        difference = first[0] - second[0]
+        if variance <= 0:
+            return 1.0
+        deviation = math.sqrt(variance)
+        margin = self.tolerance * (first[0] + second[0]) / 2
+        ordered = _NORMAL.cdf(abs(difference) / deviation)
+        tied = _NORMAL.cdf((margin - difference) / deviation) - _NORMAL.cdf((-margin - difference) / deviation)
+        return max(ordered, tied)
+
+    def _curve_confidence(self, mean: float, variance: float) -> float:
+        """
+        Probability that an estimate is within the tolerance of the true mean time.
+
+        :param mean: Estimated time.
+        :param variance: Variance of the estimate.
+        :return: The confidence.
+        """
+        if variance <= 0:
+            return 1.0
+        return 2 * _NORMAL.cdf(self.tolerance * mean / math.sqrt(variance)) - 1
+
+    def _confidence(self, estimates: Dict[str, Dict[int, Estimate]]) -> Tuple[float, float]:
+        """
+        Confidence reached over all comparisons and curve points.
+
+        :param estimates: Result of _estimates.
+        :return: The lowest and the mean confidence.
+        """
+        confidences = []
+        names = list(estimates)
+        for i, first in enumerate(names):
+            for n, estimate in estimates[first].items():
+                confidences.append(self._curve_confidence(estimate[0], estimate[1]))
+                for second in names[i + 1:]:
+                    if n in estimates[second]:
+                        confidences.append(self._pair_confidence(estimate, estimates[second][n]))
+        if not confidences:
+            return 0.0, 0.0
+        return min(confidences), sum(confidences) / len(confidences)
+
+    def _candidates(self, estimates: Dict[str, Dict[int, Estimate]], noises: Dict[str, float]) -> List[Tuple[float, str, int]]:
+        """
+        Score every (strategy, n) by the confidence one more sample is expected to add per second.
+
+        :param estimates: Result of _estimates.
+        :param noises: Relative noise per strategy.
+        :return: (priority, strategy name, n) for every candidate with a positive gain, best first.
+        """
+        overhead = self._overhead or 0.0
+        candidates = []
+        for name, by_n in estimates.items():
+            for n, estimate in by_n.items():
+                mean, variance, count = estimate
+                sample_variance = self.MEDIAN_VARIANCE_FACTOR * (noises[name] * mean) ** 2
+                after = variance * count / (count + 1) if count else min(variance, sample_variance)
+                if after >= variance:
+                    continue
+                gain = self._curve_confidence(mean, after) - self._curve_confidence(mean, variance)
+                for other, other_by_n in estimates.items():
+                    if other != name and n in other_by_n:
+                        gain += (self._pair_confidence(estimate, other_by_n[n], after)
+                                 - self._pair_confidence(estimate, other_by_n[n]))
+                if gain > 0:
+                    candidates.append((gain / (mean + overhead), name, n))
+        candidates.sort(reverse=True)
+        return candidates
+
+    def _crossovers(self, estimates: Dict[str, Dict[int, Estimate]]) -> List[Dict[str, Any]]:
+        """
+        Locate the crossover points between every pair of strategies.
+
+        n values at which the two strategies are within the tolerance of each other are skipped,
+        so noise in a region where they are tied does not show up as a series of crossovers.
+
+        :param estimates: Result of _estimates.
+        :return: For each crossover, the strategy that is faster below and above it, the two n values
+                 it lies between and the confidence that both sides are ordered correctly.
+        """
+        crossovers = []
+        names = list(estimates)
+        for i, first in enumerate(names):
+            for second in names[i + 1:]:
+                shared = [n for n in estimates[first] if n in estimates[second]]
+                previous = None
+                for n in shared:
+                    a, b = estimates[first][n], estimates[second][n]
+                    if abs(a[0] - b[0]) <= self.tolerance * (a[0] + b[0]) / 2:
+                        continue
+                    faster = first if a[0] < b[0] else second
+                    ordered = _NORMAL.cdf(abs(a[0] - b[0]) / math.sqrt(a[1] + b[1])) if a[1] + b[1] > 0 else 1.0
+                    if previous is not None and faster != previous[0]:
+                        crossovers.append({
+                            'faster_below': previous[0],
+                            'faster_above': faster,
+                            'between': [previous[1], n],
+                            'confidence': previous[2] * ordered,
+                        })
+                    previous = (faster, n, ordered)
+        return sorted(crossovers, key=lambda crossover: crossover['between'][0])
+
+    def _schedule(self) -> Tuple[Dict[str, Dict[int, Estimate]], Dict[str, float], Dict[str, CurveFit], float,
+                                 float, List[Tuple[float, str, int]]]:
+        """
+        Score the candidates on the scheduling grid and time how long that takes.
+
+        :return: The estimates, noise per strategy, curve fits, lowest and mean confidence, and the ranked candidates.
+        """
+        started = time.perf_counter()
+        estimates, noises, fits = self._estimates(self.schedule_grid)
+        confidence, mean_confidence = self._confidence(estimates)
+        candidates = self._candidates(estimates, noises) if confidence < self.target_confidence else []
+        self._last_scheduling_time = time.perf_counter() - started
+        self._scheduling_time += self._last_scheduling_time
+        return estimates, noises, fits, confidence, mean_confidence, candidates
+
+    def _seed(self, strategies: List[Any]) -> None:
+        """
+        Measure every strategy twice at geometrically spaced n values, to have curves and noise to start from.
+
+        The n values increase from the start of the grid, so a strategy that times out (and is not
+        measured further up) does so at the smallest n that is too slow for it.
+        """
+        grid = self.schedule_grid
+        count = min(self.seed_points, len(grid))
+        top = len(grid) - 1
+        geometric = [round(top ** (i / (count - 2))) for i in range(count - 1)] if count > 2 else [top]
+        indices = sorted({0} | set(geometric))
+        for n in (grid[index] for index in indices):
+            for strategy in strategies:
+                name = strategy.__class__.__name__
+                for _ in range(2):
+                    if n >= self.limits[name] or self._remaining() <= 0 or not self._measure(strategy, n):
+                        break
+
+    def run(self, strategies: List[Any], csv_filename: Optional[str] = None,
+            json_filename: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Run the adaptive benchmark and save the samples.
+
+        :param strategies: List of strategy objects to benchmark.
+        :param csv_filename: Name of the output CSV file.
+        :param json_filename: Name of the output JSON file.
+        :return: The report: confidence reached, crossovers and fitted curves.
+        """
+        logging.info(f"Starting adaptive benchmark with a budget of {self.budget:g} seconds...")
+        started = time.perf_counter()
+        self._deadline = started + self.budget
+        by_name = {strategy.__class__.__name__: strategy for strategy in strategies}
+        for name in by_name:
+            self.samples[name] = {}
+            self.limits[name] = self.max_n
+        with small_n_table.override(self.benchmark.table_limit):
+            self.metadata = capture_environment()
+
+            self._seed(strategies)
+            batch_size = self.batch_size or len(strategies)
+            estimates, noises, fits, confidence, mean_confidence, candidates = self._schedule()
+            while confidence < self.target_confidence and self._remaining() > 0:
+                measured, expected_cost = 0, 0.0
+                for _, name, n in candidates:
+                    if measured >= batch_size and expected_cost >= self.SCHEDULING_RATIO * self._last_scheduling_time:
+                        break
+                    # Skip samples that are not expected to fit into what is left of the budget
+                    cost = estimates[name][n][0] + (self._overhead or 0.0)
+                    if cost > self._remaining():
+                        continue
+                    self._measure(by_name[name], n)
+                    measured += 1
+                    expected_cost += cost
+                if not measured:
+                    break
+                estimates, noises, fits, confidence, mean_confidence, candidates = self._schedule()
+
+        self.report = {
+            'budget': self.budget,
+            'elapsed': time.perf_counter() - started,
+            'measurements': sum(len(times) for cells in self.samples.values() for times in cells.values()),
+            'scheduling_time': self._scheduling_time,
+            'target_confidence': self.target_confidence,
+            'tolerance': self.tolerance,
+            'confidence': confidence,
+            'mean_confidence': mean_confidence,
+            'target_reached': confidence >= self.target_confidence,
+            'crossovers': self._crossovers(estimates),
+            'curves': {
+                name: {
+                    'exponent': fit.exponent,
+                    'scale': fit.scale,
+                    'noise': noises[name],
+                    'points': len(self.samples[name]),
+                    'samples': sum(len(times) for times in self.samples[name].values()),
+                    'limit': self.limits[name],
+                }
+                for name, fit in fits.items()
+            },
+        }
+        self.metadata['benchmark'] = {
+            'max_n': self.max_n,
+            'spread': self.spread,
+            'timeout': self.timeout,
+            'strategies': list(by_name),
+            'max_schedule_points': len(self.schedule_grid),
+            'disable_gc': self.benchmark.disable_gc,
+            'adaptive': True,
+        }
+        self.metadata['adaptive'] = self.report
+
+        if self.report['target_reached']:
+            logging.info(f"Reached {confidence:.1%} confidence after {self.report['elapsed']:.1f} seconds")
+        else:
+            logging.warning(f"Budget spent at {confidence:.1%} confidence (target {self.target_confidence:.1%})")
+        for crossover in self.report['crossovers']:
+            logging.info(f"{crossover['faster_above']} overtakes {crossover['faster_below']} between "
+                         f"n={crossover['between'][0]} and n={crossover['between'][1]} "
+                         f"({crossover['confidence']:.1%} confidence)")
+
+        if csv_filename:
+            self._write_results_to_csv(csv_filename)
+            logging.info(f"Results written to CSV: {csv_filename}")
+        if json_filename:
+            self._write_results_to_json(json_filename)
+            logging.info(f"Results written to JSON: {json_filename}")
+        return self.report
+
+    def _write_results_to_csv(self, filename: str) -> None:
+        """
+        Write every sample to a CSV file, one row per sample, preceded by the metadata and report.
+
+        :param filename: Name of the output CSV file.
+        """
+        with open(filename, 'w', newline='') as file:
+            write_metadata_header(file, self.metadata)
+            writer = csv.writer(file)
+            writer.writerow(['strategy', 'n', 'time'])
+            for strategy, cells in self.samples.items():
+                for n in sorted(cells):
+                    for execution_time in cells[n]:
+                        writer.writerow([strategy, n, execution_time])
+
+    def _write_results_to_json(self, filename: str) -> None:
+        """
+        Write the samples, metadata and report to a JSON file.
+
+        Like the other result files, 'times' holds one time per n (the median of its samples); the
+        individual samples are kept under 'samples'.
+
+        :param filename: Name of the output JSON file.
+        """
+        results = {}
+        for strategy, cells in self.samples.items():
+            n_values = sorted(cells)
+            results[strategy] = {
+                'n': n_values,
+                'times': [statistics.median(cells[n]) for n in n_values],
+                'samples': [cells[n] for n in n_values],
+            }
+        with open(filename, 'w') as file:
+            json.dump({'metadata': self.metadata, 'results': results}, file, indent=2)
+
+
+def run_adaptive_benchmark(max_n: int, spread: int, timeout: float, budget: float, strategies: List[Any],
+                           csv_filename: Optional[str], json_filename: Optional[str], **options: Any) -> Dict[str, Any]:
+    """
+    Run a time-budgeted adaptive benchmark.
+
+    :param max_n: Maximum Fibonacci number to calculate.
+    :param spread: Step size between Fibonacci numbers.
+    :param timeout: Maximum execution time for each calculation.
+    :param budget: Total wall-clock time for the run in seconds.
+    :param strategies: List of strategy objects to benchmark.
+    :param csv_filename: Name of the output CSV file.
+    :param json_filename: Name of the output JSON file.
+    :param options: Passed on to AdaptiveBenchmark (target_confidence, tolerance, seed_points, batch_size, disable_gc,
+                    max_schedule_points, use_small_n_table).
+    :return: The report: confidence reached, crossovers and fitted curves.
+    """
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    benchmark = AdaptiveBenchmark(max_n=max_n, spread=spread, timeout=timeout, budget=budget, **options)
+    return benchmark.run(strategies, csv_filename, json_filename)
+
+
+# Example usage (see FibonacciCLI.py for configurable runs):
+if __name__ == "__main__":
+    from src.Strategies.StrategyRegistry import registry
+
+    run_adaptive_benchmark(
+        max_n=100001,
+        spread=100,
+        timeout=10,
+        budget=60,
+        strategies=registry.create_all(['IterativeFibonacci', 'DoublingFibonacci', 'GMPIterativeFibonacci',
+                                        'GMPDoublingFibonacciOptimized']),
+        csv_filename='adaptive.csv',
+        json_filename='adaptive.json'
+    )
@@ -0,0 +1,73 @@
+import csv
+import math
+import statistics
+from collections import defaultdict
+from typing import Any, Dict, List
+
+from BenchmarkEnvironment import incompatibilities, read_metadata, skip_comment_lines
+
+
+def load_times(filename: str) -> Dict[str, Dict[int, List[float]]]:
+    """
+    Load the measured times of a result CSV file.
+
+    :param filename: Path of the CSV file.
+    :return: Measured times per strategy and n.
+    """
+    times: Dict[str, Dict[int, List[float]]] = defaultdict(lambda: defaultdict(list))
+    with open(filename, 'r', newline='') as file:
+        for row in csv.DictReader(skip_comment_lines(file)):
+            times[row['strategy']][int(row['n'])].append(float(row['time']))
+    return times
+
+
+def compare_csv_files(baseline_file: str, candidate_file: str, force: bool = False) -> Dict[str, Dict[str, Any]]:
+    """
+    Compare the timings of two benchmark runs strategy by strategy.
+
+    Only n values measured in both runs are compared. A ratio above 1 means the candidate run is slower.
+
+    :param baseline_file: Path of the baseline CSV file.
+    :param candidate_file: Path of the candidate CSV file.
+    :param force: Compare even if the run metadata is missing or describes incompatible environments.
+    :return: Per strategy, the number of shared points and the median and geometric mean time ratio.
+    """
+    if not force:
+        baseline_metadata, candidate_metadata = read_metadata(baseline_file), read_metadata(candidate_file)
+        if baseline_metadata is None or candidate_metadata is None:
+            raise ValueError("Both files need run metadata to be compared (use force to override).")
+        differences = incompatibilities(baseline_metadata, candidate_metadata)
+        if differences:
+            raise ValueError("Runs come from incompatible environments: " + '; '.join(differences))
+
+    baseline, candidate = load_times(baseline_file), load_times(candidate_file)
+    comparison = {}
+    for strategy in sorted(set(baseline) & set(candidate)):
+        ratios = [
+            statistics.mean(candidate[strategy][n]) / statistics.mean(baseline[strategy][n])
+            for n in sorted(set(baseline[strategy]) & set(candidate[strategy]))
+            if statistics.mean(baseline[strategy][n]) > 0 and statistics.mean(candidate[strategy][n]) > 0
+        ]
+        if not ratios:
+            continue
+        comparison[strategy] = {
+            'points': len(ratios),
+            'median_ratio': statistics.median(ratios),
+            'geometric_mean_ratio': math.exp(sum(math.log(ratio) for ratio in ratios) / len(ratios)),
+        }
+    return comparison
+
+
+def format_comparison(comparison: Dict[str, Dict[str, Any]]) -> str:
+    """
+    Format a comparison as a plain-text table.
+
+    :param comparison: Result of compare_csv_files.
+    :return: The table.
+    """
+    width = max([len('strategy')] + [len(strategy) for strategy in comparison])
+    lines = [f"{'strategy':<{width}}  {'points':>8}  {'median':>8}  {'geomean':>8}"]
+    for strategy, result in comparison.items():
+        lines.append(f"{strategy:<{width}}  {result['points']:>8}  {result['median_ratio']:>7.3f}x  "
+                     f"{result['geometric_mean_ratio']:>7.3f}x")
+    return '\n'.join(lines)
@@ -0,0 +1,259 @@
+import json
+import logging
+import os
+import platform
+import socket
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from src.Strategies.FibonacciStrategy import small_n_table
+
+METADATA_PREFIX = '# metadata: '
+
+# Properties that change timings by more than run-to-run noise; results differing in any of
+# them must not be merged or compared. With the small-n table enabled, small n time a lookup.
+COMPATIBILITY_KEYS = ('cpu_model', 'governor', 'python_implementation', 'python_version', 'gmpy2_version',
+                      'gmp_version', 'small_n_table_limit')
+
+
+def _read_first_line(path: str) -> Optional[str]:
+    """
+    Read the first line of a (sysfs/procfs) file.
+
+    :param path: Path of the file.
+    :return: The stripped first line, or None if the file is not readable.
+    """
+    try:
+        with open(path, 'r') as file:
+            return file.readline().strip()
+    except OSError:
+        return None
+
+
+def _cpu_model() -> str:
+    """
+    Determine the CPU model name.
+
+    :return: CPU model as reported by the operating system.
+    """
+    try:
+        with open('/proc/cpuinfo', 'r') as file:
+            for line in file:
+                if line.startswith('model name'):
+                    return line.split(':', 1)[1].strip()
+    except OSError:
+        pass
+    return platform.processor() or platform.machine()
+
+
+def _cpu_frequency_mhz(cpu: int = 0) -> Dict[str, Optional[float]]:
+    """
+    Read the current and allowed frequency range of a CPU from sysfs.
+
+    :param cpu: Index of the CPU.
+    :return: Dictionary with current, min and max frequency in MHz (None if unavailable).
+    """
+    frequencies = {}
+    for key, name in (('current', 'scaling_cur_freq'), ('min', 'scaling_min_freq'), ('max', 'scaling_max_freq')):
+        value = _read_first_line(f'/sys/devices/system/cpu/cpu{cpu}/cpufreq/{name}')
+        frequencies[key] = int(value) / 1000 if value else None
+    return frequencies
+
+
+def _gmp_versions() -> Dict[str, Optional[str]]:
+    """
+    Determine the gmpy2 and GMP versions without making gmpy2 a hard requirement.
+
+    :return: Dictionary with the gmpy2 and GMP version strings (None if gmpy2 is missing).
+    """
+    try:
+        import gmpy2
+    except ImportError:
+        return {'gmpy2_version': None, 'gmp_version': None}
+    return {'gmpy2_version': gmpy2.version(), 'gmp_version': gmpy2.mp_version()}
+
+
+def current_core() -> Optional[int]:
+    """
+    Return the single core the process is pinned to, if any.
+
+    :return: Core index, or None if the process may run on several cores or affinity is unsupported.
+    """
+    if not hasattr(os, 'sched_getaffinity'):
+        return None
+    cores = os.sched_getaffinity(0)
+    return next(iter(cores)) if len(cores) == 1 else None
+
+
+def capture_environment() -> Dict[str, Any]:
+    """
+    Capture the properties of the machine and interpreter that influence benchmark timings.
+
+    :return: Dictionary of run metadata.
+    """
+    clock = time.get_clock_info('perf_counter')
+    core = current_core()
+    environment = {
+        'timestamp': datetime.now(timezone.utc).isoformat(),
+        'hostname': socket.gethostname(),
+        'platform': platform.platform(),
+        'cpu_model': _cpu_model(),
+        'cpu_count': os.cpu_count(),
+        'pinned_core': core,
+        'governor': _read_first_line(f'/sys/devices/system/cpu/cpu{core or 0}/cpufreq/scaling_governor'),
+        'frequency_mhz': _cpu_frequency_mhz(core or 0),
+        'load_average': list(os.getloadavg()) if hasattr(os, 'getloadavg') else None,
+        'python_implementation': platform.python_implementation(),
+        'python_version': platform.python_version(),
+        'timer': clock.implementation,
+        'timer_resolution': clock.resolution,
+        'small_n_table_limit': small_n_table.limit,
+    }
+    environment.update(_gmp_versions())
+    return environment
+
+
+def isolated_cores() -> List[int]:
+    """
+    List the cores isolated from the scheduler with the ``isolcpus`` kernel parameter.
+
+    :return: Indices of the isolated cores (empty if none or unsupported).
+    """
+    value = _read_first_line('/sys/devices/system/cpu/isolated')
+    cores = []
+    for part in (value or '').split(','):
+        if '-' in part:
+            start, end = part.split('-')
+            cores.extend(range(int(start), int(end) + 1))
+        elif part:
+            cores.append(int(part))
+    return cores
+
+
+def pin_to_core(core: Optional[int] = None) -> int:
+    """
+    Pin the current process (and threads it starts afterwards) to a single core.
+
+    :param core: Core to pin to; defaults to the first isolated core, or the last available core.
+    :return: The core the process was pinned to.
+    """
+    if not hasattr(os, 'sched_setaffinity'):
+        raise OSError("CPU pinning is not supported on this platform.")
+    if core is None:
+        isolated = isolated_cores()
+        core = isolated[0] if isolated else max(os.sched_getaffinity(0))
+    os.sched_setaffinity(0, {core})
+    return core
+
+
+def incompatibilities(first: Dict[str, Any], second: Dict[str, Any]) -> List[str]:
+    """
+    List the compatibility-relevant properties in which two environments differ.
+
+    :param first: Metadata of the first run.
+    :param second: Metadata of the second run.
+    :return: Human-readable descriptions of the differences (empty if compatible).
+    """
+    return [f"{key}: {first.get(key)!r} != {second.get(key)!r}"
+            for key in COMPATIBILITY_KEYS if first.get(key) != second.get(key)]
+
+
+def write_metadata_header(file, metadata: Dict[str, Any]) -> None:
+    """
+    Write run metadata as a single comment line at the top of a CSV file.
+
+    :param file: Open text file positioned at its start.
+    :param metadata: Metadata to embed.
+    """
+    file.write(METADATA_PREFIX + json.dumps(metadata, sort_keys=True) + '\n')
+
+
+def read_metadata(filename: str) -> Optional[Dict[str, Any]]:
+    """
+    Read the metadata embedded in a result file.
+
+    :param filename: Path of a CSV file with a metadata comment line or a JSON result file.
+    :return: The embedded metadata, or None for files written before metadata was recorded.
+    """
+    with open(filename, 'r') as file:
+        if filename.endswith('.json'):
+            content = json.load(file)
+            return content.get('metadata') if isinstance(content, dict) and 'results' in content else None
+        for line in file:
+            if line.startswith(METADATA_PREFIX):
+                return json.loads(line[len(METADATA_PREFIX):])
+            if not line.startswith('#'):
+                return None
+    return None
+
+
+def skip_comment_lines(file):
+    """
+    Yield the lines of a CSV file that are not comment lines, e.g. for ``csv.DictReader``.
+
+    :param file: Open text file.
+    :return: Iterator over the non-comment lines.
+    """
+    return (line for line in file if not line.startswith('#'))
+
+
+class DriftMonitor:
+    """
+    Detects thermal throttling and frequency drift by periodically timing a fixed calibration workload.
+    """
+
+    def __init__(self, tolerance: float = 0.1, repeats: int = 5):
+        """
+        Initialize the DriftMonitor and measure the baseline.
+
+        :param tolerance: Relative slowdown or speedup of the calibration workload that counts as drift.
+        :param repeats: Number of calibration runs per measurement; the fastest one is kept.
+        """
+        self.tolerance = tolerance
+        self.repeats = repeats
+        self.baseline = self._calibrate()
+        self.samples: List[Dict[str, float]] = []
+
+    @staticmethod
+    def _workload() -> int:
+        """A fixed, CPU-bound big-integer workload."""
+        a, b = 0, 1
+        for _ in range(20000):
+            a, b = b, a + b
+        return a
+
+    def _calibrate(self) -> float:
+        """
+        Time the calibration workload.
+
+        :return: Fastest execution time in seconds.
+        """
+        best = float('inf')
+        for _ in range(self.repeats):
+            start_time = time.perf_counter()
+            self._workload()
+            best = min(best, time.perf_counter() - start_time)
+        return best
+
+    def check(self) -> float:
+        """
+        Re-time the calibration workload and record the ratio to the baseline.
+
+        :return: Current time divided by the baseline time (>1 means the machine got slower).
+        """
+        ratio = self._calibrate() / self.baseline
+        self.samples.append({'timestamp': time.time(), 'ratio': ratio})
+        if abs(ratio - 1) > self.tolerance:
+            logging.warning(f"Calibration drift detected: workload takes {ratio:.2f}x its baseline time")
+        return ratio
+
+    @property
+    def drifted(self) -> bool:
+        """Whether any calibration sample exceeded the tolerance."""
+        return any(abs(sample['ratio'] - 1) > self.tolerance for sample in self.samples)
+
+
+if __name__ == "__main__":
+    json.dump(capture_environment(), sys.stdout, indent=2)
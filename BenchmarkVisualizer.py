@@ -1,10 +1,13 @@
-import pandas as pd
-import matplotlib.pyplot as plt
-import numpy as np
-from scipy.interpolate import interp1d
-from typing import Union, Dict, Any
+from typing import TYPE_CHECKING, Union, Dict, Any
+import json
 import logging
 
+# pandas, matplotlib, NumPy and SciPy take seconds to import, so they are only imported by
+# the methods that need them.
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
 class BenchmarkVisualizer:
     """
     A class for visualizing benchmark results from Fibonacci calculations.
@@ -37,7 +40,9 @@ class BenchmarkVisualizer:
 
     def load_data(self):
         """Load and process the benchmark data."""
-        if isinstance(self.data_source, str):
+        if isinstance(self.data_source, str) and self.data_source.endswith('.json'):
+            self._load_from_json()
+        elif isinstance(self.data_source, str):
             self._load_from_csv()
         elif isinstance(self.data_source, dict):
             self._load_from_dict()
@@ -48,18 +53,41 @@ class BenchmarkVisualizer:
 
     def _load_from_csv(self):
         """Load data from a CSV file."""
+        import pandas as pd
+
         try:
-            self.data = pd.read_csv(self.data_source)
+            self.data = pd.read_csv(self.data_source, comment='#')
         except Exception as e:
             self.logger.error(f"Error loading CSV file: {e}")
             raise
 
-    def _load_from_dict(self):
+    def _load_from_json(self):
+        """Load data from a JSON result file written by FibonacciBenchmark."""
+        try:
+            with open(self.data_source, 'r') as file:
+                content = json.load(file)
+        except Exception as e:
+            self.logger.error(f"Error loading JSON file: {e}")
+            raise
+        self._load_from_dict(content)
+
+    def _load_from_dict(self, source: Dict[str, Any] = None):
         """Load data from a result dictionary."""
+        import pandas as pd
+
+        source = self.data_source if source is None else source
+        # Result files embed the run metadata next to the per-strategy results
+        if 'metadata' in source and 'results' in source:
+            results = source['results']
+            spread = (source['metadata'] or {}).get('benchmark', {}).get('spread', 1)
+        else:
+            results, spread = source, 1
         try:
             data_list = []
-            for strategy, result in self.data_source.items():
-                for n, time in enumerate(result['times']):
+            for strategy, result in results.items():
+                # Sparse results (distributed and adaptive runs) list their n values; the others are spread apart
+                n_values = result.get('n') or [index * spread for index in range(len(result['times']))]
+                for n, time in zip(n_values, result['times']):
                     data_list.append({'strategy': strategy, 'n': n, 'time': time})
             self.data = pd.DataFrame(data_list)
         except Exception as e:
@@ -71,6 +99,9 @@ class BenchmarkVisualizer:
         if self.data is None:
             self.load_data()
 
+        import matplotlib.pyplot as plt
+        import numpy as np
+
         plt.style.use('ggplot')
         fig, ax = plt.subplots(figsize=(20, 12), dpi=300)
 
@@ -82,7 +113,7 @@ class BenchmarkVisualizer:
         self._customize_plot(ax)
         self._save_plot(fig)
 
-    def _plot_strategy(self, ax, strategy: str, group: pd.DataFrame, color: np.ndarray):
+    def _plot_strategy(self, ax, strategy: str, group: 'pd.DataFrame', color: 'np.ndarray'):
         """Plot data for a single strategy."""
         group = group.sort_values('n')
         x, y = group['n'].values, group['time'].values
@@ -94,8 +125,11 @@ class BenchmarkVisualizer:
 
         ax.scatter(x, y, s=1, color=color, alpha=0.6, zorder=2)
 
-    def _plot_interpolated(self, ax, x: np.ndarray, y: np.ndarray, strategy: str, color: np.ndarray):
+    def _plot_interpolated(self, ax, x: 'np.ndarray', y: 'np.ndarray', strategy: str, color: 'np.ndarray'):
         """Plot interpolated data for smoother curves."""
+        import numpy as np
+        from scipy.interpolate import interp1d
+
         x_smooth = np.linspace(x.min(), x.max(), 300)
         try:
             interp_func = interp1d(x, y, kind='linear')
@@ -124,6 +158,8 @@ class BenchmarkVisualizer:
 
     def _save_plot(self, fig):
         """Save the plot to a file."""
+        import matplotlib.pyplot as plt
+
         try:
             fig.tight_layout()
             fig.savefig(self.output_file, dpi=300, bbox_inches='tight')
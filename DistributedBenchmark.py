@@ -0,0 +1,552 @@
+import csv
+import json
+import logging
+import os
+import socket
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional, Tuple
+
+from BenchmarkEnvironment import capture_environment, incompatibilities, write_metadata_header
+from src.Strategies.FibonacciStrategy import small_n_table
+
+# Messages are single-line JSON objects terminated by a newline:
+#   worker -> coordinator: {"type": "hello", "worker": ..., "environment": {...}}
+#   coordinator -> worker: {"type": "shard", "shard_id": ..., "strategy": ..., "start": ..., "stop": ...,
+#                           "spread": ..., "timeout": ..., "small_n_table_limit": ...}  or  {"type": "done"}
+#   worker -> coordinator: {"type": "result", "shard_id": ..., "measurements": [[n, time], ...], "complete": ...}
+#                          or {"type": "result", "shard_id": ..., "error": ...} if the shard could not be measured
+
+
+def _send(stream, message: Dict[str, Any]) -> None:
+    """
+    Send a message over a socket file.
+
+    :param stream: Binary file object of the socket.
+    :param message: Message to send.
+    """
+    stream.write(json.dumps(message).encode() + b'\n')
+    stream.flush()
+
+
+def _receive(stream) -> Dict[str, Any]:
+    """
+    Receive a message from a socket file.
+
+    :param stream: Binary file object of the socket.
+    :return: The received message.
+    """
+    line = stream.readline()
+    if not line:
+        raise ConnectionError("Connection closed by peer")
+    return json.loads(line)
+
+
+class BenchmarkCoordinator:
+    """
+    Distributes a benchmark over worker processes on one or more hosts.
+
+    The (strategy, n) grid is cut into shards of consecutive n values that are handed out over
+    plain TCP connections. A shard whose worker disconnects or does not answer within the
+    shard timeout is put back into the queue for another worker. When a strategy times out
+    inside a shard, its shards further up the n range are dropped, matching the sequential
+    benchmark which stops a strategy at its first timeout. A malformed result is treated like a
+    lost worker, and a shard the worker reports an error for is reassigned without losing the
+    worker. A shard that fails `max_attempts` times is dropped. If no worker is connected for
+    `idle_timeout` seconds, the run gives up and keeps the results collected so far.
+    """
+
+    def __init__(self, strategies: List[str], max_n: int, spread: int, timeout: float, shard_size: int = 100,
+                 host: str = '0.0.0.0', port: int = 0, shard_timeout: Optional[float] = None,
+                 idle_timeout: Optional[float] = 300, use_small_n_table: bool = False, max_attempts: int = 3):
+        """
+        Initialize the BenchmarkCoordinator.
+
+        :param strategies: Names of the strategies to benchmark (see the strategy registry).
+        :param max_n: Maximum Fibonacci number to calculate.
+        :param spread: Step size between Fibonacci numbers.
+        :param timeout: Maximum execution time for each calculation.
+        :param shard_size: Number of n values per shard.
+        :param host: Interface to listen on.
+        :param port: Port to listen on; 0 picks a free port.
+        :param shard_timeout: Seconds to wait for a shard result before declaring the worker lost;
+                              defaults to the worst case of every calculation in the shard timing out.
+        :param idle_timeout: Seconds without any connected worker after which the run gives up;
+                             None waits for workers indefinitely.
+        :param use_small_n_table: Have workers serve n below the small-n table limit from the table
+                                  (off by default). The coordinator's current limit is sent with every shard.
+        :param max_attempts: Number of times a shard is handed out before it is dropped as failing.
+        :raises UnknownStrategyError: If a strategy name is not registered.
+        """
+        from src.Strategies.StrategyRegistry import registry
+
+        # Reject unknown names here rather than have every worker fail on them
+        for strategy in strategies:
+            registry.load(strategy)
+        self.strategies = strategies
+        self.max_n = max_n
+        self.spread = spread
+        self.timeout = timeout
+        self.shard_size = shard_size
+        self.shard_timeout = shard_timeout or timeout * shard_size + 60
+        self.idle_timeout = idle_timeout
+        self.max_attempts = max_attempts
+        self.small_n_table_limit = small_n_table.limit if use_small_n_table else 0
+        self.host = host
+        self.port = port
+
+        self.pending = deque(self._make_shards())
+        self.total_shards = len(self.pending)
+        self.in_flight: Dict[int, Dict[str, Any]] = {}
+        self.completed: Dict[int, Dict[str, Any]] = {}
+        self.exhausted: Dict[str, int] = {}
+        self.attempts: Dict[int, int] = {}
+        self.failed: Dict[int, str] = {}
+        self.nodes: Dict[str, Dict[str, Any]] = {}
+        self.results: Dict[str, Dict[int, Tuple[float, str]]] = {strategy: {} for strategy in strategies}
+        self.metadata: Dict[str, Any] = {}
+        self.connected = 0
+        self.gave_up = False
+
+        self._idle_since = time.monotonic()
+        self._condition = threading.Condition()
+        self._server: Optional[socket.socket] = None
+        self._threads: List[threading.Thread] = []
+
+    def _make_shards(self) -> List[Dict[str, Any]]:
+        """
+        Cut the benchmark grid into shards.
+
+        :return: Shard descriptions in the order they are handed out.
+        """
+        shards = []
+        step = self.shard_size * self.spread
+        for strategy in self.strategies:
+            for start in range(0, self.max_n, step):
+                shards.append({'type': 'shard', 'shard_id': len(shards), 'strategy': strategy, 'start': start,
+                               'stop': min(start + step, self.max_n), 'spread': self.spread,
+                               'timeout': self.timeout, 'small_n_table_limit': self.small_n_table_limit})
+        return shards
+
+    def start(self) -> Tuple[str, int]:
+        """
+        Start listening for workers.
+
+        :return: The (host, port) address workers should connect to.
+        """
+        self._server = socket.create_server((self.host, self.port))
+        self._server.settimeout(0.5)
+        self.port = self._server.getsockname()[1]
+        self._idle_since = time.monotonic()
+        accept_thread = threading.Thread(target=self._accept_loop, daemon=True)
+        accept_thread.start()
+        logging.info(f"Coordinator listening on {self.host}:{self.port} with {self.total_shards} shards")
+        return self.host, self.port
+
+    @property
+    def finished(self) -> bool:
+        """Whether every shard is either completed or dropped, or the run gave up waiting for workers."""
+        return self.gave_up or (not self.pending and not self.in_flight)
+
+    def _accept_loop(self) -> None:
+        """Accept worker connections until the benchmark is finished."""
+        while not self.finished:
+            try:
+                connection, address = self._server.accept()
+            except socket.timeout:
+                continue
+            except OSError:
+                break
+            thread = threading.Thread(target=self._serve_worker, args=(connection, address), daemon=True)
+            self._threads.append(thread)
+            thread.start()
+
+    def _next_shard(self) -> Optional[Dict[str, Any]]:
+        """
+        Take the next shard, waiting while shards are in flight that might still be requeued.
+
+        :return: The shard, or None once the benchmark is finished.
+        """
+        with self._condition:
+            while True:
+                while self.pending:
+                    shard = self.pending.popleft()
+                    limit = self.exhausted.get(shard['strategy'])
+                    if limit is not None and shard['start'] > limit:
+                        continue
+                    self.in_flight[shard['shard_id']] = shard
+                    return shard
+                if self.finished:
+                    # Wake up the other workers' handlers so they can send their 'done' too
+                    self._condition.notify_all()
+                    return None
+                self._condition.wait()
+
+    def _requeue(self, shard: Dict[str, Any], worker: str, reason: str) -> None:
+        """
+        Put a failed shard back at the front of the queue, or drop it once it failed max_attempts times.
+
+        :param shard: Shard to requeue.
+        :param worker: Identifier of the worker the shard failed on.
+        :param reason: Why the shard failed.
+        """
+        with self._condition:
+            self.in_flight.pop(shard['shard_id'], None)
+            attempts = self.attempts.get(shard['shard_id'], 0) + 1
+            self.attempts[shard['shard_id']] = attempts
+            if attempts >= self.max_attempts:
+                self.failed[shard['shard_id']] = reason
+            else:
+                self.pending.appendleft(shard)
+            self._condition.notify_all()
+        if attempts >= self.max_attempts:
+            logging.error(f"Shard {shard['shard_id']} ({shard['strategy']} n={shard['start']}..{shard['stop']}) "
+                          f"failed {attempts} times, last on {worker} ({reason}); dropping it")
+        else:
+            logging.warning(f"Shard {shard['shard_id']} failed on {worker} ({reason}); reassigning it")
+
+    def _record(self, shard: Dict[str, Any], result: Dict[str, Any], worker: str) -> None:
+        """
+        Store the measurements of a finished shard.
+
+        :param shard: The shard that was measured.
+        :param result: The worker's result message.
+        :param worker: Identifier of the worker that measured it.
+        """
+        # Validate the whole message before storing anything, so a malformed result leaves no trace
+        measurements = [(int(n), float(execution_time)) for n, execution_time in result['measurements']]
+        complete = result['complete']
+        if not isinstance(complete, bool):
+            raise ValueError(f"'complete' must be a boolean, not {complete!r}")
+
+        with self._condition:
+            self.in_flight.pop(shard['shard_id'], None)
+            self.completed[shard['shard_id']] = result
+            for n, execution_time in measurements:
+                self.results[shard['strategy']][n] = (execution_time, worker)
+            if not complete:
+                measured = [n for n, _ in measurements]
+                last_n = max(measured) if measured else shard['start'] - self.spread
+                previous = self.exhausted.get(shard['strategy'])
+                self.exhausted[shard['strategy']] = last_n if previous is None else min(previous, last_n)
+                logging.warning(f"{shard['strategy']} timed out after n={last_n}; dropping its larger shards")
+            done = len(self.completed)
+            self._condition.notify_all()
+        logging.info(f"Shard {shard['shard_id']} ({shard['strategy']} n={shard['start']}..{shard['stop']}) "
+                     f"done by {worker} [{done}/{self.total_shards}]")
+
+    def _serve_worker(self, connection: socket.socket, address: Tuple[str, int]) -> None:
+        """
+        Feed one worker with shards until the benchmark is finished or the worker is lost.
+
+        :param connection: Socket of the worker.
+        :param address: Address of the worker.
+        """
+        worker = f"{address[0]}:{address[1]}"
+        with connection, connection.makefile('rwb') as stream:
+            try:
+                connection.settimeout(self.shard_timeout)
+                hello = _receive(stream)
+                worker = hello.get('worker', worker)
+                with self._condition:
+                    self.nodes[worker] = hello.get('environment', {})
+                    self.connected += 1
+                logging.info(f"Worker {worker} connected")
+            except (OSError, ValueError, AttributeError) as e:
+                logging.warning(f"Worker at {worker} failed to introduce itself: {e}")
+                return
+
+            try:
+                self._feed_worker(stream, worker)
+            finally:
+                with self._condition:
+                    self.connected -= 1
+                    if not self.connected:
+                        self._idle_since = time.monotonic()
+                    self._condition.notify_all()
+
+    def _feed_worker(self, stream, worker: str) -> None:
+        """
+        Hand shards to a connected worker until the benchmark is finished or the worker is lost.
+
+        :param stream: Binary file object of the worker's socket.
+        :param worker: Identifier of the worker.
+        """
+        while True:
+            shard = self._next_shard()
+            if shard is None:
+                try:
+                    _send(stream, {'type': 'done'})
+                except OSError:
+                    pass
+                return
+            try:
+                _send(stream, shard)
+                result = _receive(stream)
+                if not isinstance(result, dict) or result.get('type') != 'result' \
+                        or result.get('shard_id') != shard['shard_id']:
+                    raise ValueError(f"unexpected message {str(result)[:100]}")
+            except (OSError, ValueError) as e:
+                self._requeue(shard, worker, f"lost worker: {str(e) or type(e).__name__}")
+                return
+            if 'error' in result:
+                # The worker is fine, but could not measure this shard
+                self._requeue(shard, worker, f"worker error: {result['error']}")
+                continue
+            try:
+                self._record(shard, result, worker)
+            except (KeyError, TypeError, ValueError) as e:
+                self._requeue(shard, worker, f"malformed result: {e!r}")
+                return
+
+    def wait(self, poll_interval: float = 1.0) -> bool:
+        """
+        Block until every shard is completed or dropped, or no worker has been connected for idle_timeout seconds.
+
+        :param poll_interval: Seconds between checks.
+        :return: Whether every shard was completed or dropped.
+        """
+        with self._condition:
+            while not self.finished:
+                if (self.idle_timeout is not None and not self.connected
+                        and time.monotonic() - self._idle_since > self.idle_timeout):
+                    self.gave_up = True
+                    logging.error(f"No worker connected for {self.idle_timeout:g} seconds; giving up with "
+                                  f"{len(self.pending) + len(self.in_flight)} shards left")
+                    self._condition.notify_all()
+                    break
+                self._condition.wait(poll_interval)
+        for thread in self._threads:
+            thread.join(timeout=5)
+        if self._server is not None:
+            self._server.close()
+        return not self.gave_up
+
+    def _build_metadata(self) -> None:
+        """Tag the merged results with the environment of every node that contributed."""
+        nodes = dict(self.nodes)
+        reference = next(iter(nodes.values()), capture_environment())
+        for worker, environment in nodes.items():
+            differences = incompatibilities(reference, environment)
+            if differences:
+                logging.warning(f"Worker {worker} runs in a different environment: {'; '.join(differences)}")
+        self.metadata = dict(reference)
+        # Workers report their environment before the first shard sets their table limit
+        self.metadata['small_n_table_limit'] = self.small_n_table_limit
+        self.metadata['nodes'] = nodes
+        self.metadata['coordinator'] = capture_environment()
+        self.metadata['benchmark'] = {
+            'max_n': self.max_n,
+            'spread': self.spread,
+            'timeout': self.timeout,
+            'strategies': self.strategies,
+            'shard_size': self.shard_size,
+            'distributed': True,
+            'complete': not self.gave_up and not self.failed,
+            'failed_shards': sorted(self.failed),
+        }
+
+    def _write_results_to_csv(self, filename: str) -> None:
+        """
+        Write the merged results to a CSV file with a node column.
+
+        :param filename: Name of the output CSV file.
+        """
+        with open(filename, 'w', newline='') as file:
+            write_metadata_header(file, self.metadata)
+            writer = csv.writer(file)
+            writer.writerow(['strategy', 'n', 'time', 'node'])
+            for strategy, by_n in self.results.items():
+                for n in sorted(by_n):
+                    execution_time, node = by_n[n]
+                    writer.writerow([strategy, n, execution_time, node])
+
+    def _write_results_to_json(self, filename: str) -> None:
+        """
+        Write the merged results and metadata to a JSON file.
+
+        :param filename: Name of the output JSON file.
+        """
+        results = {}
+        for strategy, by_n in self.results.items():
+            times = [by_n[n][0] for n in sorted(by_n)]
+            results[strategy] = {
+                'n': sorted(by_n),
+                'times': times,
+                'nodes': [by_n[n][1] for n in sorted(by_n)],
+                'average': sum(times) / len(times) if times else None,
+                'min': min(times) if times else None,
+                'max': max(times) if times else None,
+            }
+        with open(filename, 'w') as file:
+            json.dump({'metadata': self.metadata, 'results': results}, file, indent=2)
+
+    def run(self, csv_filename: Optional[str], json_filename: Optional[str]) -> Dict[str, Dict[int, Tuple[float, str]]]:
+        """
+        Serve the benchmark to workers until it is finished and save the merged results.
+
+        :param csv_filename: Name of the output CSV file.
+        :param json_filename: Name of the output JSON file.
+        :return: Measured time and node per strategy and n.
+        """
+        if self._server is None:
+            self.start()
+        if not self.wait() or self.failed:
+            logging.warning("Saving the incomplete results collected so far")
+        self._build_metadata()
+
+        if csv_filename:
+            self._write_results_to_csv(csv_filename)
+            logging.info(f"Results written to CSV: {csv_filename}")
+        if json_filename:
+            self._write_results_to_json(json_filename)
+            logging.info(f"Results written to JSON: {json_filename}")
+
+        logging.info("Distributed benchmark completed.")
+        return self.results
+
+
+class BenchmarkWorker:
+    """
+    Connects to a BenchmarkCoordinator and measures the shards it is given.
+    """
+
+    def __init__(self, host: str, port: int, connect_timeout: float = 30):
+        """
+        Initialize the BenchmarkWorker.
+
+        :param host: Host of the coordinator.
+        :param port: Port of the coordinator.
+        :param connect_timeout: Seconds to keep retrying the initial connection.
+        """
+        self.host = host
+        self.port = port
+        self.connect_timeout = connect_timeout
+        self.name = f"{socket.gethostname()}:{os.getpid()}"
+        self._strategies: Dict[str, Any] = {}
+
+    def _connect(self) -> socket.socket:
+        """
+        Connect to the coordinator, retrying while it is starting up.
+
+        :return: The connected socket.
+        """
+        deadline = time.monotonic() + self.connect_timeout
+        while True:
+            try:
+                return socket.create_connection((self.host, self.port))
+            except OSError:
+                if time.monotonic() > deadline:
+                    raise
+                time.sleep(0.2)
+
+    def _strategy(self, name: str) -> Any:
+        """
+        Instantiate a strategy once per worker.
+
+        :param name: Name of the strategy.
+        :return: The strategy object.
+        """
+        if name not in self._strategies:
+            from src.Strategies.StrategyRegistry import registry
+
+            self._strategies[name] = registry.create(name)
+        return self._strategies[name]
+
+    def run(self) -> int:
+        """
+        Measure shards until the coordinator reports that the benchmark is finished.
+
+        :return: Number of shards measured.
+        """
+        from FibonacciBenchmark import FibonacciBenchmark
+
+        measured = 0
+        with self._connect() as connection, connection.makefile('rwb') as stream:
+            _send(stream, {'type': 'hello', 'worker': self.name, 'environment': capture_environment()})
+            logging.info(f"Worker {self.name} connected to {self.host}:{self.port}")
+            while True:
+                message = _receive(stream)
+                if message['type'] == 'done':
+                    break
+                benchmark = FibonacciBenchmark(max_n=message['stop'], spread=message['spread'],
+                                               timeout=message['timeout'])
+                try:
+                    strategy = self._strategy(message['strategy'])
+                    small_n_table.configure(message['small_n_table_limit'])
+                    measurements, complete = benchmark.measure_range(strategy.execute, message['start'],
+                                                                     message['stop'])
+                except Exception as e:
+                    # Report the failure and stay available for other shards
+                    logging.exception(f"Shard {message['shard_id']} failed")
+                    _send(stream, {'type': 'result', 'shard_id': message['shard_id'],
+                                   'error': f"{type(e).__name__}: {e}"})
+                    continue
+                _send(stream, {'type': 'result', 'shard_id': message['shard_id'],
+                               'measurements': measurements, 'complete': complete})
+                measured += 1
+        logging.info(f"Worker {self.name} finished after {measured} shards")
+        return measured
+
+
+def run_worker(host: str, port: int) -> int:
+    """
+    Run a benchmark worker, e.g. as the target of a local worker process.
+
+    :param host: Host of the coordinator.
+    :param port: Port of the coordinator.
+    :return: Number of shards measured.
+    """
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    return BenchmarkWorker(host, port).run()
+
+
+def run_distributed_benchmark(strategies: List[str], max_n: int, spread: int, timeout: float,
+                              csv_filename: Optional[str], json_filename: Optional[str], shard_size: int = 100,
+                              host: str = '0.0.0.0', port: int = 0, local_workers: int = 0,
+                              shard_timeout: Optional[float] = None,
+                              idle_timeout: Optional[float] = 300,
+                              use_small_n_table: bool = False,
+                              max_attempts: int = 3) -> Dict[str, Dict[int, Tuple[float, str]]]:
+    """
+    Run a distributed benchmark, optionally starting worker processes on this machine.
+
+    Remote workers join with ``python FibonacciCLI.py worker --host <coordinator> --port <port>``.
+
+    :param strategies: Names of the strategies to benchmark.
+    :param max_n: Maximum Fibonacci number to calculate.
+    :param spread: Step size between Fibonacci numbers.
+    :param timeout: Maximum execution time for each calculation.
+    :param csv_filename: Name of the output CSV file.
+    :param json_filename: Name of the output JSON file.
+    :param shard_size: Number of n values per shard.
+    :param host: Interface to listen on.
+    :param port: Port to listen on; 0 picks a free port.
+    :param local_workers: Number of worker processes to start on this machine.
+    :param shard_timeout: Seconds to wait for a shard result before declaring the worker lost.
+    :param idle_timeout: Seconds without any connected worker after which the run gives up.
+    :param use_small_n_table: Have workers serve n below the small-n table limit from the table.
+    :param max_attempts: Number of times a shard is handed out before it is dropped as failing.
+    :return: Measured time and node per strategy and n.
+    """
+    import multiprocessing
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    coordinator = BenchmarkCoordinator(strategies, max_n, spread, timeout, shard_size=shard_size, host=host,
+                                       port=port, shard_timeout=shard_timeout, idle_timeout=idle_timeout,
+                                       use_small_n_table=use_small_n_table, max_attempts=max_attempts)
+    _, bound_port = coordinator.start()
+    connect_host = '127.0.0.1' if host in ('0.0.0.0', '') else host
+    workers = [multiprocessing.Process(target=run_worker, args=(connect_host, bound_port))
+               for _ in range(local_workers)]
+    for worker in workers:
+        worker.start()
+    try:
+        return coordinator.run(csv_filename, json_filename)
+    finally:
+        for worker in workers:
+            worker.join(timeout=10)
+            if worker.is_alive():
+                worker.terminate()
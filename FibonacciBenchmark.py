@@ -1,21 +1,20 @@
 import csv
+import gc
 import json
 import logging
+import multiprocessing
+import os
+import random
+import sys
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, TimeoutError
-from typing import List, Callable, Dict, Any
+from typing import TYPE_CHECKING, List, Callable, Dict, Any, Optional, Tuple, Union
 
-from tqdm import tqdm
+from BenchmarkEnvironment import DriftMonitor, capture_environment, pin_to_core, write_metadata_header
+from src.Strategies.FibonacciStrategy import small_n_table
 
-from src.Strategies.GMP.GMPDoublingFibonacci import GMPDoublingFibonacci
-from src.Strategies.GMP.GMPImprovedMatrixFibonnaci import GMPImprovedMatrixFibonnaci
-from src.Strategies.GMP.GMPIterativeFibonacci import GMPIterativeFibonacci
-from src.Strategies.GMP.GMPMatrixFibonacci import GMPMatrixFibonacci
-from src.Strategies.Primitive.DoublingFibonacci import DoublingFibonacci
-from src.Strategies.Primitive.ImprovedMatrixFibonnaci import ImprovedMatrixFibonnaci
-from src.Strategies.Primitive.IterativeFibonacci import IterativeFibonacci
-from src.Strategies.Primitive.MatrixFibonacci import MatrixFibonacci
-from src.Strategies.Primitive.RecursiveFibonacci import RecursiveFibonacci
+if TYPE_CHECKING:
+    from tqdm import tqdm
 
 
 class FibonacciBenchmark:
@@ -23,103 +22,310 @@ class FibonacciBenchmark:
     A class for benchmarking Fibonacci calculation strategies.
     """
 
-    def __init__(self, max_n: int, spread: int, timeout: float):
+    def __init__(self, max_n: int, spread: int, timeout: float, disable_gc: bool = False,
+                 pin_core: Union[bool, int, None] = None, interleave: bool = False, seed: Optional[int] = None,
+                 calibration_interval: int = 0, drift_tolerance: float = 0.1, use_small_n_table: bool = False):
         """
         Initialize the FibonacciBenchmark.
 
         :param max_n: Maximum Fibonacci number to calculate.
         :param spread: Step size between Fibonacci numbers.
         :param timeout: Maximum execution time for each calculation.
+        :param disable_gc: Disable the garbage collector during timed regions.
+        :param pin_core: Pin the benchmark to a single core; True picks an isolated core if available.
+        :param interleave: For every n, run the strategies in a randomized order instead of finishing
+                           one strategy before starting the next, so slow drifts affect all strategies alike.
+        :param seed: Seed for the interleaving order.
+        :param calibration_interval: Re-time a fixed calibration workload every this many measurements
+                                     to detect thermal or frequency drift (0 disables calibration).
+        :param drift_tolerance: Relative change of the calibration time that is reported as drift.
+        :param use_small_n_table: Serve n below the small-n table limit from the table. Off by default,
+                                  so small n time the arithmetic rather than a lookup.
         """
         self.max_n = max_n
         self.spread = spread
         self.timeout = timeout
+        self.disable_gc = disable_gc
+        self.pin_core = pin_core
+        self.interleave = interleave
+        self.seed = seed
+        self.calibration_interval = calibration_interval
+        self.drift_tolerance = drift_tolerance
+        self.use_small_n_table = use_small_n_table
         self.results: Dict[str, Dict[str, Any]] = {}
+        self.metadata: Dict[str, Any] = {}
+        self._drift_monitor: Optional[DriftMonitor] = None
+        self._measurements = 0
+        self._stream_file = None
+        self._stream_writer = None
 
     def _timed_execution(self, func: Callable[[int], Any], n: int) -> float:
         """
         Execute the function with a timeout and return the execution time.
 
+        The calculation runs in a daemon thread. Threads cannot be stopped, so on a timeout it is
+        abandoned: unlike a thread pool, neither this call nor interpreter exit waits for it.
+
         :param func: Function to execute.
         :param n: Input parameter for the function.
         :return: Execution time in seconds.
+        :raises TimeoutError: If the calculation did not finish within the timeout.
         """
-        with ThreadPoolExecutor(max_workers=1) as executor:
-            future = executor.submit(self._measure_time, func, n)
+        outcome: Dict[str, Any] = {}
+
+        def measure() -> None:
             try:
-                return future.result(timeout=self.timeout)
-            except TimeoutError:
-                raise
+                outcome['time'] = self._measure_time(func, n, self.disable_gc)
+            except BaseException as e:
+                outcome['error'] = e
+
+        thread = threading.Thread(target=measure, name=f"measure-n{n}", daemon=True)
+        thread.start()
+        thread.join(self.timeout)
+        if thread.is_alive():
+            raise TimeoutError(f"n={n} took longer than {self.timeout:g} seconds")
+        if 'error' in outcome:
+            raise outcome['error']
+        return outcome['time']
 
     @staticmethod
-    def _measure_time(func: Callable[[int], Any], n: int) -> float:
+    def _measure_time(func: Callable[[int], Any], n: int, disable_gc: bool = False) -> float:
         """
         Measure the execution time of a function.
 
         :param func: Function to measure.
         :param n: Input parameter for the function.
+        :param disable_gc: Keep the garbage collector from running inside the timed region.
         :return: Execution time in seconds.
         """
-        start_time = time.perf_counter()
-        func(n)
-        end_time = time.perf_counter()
+        gc_was_enabled = gc.isenabled()
+        if disable_gc:
+            gc.collect()
+            gc.disable()
+        try:
+            start_time = time.perf_counter()
+            func(n)
+            end_time = time.perf_counter()
+        finally:
+            if disable_gc and gc_was_enabled:
+                gc.enable()
         return end_time - start_time
 
-    def _time_function(self, func: Callable[[int], Any], overall_pbar: tqdm) -> Dict[str, Any]:
+    def _time_point(self, func: Callable[[int], Any], n: int) -> Optional[float]:
+        """
+        Time a single calculation, running a drift calibration when one is due.
+
+        :param func: Function to time.
+        :param n: Input parameter for the function.
+        :return: Execution time in seconds, or None if the calculation timed out or hit the recursion limit.
+        """
+        try:
+            execution_time = self._timed_execution(func, n)
+        except TimeoutError:
+            logging.warning(f"Execution timed out for n={n}")
+            return None
+        except RecursionError:
+            logging.warning(f"Recursion error for n={n}")
+            return None
+
+        self._measurements += 1
+        if self._drift_monitor and self._measurements % self.calibration_interval == 0:
+            self._drift_monitor.check()
+        return execution_time
+
+    def measure_range(self, func: Callable[[int], Any], start: int, stop: int) -> Tuple[List[Tuple[int, float]], bool]:
+        """
+        Time a function for n = start, start + spread, ... below stop, stopping at the first timeout.
+
+        :param func: Function to time.
+        :param start: First input size.
+        :param stop: Exclusive upper bound of the input sizes.
+        :return: The measured (n, time) pairs and whether the whole range was measured.
+        """
+        measurements = []
+        for n in range(start, stop, self.spread):
+            execution_time = self._time_point(func, n)
+            if execution_time is None:
+                return measurements, False
+            measurements.append((n, execution_time))
+        return measurements, True
+
+    @staticmethod
+    def _summarize(times: List[float]) -> Dict[str, Any]:
+        """
+        Summarize the execution times of a strategy.
+
+        :param times: Execution times in order of n.
+        :return: Dictionary containing timing results.
+        """
+        return {
+            'times': times,
+            'average': sum(times) / len(times) if times else None,
+            'min': min(times) if times else None,
+            'max': max(times) if times else None
+        }
+
+    def _time_function(self, func: Callable[[int], Any], overall_pbar: 'tqdm',
+                       strategy_name: Optional[str] = None) -> Dict[str, Any]:
         """
         Time the execution of a function for various input sizes.
 
         :param func: Function to time.
         :param overall_pbar: Progress bar for overall execution.
+        :param strategy_name: Name under which measurements are streamed to the CSV file.
         :return: Dictionary containing timing results.
         """
         times = []
         n = 0
 
         while n < self.max_n:
-            try:
-                execution_time = self._timed_execution(func, n)
-                times.append(execution_time)
-            except TimeoutError:
-                logging.warning(f"Execution timed out for n={n}")
-                overall_pbar.update((self.max_n // self.spread + 1) - (n // self.spread))
-                break
-            except RecursionError:
-                logging.warning(f"Recursion error for n={n}")
+            execution_time = self._time_point(func, n)
+            if execution_time is None:
                 overall_pbar.update((self.max_n // self.spread + 1) - (n // self.spread))
                 break
+            times.append(execution_time)
+            self._stream_row(strategy_name, n, execution_time)
 
             n += self.spread
             overall_pbar.update(1)
 
-        return {
-            'times': times,
-            'average': sum(times) / len(times) if times else None,
-            'min': min(times) if times else None,
-            'max': max(times) if times else None
-        }
+        return self._summarize(times)
+
+    def _time_interleaved(self, strategies: List[Any], overall_pbar: 'tqdm') -> None:
+        """
+        Time all strategies for every n, visiting the strategies in a fresh random order at each n.
+
+        :param strategies: List of strategy objects to benchmark.
+        :param overall_pbar: Progress bar for overall execution.
+        """
+        rng = random.Random(self.seed)
+        times: Dict[str, List[float]] = {strategy.__class__.__name__: [] for strategy in strategies}
+        active = list(strategies)
+        n = 0
+
+        while n < self.max_n and active:
+            order = active[:]
+            rng.shuffle(order)
+            for strategy in order:
+                strategy_name = strategy.__class__.__name__
+                execution_time = self._time_point(strategy.execute, n)
+                if execution_time is None:
+                    logging.warning(f"Dropping {strategy_name} from the remaining n")
+                    active.remove(strategy)
+                    overall_pbar.update((self.max_n // self.spread + 1) - (n // self.spread))
+                    continue
+                times[strategy_name].append(execution_time)
+                self._stream_row(strategy_name, n, execution_time)
+                overall_pbar.update(1)
+            n += self.spread
+
+        for strategy_name, strategy_times in times.items():
+            self.results[strategy_name] = self._summarize(strategy_times)
 
     def _write_results_to_json(self, filename: str) -> None:
         """
-        Write benchmark results to a JSON file.
+        Write benchmark results and run metadata to a JSON file.
 
         :param filename: Name of the output JSON file.
         """
         with open(filename, 'w') as file:
-            json.dump(self.results, file, indent=2)
+            json.dump({'metadata': self.metadata, 'results': self.results}, file, indent=2)
 
     def _write_results_to_csv(self, filename: str) -> None:
         """
-        Write benchmark results to a CSV file.
+        Write benchmark results to a CSV file, preceded by a metadata comment line.
+
+        The file is written under a temporary name and then moved into place, so a reader
+        tailing the streamed file sees it replaced at once rather than truncated.
 
         :param filename: Name of the output CSV file.
         """
-        with open(filename, 'w', newline='') as file:
+        temporary_filename = f"{filename}.tmp"
+        with open(temporary_filename, 'w', newline='') as file:
+            write_metadata_header(file, self.metadata)
             writer = csv.writer(file)
             writer.writerow(['strategy', 'n', 'time'])
             for strategy, result in self.results.items():
                 for n, time in enumerate(result['times']):
                     writer.writerow([strategy, n * self.spread, time])
+        os.replace(temporary_filename, filename)
+
+    def _open_stream(self, filename: str) -> None:
+        """
+        Start the CSV file so that measurements can be appended while the benchmark runs.
+
+        The streamed file uses the same format as the final one, so it can be tailed (see
+        LiveDashboard) or loaded if the run is interrupted. Rows are in measurement order;
+        the final file written after the run replaces it.
+
+        :param filename: Name of the output CSV file.
+        """
+        self._stream_file = open(filename, 'w', newline='')
+        write_metadata_header(self._stream_file, self.metadata)
+        self._stream_writer = csv.writer(self._stream_file)
+        self._stream_writer.writerow(['strategy', 'n', 'time'])
+        self._stream_file.flush()
+
+    def _stream_row(self, strategy_name: Optional[str], n: int, execution_time: float) -> None:
+        """
+        Append a single measurement to the streamed CSV file, if one is open.
+
+        :param strategy_name: Name of the measured strategy.
+        :param n: Input size.
+        :param execution_time: Measured time in seconds.
+        """
+        if self._stream_writer is None or strategy_name is None:
+            return
+        self._stream_writer.writerow([strategy_name, n, execution_time])
+        self._stream_file.flush()
+
+    def _close_stream(self) -> None:
+        """Close the streamed CSV file."""
+        if self._stream_file is not None:
+            self._stream_file.close()
+        self._stream_file = None
+        self._stream_writer = None
+
+    @property
+    def table_limit(self) -> int:
+        """Limit of the small-n table during the runs: its current limit if enabled, otherwise 0."""
+        return small_n_table.limit if self.use_small_n_table else 0
+
+    def _prepare_environment(self, strategies: List[Any]) -> None:
+        """
+        Apply the noise controls and capture the run metadata before timing starts.
+
+        :param strategies: List of strategy objects to benchmark.
+        """
+        if self.pin_core is not None and self.pin_core is not False:
+            core = pin_to_core(None if self.pin_core is True else self.pin_core)
+            logging.info(f"Pinned benchmark to core {core}")
+        if self.calibration_interval:
+            self._drift_monitor = DriftMonitor(tolerance=self.drift_tolerance)
+
+        self.metadata = capture_environment()
+        self.metadata['benchmark'] = {
+            'max_n': self.max_n,
+            'spread': self.spread,
+            'timeout': self.timeout,
+            'strategies': [strategy.__class__.__name__ for strategy in strategies],
+            'disable_gc': self.disable_gc,
+            'interleave': self.interleave,
+            'seed': self.seed,
+            'calibration_interval': self.calibration_interval,
+        }
+
+    def _finalize_environment(self) -> None:
+        """Record the end-of-run state and the calibration history in the run metadata."""
+        self.metadata['load_average_end'] = list(os.getloadavg()) if hasattr(os, 'getloadavg') else None
+        if self._drift_monitor:
+            self.metadata['calibration'] = {
+                'baseline': self._drift_monitor.baseline,
+                'samples': self._drift_monitor.samples,
+                'drift_detected': self._drift_monitor.drifted,
+            }
+            if self._drift_monitor.drifted:
+                logging.warning("Machine speed drifted during the run; timings may not be comparable.")
 
     def run_benchmark(self, strategies: List[Any], csv_filename: str, json_filename: str) -> None:
         """
@@ -129,31 +335,154 @@ class FibonacciBenchmark:
         :param csv_filename: Name of the output CSV file.
         :param json_filename: Name of the output JSON file.
         """
+        # Imported here so that importing this module (e.g. in worker processes) stays cheap
+        from tqdm import tqdm
+
         logging.info("Starting benchmark...")
-        total_iterations = len(strategies) * (self.max_n // self.spread + 1)
+        with small_n_table.override(self.table_limit):
+            self._prepare_environment(strategies)
+            total_iterations = len(strategies) * (self.max_n // self.spread + 1)
+            if csv_filename:
+                self._open_stream(csv_filename)
 
-        with tqdm(total=total_iterations, desc="Overall Progress", position=0) as overall_pbar:
-            for strategy in strategies:
-                strategy_name = strategy.__class__.__name__
-                logging.info(f"Benchmarking {strategy_name}...")
+            try:
+                with tqdm(total=total_iterations, desc="Overall Progress", position=0) as overall_pbar:
+                    if self.interleave:
+                        self._time_interleaved(strategies, overall_pbar)
+                    else:
+                        for strategy in strategies:
+                            strategy_name = strategy.__class__.__name__
+                            logging.info(f"Benchmarking {strategy_name}...")
+
+                            result = self._time_function(strategy.execute, overall_pbar, strategy_name)
+                            self.results[strategy_name] = result
+
+                    for strategy_name, result in self.results.items():
+                        if result['average'] is not None:
+                            logging.info(f"{strategy_name} average time: {result['average']:.6f} seconds")
+            finally:
+                self._close_stream()
+
+            self._finalize_environment()
+
+            if csv_filename:
+                self._write_results_to_csv(csv_filename)
+                logging.info(f"Results written to CSV: {csv_filename}")
+            if json_filename:
+                self._write_results_to_json(json_filename)
+                logging.info(f"Results written to JSON: {json_filename}")
 
-                result = self._time_function(strategy.execute, overall_pbar)
-                self.results[strategy_name] = result
+        logging.info("Benchmark completed.")
 
-                logging.info(f"{strategy_name} average time: {result['average']:.6f} seconds")
+    @staticmethod
+    def _measure_peak_memory(strategy: Any, n: int, table_limit: int) -> int:
+        """
+        Measure how far a single calculation raises the peak resident set size of the process.
+
+        Meant to run in a fresh child process so earlier calculations do not mask the peak.
+        GMP allocates outside of Python's allocator, so the operating system's high-water mark
+        is used rather than tracemalloc.
+
+        :param strategy: Strategy object to measure.
+        :param n: Input parameter for the strategy.
+        :param table_limit: Limit of the small-n table; a spawned child starts with the default.
+        :return: Increase of the peak resident set size in bytes.
+        """
+        import resource
+
+        small_n_table.configure(table_limit)
+
+        # ru_maxrss is reported in kilobytes on Linux and in bytes on macOS
+        unit = 1 if sys.platform == 'darwin' else 1024
+        baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        strategy.execute(n)
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return (peak - baseline) * unit
+
+    def run_memory_benchmark(self, strategies: List[Any], n_values: List[int], csv_filename: str) -> Dict[str, Dict[int, int]]:
+        """
+        Measure the peak memory of each strategy for the given inputs, one fresh process per calculation.
+
+        :param strategies: List of strategy objects to measure.
+        :param n_values: Input sizes to measure.
+        :param csv_filename: Name of the output CSV file.
+        :return: Peak memory increase in bytes per strategy and n.
+        """
+        logging.info("Starting memory benchmark...")
+        peaks: Dict[str, Dict[int, int]] = {}
+        context = multiprocessing.get_context('spawn')
+
+        for strategy in strategies:
+            strategy_name = strategy.__class__.__name__
+            peaks[strategy_name] = {}
+            for n in n_values:
+                # A fresh pool per measurement; leaving the block terminates a worker that is still busy
+                with context.Pool(processes=1) as pool:
+                    result = pool.apply_async(self._measure_peak_memory, (strategy, n, self.table_limit))
+                    try:
+                        peaks[strategy_name][n] = result.get(timeout=self.timeout)
+                    except multiprocessing.TimeoutError:
+                        logging.warning(f"Memory measurement timed out for {strategy_name} at n={n}")
+                        break
+                    except RecursionError:
+                        logging.warning(f"Recursion error in memory measurement for {strategy_name} at n={n}")
+                        break
+                logging.info(f"{strategy_name} peak memory at n={n}: {peaks[strategy_name][n] / 2 ** 20:.1f} MiB")
 
         if csv_filename:
-            self._write_results_to_csv(csv_filename)
-            logging.info(f"Results written to CSV: {csv_filename}")
-        if json_filename:
-            self._write_results_to_json(json_filename)
-            logging.info(f"Results written to JSON: {json_filename}")
+            with open(csv_filename, 'w', newline='') as file:
+                writer = csv.writer(file)
+                writer.writerow(['strategy', 'n', 'peak_bytes'])
+                for strategy_name, by_n in peaks.items():
+                    for n, peak in by_n.items():
+                        writer.writerow([strategy_name, n, peak])
+            logging.info(f"Memory results written to CSV: {csv_filename}")
+
+        logging.info("Memory benchmark completed.")
+        return peaks
+
+    def run_scaling_benchmark(self, strategy_factory: Callable[[int], Any], n: int, max_workers: int,
+                              csv_filename: str, repeats: int = 3) -> Dict[int, float]:
+        """
+        Measure how a parallel strategy scales with the number of worker processes for a single n.
 
-        logging.info("Benchmark completed.")
+        :param strategy_factory: Callable creating the strategy for a given worker count,
+                                 e.g. ``lambda workers: GMPParallelDoublingFibonacci(workers=workers)``.
+        :param n: Input parameter for the strategy.
+        :param max_workers: Largest worker count to measure; counts 0 (serial) to max_workers are run.
+        :param csv_filename: Name of the output CSV file.
+        :param repeats: Number of timed runs per worker count; the fastest is kept.
+        :return: Best execution time in seconds per worker count.
+        """
+        logging.info(f"Starting scaling benchmark for n={n}...")
+        times: Dict[int, float] = {}
+
+        for workers in range(max_workers + 1):
+            strategy = strategy_factory(workers)
+            try:
+                with small_n_table.override(self.table_limit):
+                    # The first call also starts the worker pool, so it is not timed
+                    strategy.execute(n)
+                    times[workers] = min(self._measure_time(strategy.execute, n) for _ in range(repeats))
+            finally:
+                if hasattr(strategy, 'close'):
+                    strategy.close()
+            logging.info(f"{workers} workers: {times[workers]:.6f} seconds, speedup {times[0] / times[workers]:.2f}x")
+
+        if csv_filename:
+            with open(csv_filename, 'w', newline='') as file:
+                writer = csv.writer(file)
+                writer.writerow(['workers', 'n', 'time', 'speedup'])
+                for workers, time_taken in times.items():
+                    writer.writerow([workers, n, time_taken, times[0] / time_taken])
+            logging.info(f"Scaling results written to CSV: {csv_filename}")
+
+        logging.info("Scaling benchmark completed.")
+        return times
 
 
 def run_fibonacci_benchmark(max_n: int, spread: int, timeout: float, strategies: List[Any],
-                            csv_filename: str, json_filename: str) -> None:
+                            csv_filename: str, json_filename: str, **options: Any) -> None:
     """
     Run a comprehensive Fibonacci benchmark.
 
@@ -163,22 +492,27 @@ def run_fibonacci_benchmark(max_n: int, spread: int, timeout: float, strategies:
     :param strategies: List of strategy objects to benchmark.
     :param csv_filename: Name of the output CSV file.
     :param json_filename: Name of the output JSON file.
+    :param options: Noise controls passed on to FibonacciBenchmark (disable_gc, pin_core, interleave,
+                    seed, calibration_interval, drift_tolerance, use_small_n_table).
     """
     logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
-    benchmark = FibonacciBenchmark(max_n=max_n, spread=spread, timeout=timeout)
+    benchmark = FibonacciBenchmark(max_n=max_n, spread=spread, timeout=timeout, **options)
     benchmark.run_benchmark(strategies, csv_filename, json_filename)
 
 
-# Example usage:
+# Example usage (see FibonacciCLI.py for configurable runs):
 if __name__ == "__main__":
+    from src.Strategies.StrategyRegistry import registry
+
     run_fibonacci_benchmark(
         max_n=50001,
         spread=1,
         timeout=60,
-        strategies=[RecursiveFibonacci(), IterativeFibonacci(), MatrixFibonacci(), ImprovedMatrixFibonnaci(),
-                    DoublingFibonacci(), GMPIterativeFibonacci(), GMPMatrixFibonacci(), GMPImprovedMatrixFibonnaci(),
-                    GMPDoublingFibonacci(), GMPImprovedMatrixFibonnaci()],
+        strategies=registry.create_all(['RecursiveFibonacci', 'IterativeFibonacci', 'MatrixFibonacci',
+                                        'ImprovedMatrixFibonnaci', 'DoublingFibonacci', 'GMPIterativeFibonacci',
+                                        'GMPMatrixFibonacci', 'GMPImprovedMatrixFibonnaci', 'GMPDoublingFibonacci',
+                                        'GMPDoublingFibonacciOptimized']),
         csv_filename='data.csv',
         json_filename='data.json'
     )
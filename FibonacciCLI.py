@@ -0,0 +1,366 @@
+import argparse
+import logging
+import sys
+
+# Only lightweight modules are imported here; every subcommand imports what it needs when it
+# runs, so e.g. `run` never loads pandas/matplotlib and `plot` never loads the strategies.
+
+DEFAULT_STRATEGIES = 'IterativeFibonacci,ImprovedMatrixFibonnaci,DoublingFibonacci,GMPIterativeFibonacci,' \
+                     'GMPImprovedMatrixFibonnaci,GMPDoublingFibonacciOptimized'
+
+
+def _strategy_names(value: str):
+    """Split a comma-separated list of strategy names."""
+    return [name.strip() for name in value.split(',') if name.strip()]
+
+
+def _configure_logging():
+    """Set up the same log format as the benchmark scripts."""
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+
+def command_list(args):
+    """List the available strategies."""
+    from src.Strategies.StrategyRegistry import registry
+
+    for name in registry.names():
+        print(name)
+
+
+def command_run(args):
+    """Run the timing benchmark."""
+    from FibonacciBenchmark import run_fibonacci_benchmark
+    from src.Strategies.StrategyRegistry import registry
+
+    run_fibonacci_benchmark(
+        max_n=args.max_n,
+        spread=args.spread,
+        timeout=args.timeout,
+        strategies=registry.create_all(args.strategies),
+        csv_filename=args.csv,
+        json_filename=args.json,
+        disable_gc=args.disable_gc,
+        pin_core=True if args.pin_core == -1 else args.pin_core,
+        interleave=args.interleave,
+        seed=args.seed,
+        calibration_interval=args.calibration_interval,
+        use_small_n_table=args.small_n_table,
+    )
+
+
+def command_adaptive(args):
+    """Run the time-budgeted adaptive benchmark."""
+    from AdaptiveBenchmark import run_adaptive_benchmark
+    from src.Strategies.StrategyRegistry import registry
+
+    report = run_adaptive_benchmark(
+        max_n=args.max_n,
+        spread=args.spread,
+        timeout=args.timeout,
+        budget=args.budget,
+        strategies=registry.create_all(args.strategies),
+        csv_filename=args.csv,
+        json_filename=args.json,
+        target_confidence=args.target_confidence,
+        tolerance=args.tolerance,
+        disable_gc=args.disable_gc,
+        max_schedule_points=args.schedule_points,
+        use_small_n_table=args.small_n_table,
+    )
+    print(f"Confidence reached: {report['confidence']:.1%} (target {report['target_confidence']:.1%}) "
+          f"with {report['measurements']} measurements in {report['elapsed']:.1f} seconds")
+
+
+def command_load(args):
+    """Run the closed-loop load benchmark."""
+    from LoadBenchmark import (HTTPEndpoint, TraceDistribution, UniformDistribution, ZipfDistribution,
+                               run_fibonacci_load_benchmark)
+    from src.Strategies.StrategyRegistry import registry
+
+    if args.distribution == 'uniform':
+        distribution = UniformDistribution(args.min_n, args.max_n)
+    elif args.distribution == 'zipf':
+        distribution = ZipfDistribution(args.max_n - args.min_n + 1, exponent=args.zipf_exponent, offset=args.min_n)
+    else:
+        if not args.trace:
+            raise SystemExit("--trace is required for the trace distribution")
+        distribution = TraceDistribution.from_file(args.trace)
+
+    targets = registry.create_all(args.strategies) + [HTTPEndpoint(url) for url in args.endpoint]
+    run_fibonacci_load_benchmark(
+        clients=args.clients,
+        duration=args.duration,
+        distribution=distribution,
+        targets=targets,
+        csv_filename=args.csv,
+        json_filename=args.json,
+        warmup=args.warmup,
+        use_processes=args.processes,
+        seed=args.seed,
+        use_small_n_table=args.small_n_table,
+    )
+
+
+def command_coordinator(args):
+    """Serve a distributed benchmark to workers."""
+    from DistributedBenchmark import run_distributed_benchmark
+
+    run_distributed_benchmark(
+        strategies=args.strategies,
+        max_n=args.max_n,
+        spread=args.spread,
+        timeout=args.timeout,
+        csv_filename=args.csv,
+        json_filename=args.json,
+        shard_size=args.shard_size,
+        host=args.host,
+        port=args.port,
+        local_workers=args.local_workers,
+        shard_timeout=args.shard_timeout,
+        idle_timeout=args.idle_timeout,
+        use_small_n_table=args.small_n_table,
+        max_attempts=args.max_attempts,
+    )
+
+
+def command_worker(args):
+    """Measure shards for a distributed benchmark coordinator."""
+    from DistributedBenchmark import BenchmarkWorker
+
+    BenchmarkWorker(args.host, args.port).run()
+
+
+def command_export(args):
+    """Export a prefix of the Fibonacci sequence to chunked files."""
+    from SequenceExporter import export_sequence
+
+    summary = export_sequence(
+        count=args.count,
+        directory=args.output,
+        chunk_size=args.chunk_size,
+        output_format=args.format,
+        compression=args.compression,
+        workers=args.workers,
+    )
+    print(f"{summary['raw_bytes'] / 1e6:.1f} MB in {summary['elapsed']:.2f} seconds "
+          f"({summary['raw_mb_per_s']:.1f} MB/s, {summary['mb_per_s']:.1f} MB/s written)")
+
+
+def command_micro(args):
+    """Measure per-call overhead at small n."""
+    from MicroBenchmark import format_micro_results, run_micro_benchmark
+
+    results = run_micro_benchmark(
+        strategy_names=args.strategies,
+        csv_filename=args.output,
+        n_values=[int(n) for n in args.n_values.split(',')],
+        table_limit=args.table_limit,
+        min_time=args.min_time,
+        repeat=args.repeat,
+    )
+    print(format_micro_results(results))
+
+
+def command_plot(args):
+    """Plot a result file."""
+    from BenchmarkVisualizer import BenchmarkVisualizer
+
+    BenchmarkVisualizer(args.input, args.output).visualize()
+
+
+def command_dashboard(args):
+    """Watch a running benchmark."""
+    from LiveDashboard import run_live_dashboard
+
+    run_live_dashboard(
+        csv_filename=args.input,
+        refresh=args.refresh,
+        image_filename=args.image,
+        host=args.host,
+        port=None if args.no_server else args.port,
+        stop_when_complete=args.exit_when_complete,
+    )
+
+
+def command_merge(args):
+    """Merge result files."""
+    from merger import merge_csv_files_builtin
+
+    return 0 if merge_csv_files_builtin(args.input_files, args.output, args.force) else 1
+
+
+def command_compare(args):
+    """Compare two result files."""
+    from BenchmarkComparison import compare_csv_files, format_comparison
+
+    try:
+        comparison = compare_csv_files(args.baseline, args.candidate, args.force)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    print(format_comparison(comparison))
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser."""
+    parser = argparse.ArgumentParser(description='Benchmark and analyze Fibonacci calculation strategies.')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    list_parser = subparsers.add_parser('list', help='List the available strategies.')
+    list_parser.set_defaults(handler=command_list)
+
+    run_parser = subparsers.add_parser('run', help='Time strategies over a range of n.')
+    run_parser.add_argument('-s', '--strategies', type=_strategy_names, default=_strategy_names(DEFAULT_STRATEGIES),
+                            help='Comma-separated strategy names (see `list`).')
+    run_parser.add_argument('--max-n', type=int, default=10001, help='Maximum Fibonacci number to calculate.')
+    run_parser.add_argument('--spread', type=int, default=100, help='Step size between Fibonacci numbers.')
+    run_parser.add_argument('--timeout', type=float, default=60, help='Maximum execution time per calculation.')
+    run_parser.add_argument('--csv', default='data.csv', help='Output CSV file name.')
+    run_parser.add_argument('--json', default=None, help='Output JSON file name.')
+    run_parser.add_argument('--disable-gc', action='store_true', help='Disable the garbage collector while timing.')
+    run_parser.add_argument('--pin-core', type=int, nargs='?', const=-1, default=None,
+                            help='Pin to a core (an isolated one if no index is given).')
+    run_parser.add_argument('--interleave', action='store_true', help='Run strategies in randomized order per n.')
+    run_parser.add_argument('--seed', type=int, default=None, help='Seed for the interleaving order.')
+    run_parser.add_argument('--calibration-interval', type=int, default=0,
+                            help='Check for machine speed drift every this many measurements.')
+    run_parser.add_argument('--small-n-table', action='store_true',
+                            help='Serve small n from the lookup table instead of timing their arithmetic.')
+    run_parser.set_defaults(handler=command_run)
+
+    adaptive_parser = subparsers.add_parser('adaptive', help='Spend a time budget where it best resolves crossovers.')
+    adaptive_parser.add_argument('-s', '--strategies', type=_strategy_names,
+                                 default=_strategy_names(DEFAULT_STRATEGIES),
+                                 help='Comma-separated strategy names (see `list`).')
+    adaptive_parser.add_argument('--budget', type=float, required=True, help='Total wall-clock time in seconds.')
+    adaptive_parser.add_argument('--target-confidence', type=float, default=0.95,
+                                 help='Stop early once this confidence is reached.')
+    adaptive_parser.add_argument('--tolerance', type=float, default=0.05,
+                                 help='Relative difference treated as a tie and targeted curve precision.')
+    adaptive_parser.add_argument('--max-n', type=int, default=10001, help='Maximum Fibonacci number to calculate.')
+    adaptive_parser.add_argument('--spread', type=int, default=100, help='Step size between Fibonacci numbers.')
+    adaptive_parser.add_argument('--timeout', type=float, default=60, help='Maximum execution time per calculation.')
+    adaptive_parser.add_argument('--disable-gc', action='store_true', help='Disable the garbage collector while timing.')
+    adaptive_parser.add_argument('--schedule-points', type=int, default=200,
+                                 help='Maximum number of n values per strategy that are scored and measured.')
+    adaptive_parser.add_argument('--small-n-table', action='store_true',
+                                 help='Serve small n from the lookup table instead of timing their arithmetic.')
+    adaptive_parser.add_argument('--csv', default='adaptive.csv', help='Output CSV file name.')
+    adaptive_parser.add_argument('--json', default=None, help='Output JSON file name.')
+    adaptive_parser.set_defaults(handler=command_adaptive)
+
+    load_parser = subparsers.add_parser('load', help='Measure throughput and tail latency under concurrent load.')
+    load_parser.add_argument('-s', '--strategies', type=_strategy_names, default=[],
+                             help='Comma-separated strategy names (see `list`).')
+    load_parser.add_argument('--endpoint', action='append', default=[],
+                             help='URL template with an {n} placeholder to drive instead of a strategy.')
+    load_parser.add_argument('--clients', type=int, default=4, help='Number of concurrent clients.')
+    load_parser.add_argument('--duration', type=float, default=10, help='Measurement window per target in seconds.')
+    load_parser.add_argument('--warmup', type=float, default=1, help='Unmeasured warm-up in seconds.')
+    load_parser.add_argument('--distribution', choices=['uniform', 'zipf', 'trace'], default='uniform')
+    load_parser.add_argument('--min-n', type=int, default=0)
+    load_parser.add_argument('--max-n', type=int, default=10000)
+    load_parser.add_argument('--zipf-exponent', type=float, default=1.1)
+    load_parser.add_argument('--trace', help='File with the n values to replay.')
+    load_parser.add_argument('--processes', action='store_true', help='Run clients as processes instead of threads.')
+    load_parser.add_argument('--seed', type=int, default=0)
+    load_parser.add_argument('--small-n-table', action='store_true',
+                             help='Serve small n from the lookup table instead of computing them.')
+    load_parser.add_argument('--csv', default='load.csv', help='Output CSV file name.')
+    load_parser.add_argument('--json', default=None, help='Output JSON file name.')
+    load_parser.set_defaults(handler=command_load)
+
+    coordinator_parser = subparsers.add_parser('coordinator', help='Shard a benchmark over worker processes.')
+    coordinator_parser.add_argument('-s', '--strategies', type=_strategy_names,
+                                    default=_strategy_names(DEFAULT_STRATEGIES),
+                                    help='Comma-separated strategy names (see `list`).')
+    coordinator_parser.add_argument('--max-n', type=int, default=10001, help='Maximum Fibonacci number to calculate.')
+    coordinator_parser.add_argument('--spread', type=int, default=100, help='Step size between Fibonacci numbers.')
+    coordinator_parser.add_argument('--timeout', type=float, default=60, help='Maximum execution time per calculation.')
+    coordinator_parser.add_argument('--shard-size', type=int, default=100, help='Number of n values per shard.')
+    coordinator_parser.add_argument('--shard-timeout', type=float, default=None,
+                                    help='Seconds before an unresponsive worker is considered lost.')
+    coordinator_parser.add_argument('--idle-timeout', type=float, default=300,
+                                    help='Seconds without any connected worker before the run gives up.')
+    coordinator_parser.add_argument('--max-attempts', type=int, default=3,
+                                    help='Times a shard is handed out before it is dropped as failing.')
+    coordinator_parser.add_argument('--host', default='0.0.0.0', help='Interface to listen on.')
+    coordinator_parser.add_argument('--port', type=int, default=5555, help='Port to listen on.')
+    coordinator_parser.add_argument('--local-workers', type=int, default=0,
+                                    help='Number of worker processes to start on this machine.')
+    coordinator_parser.add_argument('--small-n-table', action='store_true',
+                                    help='Serve small n from the lookup table instead of timing their arithmetic.')
+    coordinator_parser.add_argument('--csv', default='data.csv', help='Output CSV file name.')
+    coordinator_parser.add_argument('--json', default=None, help='Output JSON file name.')
+    coordinator_parser.set_defaults(handler=command_coordinator)
+
+    worker_parser = subparsers.add_parser('worker', help='Measure shards for a coordinator.')
+    worker_parser.add_argument('--host', default='127.0.0.1', help='Host of the coordinator.')
+    worker_parser.add_argument('--port', type=int, default=5555, help='Port of the coordinator.')
+    worker_parser.set_defaults(handler=command_worker)
+
+    export_parser = subparsers.add_parser('export', help='Write F(0) .. F(count - 1) to chunked files.')
+    export_parser.add_argument('count', type=int, help='Number of Fibonacci numbers to export.')
+    export_parser.add_argument('-o', '--output', default='fibonacci_sequence', help='Output directory.')
+    export_parser.add_argument('--chunk-size', type=int, default=10000, help='Number of values per chunk file.')
+    export_parser.add_argument('--format', choices=['decimal', 'binary'], default='decimal')
+    export_parser.add_argument('--compression', choices=['none', 'gzip', 'bz2', 'lzma'], default='none')
+    export_parser.add_argument('--workers', type=int, default=None, help='Number of worker processes.')
+    export_parser.set_defaults(handler=command_export)
+
+    micro_parser = subparsers.add_parser('micro', help='Measure per-call overhead at small n, with and without the small-n table.')
+    micro_parser.add_argument('--strategies', type=_strategy_names, default=None,
+                              help='Comma-separated strategy names (default: all but the exponential and parallel ones).')
+    micro_parser.add_argument('--n-values', default='0,1,10,50,93,94,200,500', help='Comma-separated input sizes.')
+    micro_parser.add_argument('--table-limit', type=int, default=94, help='Size of the small-n table when enabled.')
+    micro_parser.add_argument('--min-time', type=float, default=0.02, help='Minimum duration of one timing loop in seconds.')
+    micro_parser.add_argument('--repeat', type=int, default=5, help='Timing loops per measurement; the fastest is used.')
+    micro_parser.add_argument('-o', '--output', default=None, help='Output CSV file.')
+    micro_parser.set_defaults(handler=command_micro)
+
+    plot_parser = subparsers.add_parser('plot', help='Plot a CSV or JSON result file.')
+    plot_parser.add_argument('input', help='Result file to plot.')
+    plot_parser.add_argument('-o', '--output', default='benchmark_plot.png', help='Output image file name.')
+    plot_parser.set_defaults(handler=command_plot)
+
+    dashboard_parser = subparsers.add_parser('dashboard', help='Follow the CSV file of a running benchmark live.')
+    dashboard_parser.add_argument('input', nargs='?', default='data.csv', help='CSV file the benchmark is writing.')
+    dashboard_parser.add_argument('--refresh', type=float, default=5, help='Seconds between updates.')
+    dashboard_parser.add_argument('--image', default=None, help='Image file to re-render after every update.')
+    dashboard_parser.add_argument('--host', default='127.0.0.1', help='Interface to serve the web page on.')
+    dashboard_parser.add_argument('--port', type=int, default=8000, help='Port to serve the web page on.')
+    dashboard_parser.add_argument('--no-server', action='store_true', help='Only write the image file.')
+    dashboard_parser.add_argument('--exit-when-complete', action='store_true',
+                                  help='Stop once the benchmark has finished.')
+    dashboard_parser.set_defaults(handler=command_dashboard)
+
+    merge_parser = subparsers.add_parser('merge', help='Merge CSV result files by averaging duplicate points.')
+    merge_parser.add_argument('input_files', nargs='+', help='CSV files to merge.')
+    merge_parser.add_argument('-o', '--output', default='merged_output.csv', help='Output CSV file name.')
+    merge_parser.add_argument('-f', '--force', action='store_true', help='Merge incompatible runs anyway.')
+    merge_parser.set_defaults(handler=command_merge)
+
+    compare_parser = subparsers.add_parser('compare', help='Compare two CSV result files per strategy.')
+    compare_parser.add_argument('baseline', help='Baseline CSV file.')
+    compare_parser.add_argument('candidate', help='Candidate CSV file.')
+    compare_parser.add_argument('-f', '--force', action='store_true', help='Compare incompatible runs anyway.')
+    compare_parser.set_defaults(handler=command_compare)
+
+    return parser
+
+
+def main(argv=None):
+    from src.Strategies.StrategyRegistry import UnknownStrategyError
+
+    args = build_parser().parse_args(argv)
+    _configure_logging()
+    try:
+        return args.handler(args) or 0
+    except UnknownStrategyError as e:
+        print(f"Error: {e.args[0]}", file=sys.stderr)
+        return 2
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,564 @@
+import csv
+import html
+import json
+import logging
+import math
+import os
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+
+from BenchmarkEnvironment import METADATA_PREFIX
+
+
+class ResultTailer:
+    """
+    Reads the rows appended to a result CSV file since the previous poll.
+
+    Only the new bytes are read on every poll; an incomplete last line is kept until the rest
+    of it has been written. When the file is replaced (the benchmark writes its final file
+    under a temporary name and moves it into place) or truncated, reading starts over.
+    """
+
+    def __init__(self, filename: str):
+        """
+        Initialize the ResultTailer.
+
+        :param filename: Path of the CSV file written by the benchmark.
+        """
+        self.filename = filename
+        self.metadata: Optional[Dict[str, Any]] = None
+        self._offset = 0
+        self._inode: Optional[int] = None
+        self._partial = b''
+        self._columns: Optional[List[str]] = None
+
+    def _reset(self) -> None:
+        """Forget everything read so far."""
+        self.metadata = None
+        self._offset = 0
+        self._partial = b''
+        self._columns = None
+
+    def poll(self) -> Tuple[List[Dict[str, str]], bool]:
+        """
+        Read the complete rows appended since the previous poll.
+
+        :return: The new rows, and whether the file was replaced so that earlier rows are void.
+        """
+        try:
+            stat = os.stat(self.filename)
+        except FileNotFoundError:
+            return [], False
+
+        replaced = self._inode is not None and (stat.st_ino != self._inode or stat.st_size < self._offset)
+        if replaced:
+            self._reset()
+        self._inode = stat.st_ino
+        if stat.st_size == self._offset:
+            return [], replaced
+
+        with open(self.filename, 'rb') as file:
+            file.seek(self._offset)
+            chunk = file.read()
+        self._offset += len(chunk)
+
+        lines = (self._partial + chunk).split(b'\n')
+        self._partial = lines.pop()
+        rows = []
+        for raw_line in lines:
+            line = raw_line.decode('utf-8').rstrip('\r')
+            if not line:
+                continue
+            if line.startswith('#'):
+                if line.startswith(METADATA_PREFIX) and self.metadata is None:
+                    self.metadata = json.loads(line[len(METADATA_PREFIX):])
+                continue
+            values = next(csv.reader([line]))
+            if self._columns is None:
+                self._columns = values
+            else:
+                rows.append(dict(zip(self._columns, values)))
+        return rows, replaced
+
+
+class StrategyAggregate:
+    """
+    Running statistics of one strategy, updated one measurement at a time.
+
+    Measurements are also averaged into fixed-width bins of n, which keeps the memory and the
+    cost of plotting and of finding crossovers bounded however long the run is.
+    """
+
+    def __init__(self, bin_width: int):
+        """
+        Initialize the StrategyAggregate.
+
+        :param bin_width: Width of the n bins.
+        """
+        self.bin_width = bin_width
+        self.count = 0
+        self.total = 0.0
+        self.minimum = math.inf
+        self.maximum = 0.0
+        self.last_n = -1
+        self.bins: Dict[int, List[float]] = {}
+
+    def add(self, n: int, execution_time: float) -> None:
+        """
+        Add a single measurement.
+
+        :param n: Input size.
+        :param execution_time: Measured time in seconds.
+        """
+        self.count += 1
+        self.total += execution_time
+        self.minimum = min(self.minimum, execution_time)
+        self.maximum = max(self.maximum, execution_time)
+        self.last_n = max(self.last_n, n)
+        bin_sum = self.bins.setdefault(n // self.bin_width, [0.0, 0])
+        bin_sum[0] += execution_time
+        bin_sum[1] += 1
+
+    @property
+    def mean(self) -> Optional[float]:
+        """Mean time over all measurements."""
+        return self.total / self.count if self.count else None
+
+    def binned(self) -> List[Tuple[float, float]]:
+        """
+        Mean time per bin.
+
+        :return: (bin center, mean time) pairs in order of n.
+        """
+        return [((index + 0.5) * self.bin_width, total / count) for index, (total, count) in sorted(self.bins.items())]
+
+    def projected_time(self, stop: int, spread: int) -> float:
+        """
+        Estimate the measured time still needed for n = last_n + spread, ... below stop.
+
+        Fits t = a * n^b to the most recent bins on a log-log scale and integrates it over the
+        remaining range, so a strategy that slows down with n is not projected at its current pace.
+
+        :param stop: Exclusive upper bound of the input sizes.
+        :param spread: Step size between input sizes.
+        :return: Projected time in seconds.
+        """
+        start = self.last_n + spread
+        if start >= stop or not self.count:
+            return 0.0
+        points = [(n, t) for n, t in self.binned() if n > 0 and t > 0][-8:]
+        if len(points) < 2:
+            return (stop - start) / spread * self.mean
+
+        logs = [(math.log(n), math.log(t)) for n, t in points]
+        mean_x = sum(x for x, _ in logs) / len(logs)
+        mean_y = sum(y for _, y in logs) / len(logs)
+        variance = sum((x - mean_x) ** 2 for x, _ in logs)
+        exponent = sum((x - mean_x) * (y - mean_y) for x, y in logs) / variance if variance else 0.0
+        exponent = min(max(exponent, 0.0), 3.0)
+        scale = math.exp(mean_y - exponent * mean_x)
+        # The sum over the remaining n, approximated by the integral of a * n^b divided by the step
+        return scale * (stop ** (exponent + 1) - start ** (exponent + 1)) / ((exponent + 1) * spread)
+
+
+class LiveDashboard:
+    """
+    Live view of a running benchmark.
+
+    Tails the CSV file that FibonacciBenchmark.run_benchmark streams its measurements to and
+    folds every new row into per-strategy aggregates, so the file is never reloaded. The
+    current state (progress, projected completion time, crossover points and a plot of the
+    binned times) can be served as an auto-refreshing local web page and/or rendered to an
+    image file after every update.
+    """
+
+    def __init__(self, csv_filename: str, refresh: float = 5.0, image_filename: Optional[str] = None,
+                 bins: int = 200):
+        """
+        Initialize the LiveDashboard.
+
+        :param csv_filename: CSV file the benchmark is writing.
+        :param refresh: Seconds between polls of the file and between page reloads.
+        :param image_filename: Image file to re-render after every update (optional).
+        :param bins: Approximate number of n bins per strategy.
+        """
+        self.csv_filename = csv_filename
+        self.refresh = refresh
+        self.image_filename = image_filename
+        self.bins = bins
+        self.tailer = ResultTailer(csv_filename)
+        self.aggregates: Dict[str, StrategyAggregate] = {}
+        self.order: List[str] = []
+        self.complete = False
+        self._lock = threading.Lock()
+        self._png: Optional[bytes] = None
+        self._figure = None
+        self._lines: Dict[str, Any] = {}
+        self._markers: List[Any] = []
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """Run metadata from the file header (empty until the header has been read)."""
+        return self.tailer.metadata or {}
+
+    @property
+    def _benchmark(self) -> Dict[str, Any]:
+        return self.metadata.get('benchmark', {})
+
+    def _bin_width(self) -> int:
+        """Bin width in n: a multiple of the spread giving about `bins` bins over the whole range."""
+        spread = self._benchmark.get('spread', 1)
+        max_n = self._benchmark.get('max_n', spread * self.bins)
+        return spread * max(1, math.ceil(max_n / spread / self.bins))
+
+    def update(self) -> int:
+        """
+        Fold the rows written since the previous update into the aggregates.
+
+        :return: Number of new rows.
+        """
+        rows, replaced = self.tailer.poll()
+        with self._lock:
+            if replaced:
+                # The final file replaces the streamed one; start over from its rows
+                self.aggregates.clear()
+                self.order.clear()
+                self._reset_figure()
+            for row in rows:
+                strategy = row['strategy']
+                if strategy not in self.aggregates:
+                    self.aggregates[strategy] = StrategyAggregate(self._bin_width())
+                    self.order.append(strategy)
+                self.aggregates[strategy].add(int(row['n']), float(row['time']))
+            # Only the final file carries the end-of-run metadata
+            self.complete = 'load_average_end' in self.metadata
+            if rows or replaced:
+                self._png = None
+        return len(rows)
+
+    def _points_per_strategy(self) -> int:
+        """Number of n values a strategy is timed for if it never times out."""
+        return math.ceil(self._benchmark['max_n'] / self._benchmark['spread'])
+
+    def _finished(self, strategy: str) -> bool:
+        """
+        Whether a strategy will not be measured any further.
+
+        A strategy is dropped at its first timeout. Run one after the other, a strategy is
+        finished once a later one has started; interleaved, once another strategy has moved
+        past the next n without it.
+        """
+        aggregate = self.aggregates[strategy]
+        if self.complete or aggregate.count >= self._points_per_strategy():
+            return True
+        if self._benchmark.get('interleave'):
+            skipped = aggregate.last_n + self._benchmark['spread']
+            return any(other.last_n > skipped for other in self.aggregates.values())
+        strategies = self._benchmark.get('strategies', self.order)
+        later = strategies[strategies.index(strategy) + 1:] if strategy in strategies else []
+        return any(name in self.aggregates for name in later)
+
+    def progress(self) -> Dict[str, Any]:
+        """
+        Progress of the run and its projected completion.
+
+        Remaining points are weighted by their projected measurement time, which is scaled by the
+        ratio of elapsed wall-clock time to measured time to account for the benchmark's overhead.
+        Strategies that have not started yet are assumed to take as long as the average started one.
+
+        :return: Completed and expected measurements, fraction done and the projected remaining seconds.
+        """
+        if 'max_n' not in self._benchmark:
+            return {'done': sum(a.count for a in self.aggregates.values()), 'expected': None,
+                    'fraction': None, 'remaining_seconds': None, 'eta': None}
+
+        max_n, spread = self._benchmark['max_n'], self._benchmark['spread']
+        points = self._points_per_strategy()
+        strategies = self._benchmark.get('strategies', self.order)
+        done = expected = 0
+        measured = remaining = 0.0
+        sweeps = []
+        for strategy in strategies:
+            aggregate = self.aggregates.get(strategy)
+            if aggregate is None:
+                expected += points
+                continue
+            done += aggregate.count
+            measured += aggregate.total
+            if self._finished(strategy):
+                expected += aggregate.count
+                continue
+            expected += points
+            projected = aggregate.projected_time(max_n, spread)
+            remaining += projected
+            sweeps.append(aggregate.total + projected)
+        unstarted = sum(1 for strategy in strategies if strategy not in self.aggregates)
+        if unstarted and sweeps:
+            remaining += unstarted * sum(sweeps) / len(sweeps)
+
+        remaining_seconds = None
+        started = self.metadata.get('timestamp')
+        if self.complete:
+            remaining_seconds = 0.0
+        elif started and measured > 0 and (sweeps or not unstarted):
+            started = datetime.fromisoformat(started)
+            elapsed = (datetime.now(started.tzinfo) - started).total_seconds()
+            remaining_seconds = remaining * max(1.0, elapsed / measured)
+        return {
+            'done': done,
+            'expected': expected,
+            'fraction': 1.0 if self.complete else (done / expected if expected else None),
+            'remaining_seconds': remaining_seconds,
+            'eta': None if remaining_seconds is None else time.time() + remaining_seconds,
+        }
+
+    def crossovers(self) -> List[Dict[str, Any]]:
+        """
+        Points where the ranking of two strategies flips, based on the binned mean times.
+
+        :return: For each crossover, the strategy that is faster below and above it and the n it happens at.
+        """
+        result = []
+        names = list(self.aggregates)
+        for i, first in enumerate(names):
+            first_bins = dict(self.aggregates[first].binned())
+            for second in names[i + 1:]:
+                shared = [(n, first_bins[n], t) for n, t in self.aggregates[second].binned() if n in first_bins]
+                previous = None
+                for n, first_time, second_time in shared:
+                    if first_time == second_time:
+                        continue
+                    faster = first if first_time < second_time else second
+                    if previous is not None and faster != previous:
+                        result.append({'faster_below': previous, 'faster_above': faster, 'n': n})
+                    previous = faster
+        return sorted(result, key=lambda crossover: crossover['n'])
+
+    def status(self) -> Dict[str, Any]:
+        """
+        Snapshot of the dashboard state.
+
+        :return: Progress, crossovers and per-strategy statistics.
+        """
+        with self._lock:
+            return {
+                'file': self.csv_filename,
+                'complete': self.complete,
+                'progress': self.progress(),
+                'crossovers': self.crossovers(),
+                'strategies': {
+                    strategy: {
+                        'points': aggregate.count,
+                        'average': aggregate.mean,
+                        'min': aggregate.minimum,
+                        'max': aggregate.maximum,
+                        'last_n': aggregate.last_n,
+                        'finished': self._finished(strategy) if 'max_n' in self._benchmark else None,
+                    }
+                    for strategy, aggregate in self.aggregates.items()
+                },
+            }
+
+    def _reset_figure(self) -> None:
+        """Drop the plotted lines so they are rebuilt from the current aggregates."""
+        if self._figure is not None:
+            for line in self._lines.values():
+                line.remove()
+            for marker in self._markers:
+                marker.remove()
+        self._lines.clear()
+        self._markers.clear()
+
+    def render_png(self) -> bytes:
+        """
+        Render the binned times and crossovers as a PNG image.
+
+        The figure and its lines are kept between renders; only their data is replaced.
+
+        :return: The PNG image.
+        """
+        import io
+
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        with self._lock:
+            if self._png is not None:
+                return self._png
+            if self._figure is None:
+                self._figure = Figure(figsize=(12, 7), dpi=100)
+                FigureCanvasAgg(self._figure)
+                ax = self._figure.add_subplot()
+                ax.set_xlabel('n', fontweight='bold')
+                ax.set_ylabel('Time', fontweight='bold')
+                ax.grid(True, linestyle='--', alpha=0.7)
+            ax = self._figure.axes[0]
+
+            for strategy, aggregate in self.aggregates.items():
+                points = aggregate.binned()
+                if strategy not in self._lines:
+                    self._lines[strategy], = ax.plot([], [], label=strategy, linewidth=1, marker='.', markersize=3)
+                self._lines[strategy].set_data([n for n, _ in points], [t for _, t in points])
+            for marker in self._markers:
+                marker.remove()
+            self._markers = [ax.axvline(crossover['n'], color='grey', linestyle=':', linewidth=1)
+                             for crossover in self.crossovers()]
+
+            progress = self.progress()
+            title = 'Complete' if self.complete else 'Running'
+            if progress['fraction'] is not None:
+                title += f" - {progress['fraction']:.1%} of {progress['expected']} measurements"
+            ax.set_title(title, fontweight='bold')
+            ax.relim()
+            ax.autoscale_view()
+            if self._lines:
+                ax.legend(loc='upper left', fontsize=9)
+
+            buffer = io.BytesIO()
+            self._figure.savefig(buffer, format='png', bbox_inches='tight')
+            self._png = buffer.getvalue()
+            return self._png
+
+    def render_html(self) -> str:
+        """
+        Render the status as a self-refreshing HTML page.
+
+        :return: The page.
+        """
+        status = self.status()
+        progress = status['progress']
+
+        def seconds(value: Optional[float]) -> str:
+            if value is None:
+                return 'unknown'
+            minutes, second = divmod(int(value), 60)
+            hours, minute = divmod(minutes, 60)
+            return f"{hours}:{minute:02d}:{second:02d}"
+
+        summary = f"{progress['done']} measurements"
+        if progress['fraction'] is not None:
+            summary = f"{progress['done']} / {progress['expected']} measurements ({progress['fraction']:.1%})"
+        eta = 'done' if status['complete'] else seconds(progress['remaining_seconds'])
+        if progress['eta'] and not status['complete']:
+            eta += f" (around {time.strftime('%H:%M:%S', time.localtime(progress['eta']))})"
+
+        rows = ''.join(
+            f"<tr><td>{html.escape(name)}</td><td>{s['points']}</td><td>{s['last_n']}</td>"
+            f"<td>{s['average']:.6f}</td><td>{s['min']:.6f}</td><td>{s['max']:.6f}</td>"
+            f"<td>{'finished' if s['finished'] else 'running'}</td></tr>"
+            for name, s in status['strategies'].items()
+        )
+        crossovers = ''.join(
+            f"<li>n &asymp; {c['n']:.0f}: {html.escape(c['faster_above'])} overtakes {html.escape(c['faster_below'])}</li>"
+            for c in status['crossovers']
+        ) or '<li>none yet</li>'
+        refresh = '' if status['complete'] else f'<meta http-equiv="refresh" content="{self.refresh:g}">'
+
+        return f"""<!DOCTYPE html>
+<html><head><meta charset="utf-8">{refresh}<title>Benchmark: {html.escape(self.csv_filename)}</title>
+<style>body{{font-family:sans-serif;margin:2em}}table{{border-collapse:collapse}}
+td,th{{border:1px solid #ccc;padding:4px 8px;text-align:right}}td:first-child{{text-align:left}}</style></head>
+<body><h1>{html.escape(self.csv_filename)}</h1>
+<p><progress max="1" value="{progress['fraction'] or 0}"></progress> {summary}<br>Remaining: {eta}</p>
+<table><tr><th>strategy</th><th>points</th><th>last n</th><th>average</th><th>min</th><th>max</th><th>status</th></tr>
+{rows}</table>
+<h2>Crossovers</h2><ul>{crossovers}</ul>
+<img src="plot.png?{progress['done']}" alt="plot">
+</body></html>"""
+
+    def _write_image(self) -> None:
+        """Write the current plot to the image file, replacing it at once."""
+        temporary_filename = f"{self.image_filename}.tmp"
+        with open(temporary_filename, 'wb') as file:
+            file.write(self.render_png())
+        os.replace(temporary_filename, self.image_filename)
+
+    def serve(self, host: str = '127.0.0.1', port: int = 8000) -> ThreadingHTTPServer:
+        """
+        Serve the dashboard in a background thread.
+
+        `/` is the HTML page, `/plot.png` the plot and `/status.json` the raw status.
+
+        :param host: Interface to listen on.
+        :param port: Port to listen on (0 picks a free port).
+        :return: The running server; call shutdown() and server_close() to stop it.
+        """
+        dashboard = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                path = self.path.split('?', 1)[0]
+                if path == '/':
+                    body, content_type = dashboard.render_html().encode('utf-8'), 'text/html; charset=utf-8'
+                elif path == '/plot.png':
+                    body, content_type = dashboard.render_png(), 'image/png'
+                elif path == '/status.json':
+                    body, content_type = json.dumps(dashboard.status()).encode('utf-8'), 'application/json'
+                else:
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.send_header('Cache-Control', 'no-store')
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        logging.info(f"Dashboard for {self.csv_filename} at http://{host}:{server.server_address[1]}/")
+        return server
+
+    def run(self, stop_when_complete: bool = True) -> None:
+        """
+        Poll the file until the benchmark completes (or forever), updating the image file if one is set.
+
+        :param stop_when_complete: Return once the final result file has been read.
+        """
+        while True:
+            new_rows = self.update()
+            if self.image_filename and (new_rows or self._png is None):
+                self._write_image()
+            if new_rows:
+                progress = self.progress()
+                if progress['fraction'] is not None:
+                    logging.info(f"{progress['done']}/{progress['expected']} measurements ({progress['fraction']:.1%})")
+            if self.complete and stop_when_complete:
+                logging.info("Benchmark completed.")
+                return
+            time.sleep(self.refresh)
+
+
+def run_live_dashboard(csv_filename: str, refresh: float = 5.0, image_filename: Optional[str] = None,
+                       host: str = '127.0.0.1', port: Optional[int] = 8000, stop_when_complete: bool = False) -> None:
+    """
+    Watch a running benchmark's CSV file.
+
+    :param csv_filename: CSV file the benchmark is writing.
+    :param refresh: Seconds between updates.
+    :param image_filename: Image file to re-render after every update (optional).
+    :param host: Interface to serve the web page on.
+    :param port: Port to serve the web page on (None to only write the image).
+    :param stop_when_complete: Return once the benchmark has completed.
+    """
+    dashboard = LiveDashboard(csv_filename, refresh=refresh, image_filename=image_filename)
+    server = dashboard.serve(host, port) if port is not None else None
+    try:
+        dashboard.run(stop_when_complete=stop_when_complete)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    run_live_dashboard('data.csv', image_filename='live_plot.png')
@@ -0,0 +1,422 @@
+import csv
+import itertools
+import json
+import logging
+import math
+import random
+import time
+import urllib.request
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from src.Strategies.FibonacciStrategy import small_n_table
+
+
+class UniformDistribution:
+    """
+    Draws n uniformly from the closed interval [low, high].
+    """
+
+    def __init__(self, low: int, high: int):
+        """
+        Initialize the UniformDistribution.
+
+        :param low: Smallest n that can be drawn.
+        :param high: Largest n that can be drawn.
+        """
+        if low > high:
+            raise ValueError("low must not be greater than high.")
+        self.low = low
+        self.high = high
+
+    def sampler(self, client_id: int, clients: int, seed: int) -> Callable[[], int]:
+        """
+        Create an independent sampler for one client.
+
+        :param client_id: Index of the client the sampler belongs to.
+        :param clients: Total number of clients.
+        :param seed: Base seed of the run.
+        :return: Zero-argument callable returning the next n.
+        """
+        rng = random.Random(seed * 1_000_003 + client_id)
+        low, high = self.low, self.high
+        return lambda: rng.randint(low, high)
+
+
+class ZipfDistribution:
+    """
+    Draws n from a Zipf distribution over [offset, offset + max_n), so small indices dominate.
+
+    The rank k (1-based) is drawn with probability proportional to 1 / k^exponent and mapped to
+    n = offset + k - 1.
+    """
+
+    def __init__(self, max_n: int, exponent: float = 1.1, offset: int = 0):
+        """
+        Initialize the ZipfDistribution.
+
+        :param max_n: Number of distinct values that can be drawn.
+        :param exponent: Skew of the distribution; larger values favour small n more strongly.
+        :param offset: Smallest n that can be drawn.
+        """
+        if max_n <= 0:
+            raise ValueError("max_n must be positive.")
+        self.max_n = max_n
+        self.exponent = exponent
+        self.offset = offset
+        self._cum_weights = list(itertools.accumulate(1.0 / k ** exponent for k in range(1, max_n + 1)))
+
+    def sampler(self, client_id: int, clients: int, seed: int) -> Callable[[], int]:
+        """
+        Create an independent sampler for one client.
+
+        :param client_id: Index of the client the sampler belongs to.
+        :param clients: Total number of clients.
+        :param seed: Base seed of the run.
+        :return: Zero-argument callable returning the next n.
+        """
+        rng = random.Random(seed * 1_000_003 + client_id)
+        cum_weights = self._cum_weights
+        total = cum_weights[-1]
+        offset = self.offset
+        return lambda: offset + bisect_left(cum_weights, rng.random() * total)
+
+
+class TraceDistribution:
+    """
+    Replays a recorded sequence of n values.
+
+    Every client walks the trace in order, starting at an evenly spaced offset so that
+    concurrent clients do not issue the same requests in lockstep, and wraps around at the end.
+    """
+
+    def __init__(self, values: Sequence[int]):
+        """
+        Initialize the TraceDistribution.
+
+        :param values: Recorded n values in request order.
+        """
+        if not values:
+            raise ValueError("The trace must contain at least one value.")
+        self.values = list(values)
+
+    @classmethod
+    def from_file(cls, filename: str) -> 'TraceDistribution':
+        """
+        Load a trace from a text file containing one n per line (or separated by commas).
+
+        :param filename: Path to the trace file.
+        :return: The loaded TraceDistribution.
+        """
+        with open(filename, 'r') as file:
+            values = [int(token) for token in file.read().replace(',', '\n').split()]
+        return cls(values)
+
+    def sampler(self, client_id: int, clients: int, seed: int) -> Callable[[], int]:
+        """
+        Create a replaying sampler for one client.
+
+        :param client_id: Index of the client the sampler belongs to.
+        :param clients: Total number of clients.
+        :param seed: Unused; replay is deterministic.
+        :return: Zero-argument callable returning the next n.
+        """
+        start = (client_id * len(self.values)) // max(clients, 1)
+        iterator = itertools.cycle(self.values[start:] + self.values[:start])
+        return lambda: next(iterator)
+
+
+class HTTPEndpoint:
+    """
+    A load target that issues an HTTP GET per request instead of calling a strategy in-process.
+    """
+
+    def __init__(self, url_template: str, name: str = None, timeout: float = 60):
+        """
+        Initialize the HTTPEndpoint.
+
+        :param url_template: URL with an ``{n}`` placeholder, e.g. ``http://localhost:8000/fib?n={n}``.
+        :param name: Name used in the report; defaults to the URL template.
+        :param timeout: Socket timeout for a single request in seconds.
+        """
+        self.url_template = url_template
+        self.name = name or url_template
+        self.timeout = timeout
+
+    def execute(self, n: int) -> bytes:
+        """
+        Request F(n) from the endpoint and return the raw response body.
+
+        :param n: Index of the Fibonacci number to request.
+        :return: Response body.
+        """
+        with urllib.request.urlopen(self.url_template.format(n=n), timeout=self.timeout) as response:
+            return response.read()
+
+
+def _client_loop(target: Any, distribution: Any, client_id: int, clients: int, seed: int,
+                 start_at: float, warmup: float, duration: float,
+                 table_limit: int) -> Tuple[List[float], int, Optional[str]]:
+    """
+    Run one closed-loop client: issue a request, wait for it to finish, immediately issue the next.
+
+    Requests started during the warm-up period and requests finishing after the deadline are
+    excluded from the latencies.
+
+    :param target: Strategy or endpoint exposing ``execute(n)``.
+    :param distribution: Distribution providing the n values.
+    :param client_id: Index of this client.
+    :param clients: Total number of clients.
+    :param seed: Base seed of the run.
+    :param start_at: Wall-clock time (``time.time()``) at which all clients start together.
+    :param warmup: Seconds of unmeasured load before the measurement window.
+    :param duration: Length of the measurement window in seconds.
+    :param table_limit: Limit of the small-n table, applied in client processes that start with another one.
+    :return: Tuple of measured latencies in seconds, the number of failed requests and a description
+             of the first exception raised by the target (None if no request failed).
+    """
+    if small_n_table.limit != table_limit:
+        small_n_table.configure(table_limit)
+    if hasattr(target, 'RESULT_TYPE'):
+        # Make sure the target's table is built before timing starts, also in a spawned client
+        small_n_table.values(target.RESULT_TYPE)
+    call = target.execute
+    next_n = distribution.sampler(client_id, clients, seed)
+
+    delay = start_at - time.time()
+    if delay > 0:
+        time.sleep(delay)
+
+    latencies = []
+    errors = 0
+    first_error = None
+    measure_from = time.perf_counter() + warmup
+    deadline = measure_from + duration
+
+    while True:
+        n = next_n()
+        start_time = time.perf_counter()
+        try:
+            call(n)
+            failed = False
+        except Exception as e:
+            failed = True
+            if first_error is None:
+                # Kept as text: exceptions do not always survive the trip back from a client process
+                first_error = f"{type(e).__name__}: {e} (n={n})"
+        end_time = time.perf_counter()
+
+        if end_time > deadline:
+            break
+        if start_time >= measure_from:
+            if failed:
+                errors += 1
+            else:
+                latencies.append(end_time - start_time)
+
+    return latencies, errors, first_error
+
+
+class FibonacciLoadBenchmark:
+    """
+    A closed-loop load generator measuring throughput and tail latency of Fibonacci strategies.
+
+    Each of the K clients keeps exactly one request in flight for the whole run, so the offered
+    load adapts to the speed of the target, like a pool of synchronous callers in a service.
+    """
+
+    PERCENTILES = (50, 90, 99, 99.9)
+
+    def __init__(self, clients: int, duration: float, distribution: Any, warmup: float = 1.0,
+                 use_processes: bool = False, seed: int = 0, use_small_n_table: bool = False):
+        """
+        Initialize the FibonacciLoadBenchmark.
+
+        :param clients: Number of concurrent clients (K).
+        :param duration: Length of the measurement window per target in seconds.
+        :param distribution: Distribution of n values (uniform, Zipf or replayed trace).
+        :param warmup: Seconds of unmeasured load before each measurement window.
+        :param use_processes: Run clients in separate processes instead of threads. In-process
+                              strategies are CPU bound and serialized by the GIL when run in threads;
+                              threads are appropriate for service endpoints.
+        :param seed: Base seed for the per-client random generators.
+        :param use_small_n_table: Serve n below the small-n table limit from the table. Off by default,
+                                  so small n exercise the arithmetic rather than a lookup.
+        """
+        if clients <= 0:
+            raise ValueError("clients must be positive.")
+        self.clients = clients
+        self.duration = duration
+        self.distribution = distribution
+        self.warmup = warmup
+        self.use_processes = use_processes
+        self.seed = seed
+        self.use_small_n_table = use_small_n_table
+        self.results: Dict[str, Dict[str, Any]] = {}
+
+    @staticmethod
+    def _percentile(sorted_values: List[float], percentile: float) -> float:
+        """
+        Compute a nearest-rank percentile.
+
+        :param sorted_values: Values sorted in ascending order.
+        :param percentile: Percentile between 0 and 100.
+        :return: The percentile value.
+        """
+        rank = max(math.ceil(percentile / 100 * len(sorted_values)), 1)
+        return sorted_values[rank - 1]
+
+    def _summarize(self, latencies: List[float], errors: int) -> Dict[str, Any]:
+        """
+        Aggregate raw client latencies into throughput and latency statistics.
+
+        :param latencies: Latencies of all successful requests in seconds.
+        :param errors: Number of failed requests.
+        :return: Dictionary containing the load statistics.
+        """
+        latencies.sort()
+        summary = {
+            'clients': self.clients,
+            'requests': len(latencies),
+            'errors': errors,
+            'throughput': len(latencies) / self.duration,
+            'mean': sum(latencies) / len(latencies) if latencies else None,
+            'max': latencies[-1] if latencies else None,
+        }
+        for percentile in self.PERCENTILES:
+            key = f"p{percentile:g}".replace('.', '')
+            summary[key] = self._percentile(latencies, percentile) if latencies else None
+        return summary
+
+    def _drive(self, target: Any) -> Dict[str, Any]:
+        """
+        Drive a single target with all clients and collect its statistics.
+
+        :param target: Strategy or endpoint exposing ``execute(n)``.
+        :return: Dictionary containing the load statistics and the first exception raised by the target.
+        """
+        executor_class = ProcessPoolExecutor if self.use_processes else ThreadPoolExecutor
+        # Give process-based clients time to spawn so they all start at the same instant
+        start_at = time.time() + (1.0 if self.use_processes else 0.05)
+        table_limit = small_n_table.limit if self.use_small_n_table else 0
+
+        with small_n_table.override(table_limit), executor_class(max_workers=self.clients) as executor:
+            futures = [
+                executor.submit(_client_loop, target, self.distribution, client_id, self.clients, self.seed,
+                                start_at, self.warmup, self.duration, table_limit)
+                for client_id in range(self.clients)
+            ]
+            latencies = []
+            errors = 0
+            first_error = None
+            for future in futures:
+                client_latencies, client_errors, client_error = future.result()
+                latencies.extend(client_latencies)
+                errors += client_errors
+                first_error = first_error or client_error
+
+        summary = self._summarize(latencies, errors)
+        summary['first_error'] = first_error
+        return summary
+
+    def _write_results_to_json(self, filename: str) -> None:
+        """
+        Write load results to a JSON file.
+
+        :param filename: Name of the output JSON file.
+        """
+        with open(filename, 'w') as file:
+            json.dump(self.results, file, indent=2)
+
+    def _write_results_to_csv(self, filename: str) -> None:
+        """
+        Write load results to a CSV file with one row per target.
+
+        :param filename: Name of the output CSV file.
+        """
+        columns = ['clients', 'requests', 'errors', 'throughput', 'mean', 'p50', 'p90', 'p99', 'p999', 'max']
+        with open(filename, 'w', newline='') as file:
+            writer = csv.writer(file)
+            writer.writerow(['strategy'] + columns)
+            for strategy, result in self.results.items():
+                writer.writerow([strategy] + [result[column] for column in columns])
+
+    def run_load_benchmark(self, targets: List[Any], csv_filename: str, json_filename: str) -> None:
+        """
+        Run the load benchmark on the given targets one after another and save the results.
+
+        :param targets: Strategy objects or endpoints to drive.
+        :param csv_filename: Name of the output CSV file.
+        :param json_filename: Name of the output JSON file.
+        """
+        logging.info(f"Starting load benchmark with {self.clients} clients...")
+
+        for target in targets:
+            name = getattr(target, 'name', None) or target.__class__.__name__
+            logging.info(f"Driving {name} for {self.duration}s...")
+
+            result = self._drive(target)
+            self.results[name] = result
+
+            if result['requests']:
+                logging.info(f"{name}: {result['throughput']:.1f} req/s, p50 {result['p50']:.6f}s, "
+                             f"p99 {result['p99']:.6f}s, errors {result['errors']}")
+            else:
+                logging.warning(f"{name}: no request completed within the measurement window")
+            if result['first_error']:
+                logging.warning(f"{name}: requests failed, first error: {result['first_error']}")
+
+        if csv_filename:
+            self._write_results_to_csv(csv_filename)
+            logging.info(f"Results written to CSV: {csv_filename}")
+        if json_filename:
+            self._write_results_to_json(json_filename)
+            logging.info(f"Results written to JSON: {json_filename}")
+
+        logging.info("Load benchmark completed.")
+
+
+def run_fibonacci_load_benchmark(clients: int, duration: float, distribution: Any, targets: List[Any],
+                                 csv_filename: str, json_filename: str, warmup: float = 1.0,
+                                 use_processes: bool = False, seed: int = 0,
+                                 use_small_n_table: bool = False) -> Dict[str, Dict[str, Any]]:
+    """
+    Run a closed-loop load benchmark.
+
+    :param clients: Number of concurrent clients.
+    :param duration: Length of the measurement window per target in seconds.
+    :param distribution: Distribution of n values.
+    :param targets: Strategy objects or endpoints to drive.
+    :param csv_filename: Name of the output CSV file.
+    :param json_filename: Name of the output JSON file.
+    :param warmup: Seconds of unmeasured load before each measurement window.
+    :param use_processes: Run clients in separate processes instead of threads.
+    :param seed: Base seed for the per-client random generators.
+    :param use_small_n_table: Serve n below the small-n table limit from the table.
+    :return: Load statistics per target.
+    """
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    benchmark = FibonacciLoadBenchmark(clients=clients, duration=duration, distribution=distribution,
+                                       warmup=warmup, use_processes=use_processes, seed=seed,
+                                       use_small_n_table=use_small_n_table)
+    benchmark.run_load_benchmark(targets, csv_filename, json_filename)
+    return benchmark.results
+
+
+# Example usage:
+if __name__ == "__main__":
+    from src.Strategies.GMP.GMPDoublingFibonacciOptimized import GMPDoublingFibonacciOptimized
+    from src.Strategies.GMP.GMPIterativeFibonacci import GMPIterativeFibonacci
+    from src.Strategies.Primitive.ImprovedMatrixFibonnaci import ImprovedMatrixFibonnaci
+
+    run_fibonacci_load_benchmark(
+        clients=4,
+        duration=10,
+        distribution=ZipfDistribution(max_n=10000),
+        targets=[ImprovedMatrixFibonnaci(), GMPIterativeFibonacci(), GMPDoublingFibonacciOptimized()],
+        csv_filename='load.csv',
+        json_filename='load.json',
+        use_processes=True
+    )
@@ -0,0 +1,216 @@
+import csv
+import logging
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+from BenchmarkEnvironment import capture_environment, write_metadata_header
+from src.Strategies.FibonacciStrategy import WORD_TABLE_LIMIT, FibonacciStrategy, small_n_table
+
+DEFAULT_N_VALUES = (0, 1, 10, 50, 93, 94, 200, 500)
+
+# Strategies left out by default: exponential time, or a worker pool rather than a single call
+EXCLUDED_BY_DEFAULT = ('RecursiveFibonacci', 'GMPParallelDoublingFibonacci')
+
+
+class NullFibonacci(FibonacciStrategy):
+    """
+    Strategy that does no arithmetic and returns n.
+
+    Timing it measures what every call costs before any arithmetic happens: the method
+    dispatch, the small-n table check and the timing loop itself.
+    """
+
+    __slots__ = ()
+
+    def execute(self, n):
+        if 0 <= n < small_n_table.limit:
+            return small_n_table.int_values[n]
+        return n
+
+
+class UncheckedNullFibonacci(FibonacciStrategy):
+    """
+    NullFibonacci without the small-n table check.
+
+    Above the table limit, the difference to NullFibonacci is what the check costs every
+    strategy on every call.
+    """
+
+    __slots__ = ()
+
+    def execute(self, n):
+        return n
+
+
+class MicroBenchmark:
+    """
+    Measures the per-call overhead of strategies for small n, separately from their arithmetic.
+
+    Every strategy is timed at every n twice: once with the shared small-n table enabled and
+    once with it disabled. NullFibonacci, timed the same way, gives the dispatch cost, and the
+    time a strategy spends beyond that with the table disabled is its arithmetic (including
+    the per-call setup of constants and containers). The table limit itself is always timed:
+    it is the first n computed rather than looked up, so its two times should match, and
+    UncheckedNullFibonacci shows what the table check adds to them.
+
+    Calls are repeated in a tight loop until a minimum time has passed, and the fastest of
+    several repeats is reported, as timeit does.
+    """
+
+    def __init__(self, n_values: Sequence[int] = DEFAULT_N_VALUES, table_limit: int = WORD_TABLE_LIMIT,
+                 min_time: float = 0.02, repeat: int = 5):
+        """
+        Initialize the MicroBenchmark.
+
+        :param n_values: Input sizes to time; table_limit is added if missing.
+        :param table_limit: Size of the small-n table in the 'table' runs.
+        :param min_time: Minimum duration of one timing loop in seconds.
+        :param repeat: Number of timing loops per measurement; the fastest is used.
+        """
+        self.n_values = sorted(set(n_values) | {table_limit})
+        self.table_limit = table_limit
+        self.min_time = min_time
+        self.repeat = repeat
+        self.results: List[Dict[str, Any]] = []
+
+    def _per_call(self, execute: Any, n: int) -> float:
+        """
+        Time a single call.
+
+        :param execute: Bound execute method of a strategy.
+        :param n: Input size.
+        :return: Fastest time per call in seconds.
+        """
+        number = 1
+        while True:
+            start_time = time.perf_counter()
+            for _ in range(number):
+                execute(n)
+            elapsed = time.perf_counter() - start_time
+            if elapsed >= self.min_time:
+                break
+            number *= 2
+
+        best = elapsed / number
+        for _ in range(self.repeat - 1):
+            start_time = time.perf_counter()
+            for _ in range(number):
+                execute(n)
+            best = min(best, (time.perf_counter() - start_time) / number)
+        return best
+
+    def _time_all(self, strategies: Dict[str, FibonacciStrategy]) -> Dict[str, Dict[str, Dict[int, float]]]:
+        """
+        Time every strategy at every n, with and without the small-n table.
+
+        The two modes alternate per strategy and n, so a drift of the machine speed affects both alike.
+        Strategies read the table limit on every call, so the same objects serve both modes.
+
+        :param strategies: Strategy objects by name.
+        :return: Time per call in seconds, per mode ('table' or 'no_table'), strategy and n.
+        """
+        timings: Dict[str, Dict[str, Dict[int, float]]] = {'table': {}, 'no_table': {}}
+        for name, strategy in strategies.items():
+            for mode in timings:
+                timings[mode][name] = {}
+            for n in self.n_values:
+                for mode, limit in (('table', self.table_limit), ('no_table', 0)):
+                    with small_n_table.override(limit):
+                        timings[mode][name][n] = self._per_call(strategy.execute, n)
+        return timings
+
+    def run(self, strategy_names: List[str], csv_filename: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Run the overhead suite.
+
+        :param strategy_names: Names of the strategies to time (see the strategy registry).
+        :param csv_filename: Name of the output CSV file.
+        :return: Per strategy and n: the time per call in nanoseconds with and without the table,
+                 the dispatch cost and the arithmetic beyond it.
+        """
+        from src.Strategies.StrategyRegistry import registry
+
+        strategies = {name: registry.create(name) for name in strategy_names}
+        strategies['NullFibonacci'] = NullFibonacci()
+        strategies['UncheckedNullFibonacci'] = UncheckedNullFibonacci()
+        logging.info(f"Timing {len(strategies)} strategies with the small-n table limited to {self.table_limit} "
+                     f"and disabled...")
+        timings = self._time_all(strategies)
+
+        dispatch = timings['no_table']['NullFibonacci']
+        check = (timings['table']['NullFibonacci'][self.table_limit]
+                 - timings['table']['UncheckedNullFibonacci'][self.table_limit])
+        logging.info(f"The small-n table check costs {check * 1e9:.0f}ns per call at n={self.table_limit}")
+        self.results = []
+        for name in strategies:
+            for n in self.n_values:
+                with_table, without_table = timings['table'][name][n], timings['no_table'][name][n]
+                self.results.append({
+                    'strategy': name,
+                    'n': n,
+                    'table_ns': with_table * 1e9,
+                    'no_table_ns': without_table * 1e9,
+                    'dispatch_ns': dispatch[n] * 1e9,
+                    'arithmetic_ns': max(0.0, without_table - dispatch[n]) * 1e9,
+                })
+
+        if csv_filename:
+            self._write_results_to_csv(csv_filename)
+            logging.info(f"Results written to CSV: {csv_filename}")
+        return self.results
+
+    def _write_results_to_csv(self, filename: str) -> None:
+        """
+        Write the results to a CSV file, preceded by a metadata comment line.
+
+        :param filename: Name of the output CSV file.
+        """
+        metadata = capture_environment()
+        metadata['benchmark'] = {'n_values': self.n_values, 'table_limit': self.table_limit,
+                                 'min_time': self.min_time, 'repeat': self.repeat, 'micro': True}
+        columns = ['strategy', 'n', 'table_ns', 'no_table_ns', 'dispatch_ns', 'arithmetic_ns']
+        with open(filename, 'w', newline='') as file:
+            write_metadata_header(file, metadata)
+            writer = csv.DictWriter(file, fieldnames=columns)
+            writer.writeheader()
+            writer.writerows(self.results)
+
+
+def format_micro_results(results: List[Dict[str, Any]]) -> str:
+    """
+    Format the results as a plain-text table.
+
+    :param results: Result of MicroBenchmark.run.
+    :return: The table.
+    """
+    width = max([len('strategy')] + [len(row['strategy']) for row in results])
+    lines = [f"{'strategy':<{width}}  {'n':>6}  {'table':>10}  {'no table':>10}  {'dispatch':>10}  {'arithmetic':>10}"]
+    for row in results:
+        lines.append(f"{row['strategy']:<{width}}  {row['n']:>6}  {row['table_ns']:>8.0f}ns  "
+                     f"{row['no_table_ns']:>8.0f}ns  {row['dispatch_ns']:>8.0f}ns  {row['arithmetic_ns']:>8.0f}ns")
+    return '\n'.join(lines)
+
+
+def run_micro_benchmark(strategy_names: Optional[List[str]] = None, csv_filename: Optional[str] = None,
+                        **options: Any) -> List[Dict[str, Any]]:
+    """
+    Run the per-call overhead suite.
+
+    :param strategy_names: Names of the strategies to time; defaults to every registered strategy
+                           except those in EXCLUDED_BY_DEFAULT.
+    :param csv_filename: Name of the output CSV file.
+    :param options: Passed on to MicroBenchmark (n_values, table_limit, min_time, repeat).
+    :return: The results.
+    """
+    from src.Strategies.StrategyRegistry import registry
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    if strategy_names is None:
+        strategy_names = [name for name in registry.names() if name not in EXCLUDED_BY_DEFAULT]
+    return MicroBenchmark(**options).run(strategy_names, csv_filename)
+
+
+# Example usage (see FibonacciCLI.py for configurable runs):
+if __name__ == "__main__":
+    print(format_micro_results(run_micro_benchmark(csv_filename='micro.csv')))
@@ -0,0 +1,235 @@
+import bz2
+import gzip
+import json
+import logging
+import lzma
+import os
+import struct
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import Any, Dict, Iterator, List, Optional
+
+import gmpy2
+
+INDEX_FILENAME = 'index.json'
+
+# Opener and file name suffix per compression
+COMPRESSION = {
+    'none': (open, ''),
+    'gzip': (gzip.open, '.gz'),
+    'bz2': (bz2.open, '.bz2'),
+    'lzma': (lzma.open, '.xz'),
+}
+
+# File name extension per output format
+FORMATS = {
+    'decimal': '.txt',
+    'binary': '.bin',
+}
+
+# Binary records are a little-endian byte count followed by the little-endian magnitude
+LENGTH = struct.Struct('<Q')
+
+
+def _encode(value: 'gmpy2.mpz', output_format: str) -> bytes:
+    """
+    Encode a single Fibonacci number.
+
+    :param value: The number.
+    :param output_format: 'decimal' (one number per line) or 'binary' (length-prefixed bytes).
+    :return: The encoded record.
+    """
+    if output_format == 'decimal':
+        # GMP's subquadratic conversion; also not subject to Python's int-to-str digit limit
+        return value.digits(10).encode('ascii') + b'\n'
+    magnitude = int(value).to_bytes((value.bit_length() + 7) // 8, 'little')
+    return LENGTH.pack(len(magnitude)) + magnitude
+
+
+def _write_chunk(directory: str, index: int, start: int, stop: int, output_format: str,
+                 compression: str) -> Dict[str, Any]:
+    """
+    Generate F(start) .. F(stop - 1) and write them to one chunk file.
+
+    Runs in a worker process. The chunk is seeded with F(start) and F(start + 1) from GMP's
+    fast doubling and continued by additions, and every value is encoded and written as soon
+    as it is generated, so memory holds only two values and the compressor's buffer.
+
+    :param directory: Output directory.
+    :param index: Chunk number.
+    :param start: First index of the chunk.
+    :param stop: Exclusive last index of the chunk.
+    :param output_format: 'decimal' or 'binary'.
+    :param compression: One of the keys of COMPRESSION.
+    :return: The chunk's entry for the index file.
+    """
+    opener, suffix = COMPRESSION[compression]
+    filename = f"chunk_{index:06d}{FORMATS[output_format]}{suffix}"
+    path = os.path.join(directory, filename)
+    temporary_path = path + '.tmp'
+
+    b, a = gmpy2.fib2(start + 1)  # (F(start + 1), F(start))
+    raw_bytes = 0
+    with opener(temporary_path, 'wb') as file:
+        for _ in range(start, stop):
+            record = _encode(a, output_format)
+            file.write(record)
+            raw_bytes += len(record)
+            a, b = b, a + b
+    os.replace(temporary_path, path)
+
+    return {
+        'file': filename,
+        'start': start,
+        'stop': stop,
+        'raw_bytes': raw_bytes,
+        'bytes': os.path.getsize(path),
+    }
+
+
+class SequenceExporter:
+    """
+    Writes F(0) .. F(count - 1) to chunked files in parallel, in bounded memory.
+
+    Every chunk is generated, converted and written by a worker process on its own: the
+    worker seeds its range with fast doubling and continues by additions, so no chunk depends
+    on another and no values are sent between processes. At most `max_in_flight` chunks are
+    queued at a time. An index file lists the chunks in order together with their ranges and
+    sizes; read_sequence reads the sequence back from it.
+    """
+
+    def __init__(self, directory: str, chunk_size: int = 10000, output_format: str = 'decimal',
+                 compression: str = 'none', workers: Optional[int] = None, max_in_flight: Optional[int] = None):
+        """
+        Initialize the SequenceExporter.
+
+        :param directory: Output directory (created if needed).
+        :param chunk_size: Number of values per chunk file.
+        :param output_format: 'decimal' (one number per line) or 'binary' (length-prefixed little-endian bytes).
+        :param compression: 'none', 'gzip', 'bz2' or 'lzma'.
+        :param workers: Number of worker processes (defaults to the number of CPUs).
+        :param max_in_flight: Maximum number of queued or running chunks (defaults to twice the workers).
+        """
+        if output_format not in FORMATS:
+            raise ValueError(f"Unknown format '{output_format}'. Choose one of {', '.join(FORMATS)}.")
+        if compression not in COMPRESSION:
+            raise ValueError(f"Unknown compression '{compression}'. Choose one of {', '.join(COMPRESSION)}.")
+        self.directory = directory
+        self.chunk_size = chunk_size
+        self.output_format = output_format
+        self.compression = compression
+        self.workers = workers or os.cpu_count() or 1
+        self.max_in_flight = max_in_flight or 2 * self.workers
+
+    def export(self, count: int) -> Dict[str, Any]:
+        """
+        Export F(0) .. F(count - 1).
+
+        :param count: Number of values to export.
+        :return: Summary with the number of chunks, raw and written bytes, elapsed time and throughput in MB/s.
+        """
+        from tqdm import tqdm
+
+        os.makedirs(self.directory, exist_ok=True)
+        starts = range(0, count, self.chunk_size)
+        chunks: Dict[int, Dict[str, Any]] = {}
+        started = time.perf_counter()
+
+        with ProcessPoolExecutor(max_workers=self.workers) as executor, \
+                tqdm(total=len(starts), desc="Exporting chunks") as pbar:
+            pending: Dict[Future, int] = {}
+            for index, start in enumerate(starts):
+                if len(pending) >= self.max_in_flight:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        chunks[pending.pop(future)] = future.result()
+                        pbar.update(1)
+                future = executor.submit(_write_chunk, self.directory, index, start,
+                                         min(start + self.chunk_size, count), self.output_format, self.compression)
+                pending[future] = index
+            for future in wait(pending).done:
+                chunks[pending[future]] = future.result()
+                pbar.update(1)
+
+        elapsed = time.perf_counter() - started
+        raw_bytes = sum(chunk['raw_bytes'] for chunk in chunks.values())
+        written_bytes = sum(chunk['bytes'] for chunk in chunks.values())
+        summary = {
+            'count': count,
+            'chunks': len(chunks),
+            'raw_bytes': raw_bytes,
+            'bytes': written_bytes,
+            'elapsed': elapsed,
+            'raw_mb_per_s': raw_bytes / elapsed / 1e6 if elapsed > 0 else None,
+            'mb_per_s': written_bytes / elapsed / 1e6 if elapsed > 0 else None,
+        }
+        self._write_index(count, [chunks[index] for index in sorted(chunks)])
+
+        logging.info(f"Exported {count} Fibonacci numbers in {len(chunks)} chunks to {self.directory}: "
+                     f"{raw_bytes / 1e6:.1f} MB ({written_bytes / 1e6:.1f} MB written) in {elapsed:.2f} seconds, "
+                     f"{summary['raw_mb_per_s'] or 0:.1f} MB/s")
+        return summary
+
+    def _write_index(self, count: int, chunks: List[Dict[str, Any]]) -> None:
+        """
+        Write the index file listing the chunks in order.
+
+        :param count: Number of exported values.
+        :param chunks: Chunk entries in order.
+        """
+        index = {
+            'count': count,
+            'chunk_size': self.chunk_size,
+            'format': self.output_format,
+            'compression': self.compression,
+            'chunks': chunks,
+        }
+        with open(os.path.join(self.directory, INDEX_FILENAME), 'w') as file:
+            json.dump(index, file, indent=2)
+
+
+def read_sequence(directory: str, start: int = 0) -> Iterator['gmpy2.mpz']:
+    """
+    Read an exported sequence back, one value at a time.
+
+    :param directory: Directory written by SequenceExporter.
+    :param start: Index of the first value to return; chunks before it are not opened.
+    :return: Iterator over F(start), F(start + 1), ... as GMP integers.
+    """
+    with open(os.path.join(directory, INDEX_FILENAME), 'r') as file:
+        index = json.load(file)
+    opener, _ = COMPRESSION[index['compression']]
+
+    for chunk in index['chunks']:
+        if chunk['stop'] <= start:
+            continue
+        position = chunk['start']
+        with opener(os.path.join(directory, chunk['file']), 'rb') as file:
+            while position < chunk['stop']:
+                if index['format'] == 'decimal':
+                    value = gmpy2.mpz(file.readline().rstrip(b'\n').decode('ascii'))
+                else:
+                    length, = LENGTH.unpack(file.read(LENGTH.size))
+                    value = gmpy2.mpz(int.from_bytes(file.read(length), 'little'))
+                if position >= start:
+                    yield value
+                position += 1
+
+
+def export_sequence(count: int, directory: str, **options: Any) -> Dict[str, Any]:
+    """
+    Export F(0) .. F(count - 1) to chunked files.
+
+    :param count: Number of values to export.
+    :param directory: Output directory.
+    :param options: Passed on to SequenceExporter (chunk_size, output_format, compression, workers, max_in_flight).
+    :return: Summary including the throughput in MB/s.
+    """
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    return SequenceExporter(directory, **options).export(count)
+
+
+# Example usage (see FibonacciCLI.py for configurable runs):
+if __name__ == "__main__":
+    export_sequence(100000, 'fibonacci_sequence', chunk_size=5000, compression='gzip')
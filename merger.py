@@ -3,20 +3,61 @@ import argparse
 import sys
 from collections import defaultdict
 
-def merge_csv_files_builtin(file_list, output_file):
+from BenchmarkEnvironment import incompatibilities, read_metadata, skip_comment_lines, write_metadata_header
+
+
+def check_compatible_runs(file_list):
+    """
+    Checks that the embedded run metadata of all files describes compatible environments.
+
+    Parameters:
+    - file_list: List of result file paths.
+
+    Returns:
+    - Tuple of (list of problems, metadata of the first file that has any).
+    """
+    problems = []
+    reference_file, reference = None, None
+    for file in file_list:
+        metadata = read_metadata(file)
+        if metadata is None:
+            problems.append(f"{file} has no run metadata")
+        elif reference is None:
+            reference_file, reference = file, metadata
+        else:
+            problems.extend(f"{file} differs from {reference_file} in {difference}"
+                            for difference in incompatibilities(reference, metadata))
+    return problems, reference
+
+
+def merge_csv_files_builtin(file_list, output_file, force=False):
     """
     Merges multiple CSV files by averaging the 'time' for duplicate 'strategy' and 'n' entries using the built-in csv module.
 
+    Files whose embedded run metadata describes different machines or software versions are
+    refused unless force is set.
+
     Parameters:
     - file_list: List of input CSV file paths.
     - output_file: Path to the output CSV file.
+    - force: Merge even if the runs are incompatible or lack metadata.
+
+    Returns:
+    - True if the merged file was written, False otherwise.
     """
+    problems, metadata = check_compatible_runs(file_list)
+    for problem in problems:
+        print(f"{'Warning' if force else 'Error'}: {problem}", file=sys.stderr)
+    if problems and not force:
+        print("Refusing to merge incompatible runs (use --force to override).", file=sys.stderr)
+        return False
+
     data = defaultdict(list)
 
     for file in file_list:
         try:
             with open(file, 'r', newline='') as f:
-                reader = csv.DictReader(f)
+                reader = csv.DictReader(skip_comment_lines(f))
                 # Check for required columns
                 if not {'strategy', 'n', 'time'}.issubset(reader.fieldnames):
                     print(f"Error: File {file} does not contain required columns.", file=sys.stderr)
@@ -33,7 +74,7 @@ def merge_csv_files_builtin(file_list, output_file):
 
     if not data:
         print("No valid data to process.", file=sys.stderr)
-        return
+        return False
 
     # Compute average times
     merged_data = []
@@ -47,6 +88,8 @@ def merge_csv_files_builtin(file_list, output_file):
     # Write to output CSV
     try:
         with open(output_file, 'w', newline='') as f:
+            if metadata is not None:
+                write_metadata_header(f, dict(metadata, merged_from=list(file_list)))
             writer = csv.DictWriter(f, fieldnames=['strategy', 'n', 'time'])
             writer.writeheader()
             for row in merged_data:
@@ -54,15 +97,19 @@ def merge_csv_files_builtin(file_list, output_file):
         print(f"Merged CSV saved to {output_file}")
     except Exception as e:
         print(f"Error writing to {output_file}: {e}", file=sys.stderr)
+        return False
+    return True
 
 def main():
     parser = argparse.ArgumentParser(description='Merge CSV files by averaging times for identical strategy and n using built-in csv module.')
     parser.add_argument('input_files', nargs='+', help='List of input CSV files to merge.')
     parser.add_argument('-o', '--output', default='merged_output.csv', help='Output CSV file name (default: merged_output.csv)')
+    parser.add_argument('-f', '--force', action='store_true', help='Merge even if the run metadata is missing or incompatible.')
 
     args = parser.parse_args()
 
-    merge_csv_files_builtin(args.input_files, args.output)
+    if not merge_csv_files_builtin(args.input_files, args.output, args.force):
+        sys.exit(1)
 
 if __name__ == '__main__':
     main()
@@ -1,10 +1,140 @@
+from contextlib import contextmanager
+
+# F(93) is the largest Fibonacci number that fits in an unsigned 64-bit machine word
+WORD_TABLE_LIMIT = 94
+
+
+class SmallNTable:
+    """
+    Lookup table of F(0) .. F(limit - 1) shared by all strategies.
+
+    For small n the cost of every strategy is pure overhead (method dispatch, building
+    matrices, converting constants), so each strategy's execute answers n below the limit
+    from this table:
+
+        if 0 <= n < small_n_table.limit:
+            return small_n_table.int_values[n]
+
+    The check reads the limit on every call, so configure() applies to existing strategies
+    too. The default limit covers the machine-word range; raising it extends the table into
+    the bignum range, and a limit of 0 disables it.
+
+    int_values and mpz_values hold the table as Python and as GMP integers, so a strategy
+    returns the same type from the table as from its arithmetic. A table is kept for every
+    result type asked for through values(), which happens when a strategy class is defined, and
+    configure() keeps each of those at least limit entries long; lowering the limit keeps the
+    longer tables. The GMP table is therefore only built once a GMP strategy exists. The class deliberately has no __getattr__ or properties, which would keep the interpreter
+    from specializing the attribute reads of the check.
+    """
+
+    RESULT_TYPES = ('int', 'mpz')
+
+    def __init__(self, limit=WORD_TABLE_LIMIT):
+        """
+        Initialize the table.
+
+        Args:
+            limit (int): Number of entries, i.e. the first n that is not looked up.
+        """
+        self.int_values = self._build('int', limit)
+        self.mpz_values = ()
+        self.limit = limit
+        # Result types whose tables are kept up to date with the limit
+        self._result_types = {'int'}
+
+    @staticmethod
+    def _build(result_type, limit):
+        """
+        Build F(0) .. F(limit - 1) by additions.
+
+        Args:
+            result_type (str): 'int' for Python integers or 'mpz' for GMP integers.
+            limit (int): Number of entries.
+
+        Returns:
+            tuple: The table.
+        """
+        if result_type == 'mpz':
+            import gmpy2
+            a, b = gmpy2.mpz(0), gmpy2.mpz(1)
+        else:
+            a, b = 0, 1
+        values = []
+        for _ in range(limit):
+            values.append(a)
+            a, b = b, a + b
+        return tuple(values)
+
+    def configure(self, limit=WORD_TABLE_LIMIT):
+        """
+        Change the number of entries.
+
+        Args:
+            limit (int): Number of entries; 0 disables the table.
+        """
+        # Extend the tables in use before raising the limit, so a concurrent lookup never reads
+        # past their end
+        for result_type in self._result_types:
+            if len(getattr(self, f'{result_type}_values')) < limit:
+                setattr(self, f'{result_type}_values', self._build(result_type, limit))
+        self.limit = limit
+
+    @contextmanager
+    def override(self, limit):
+        """
+        Change the number of entries for the duration of a with block.
+
+        Args:
+            limit (int): Number of entries; 0 disables the table.
+        """
+        previous = self.limit
+        self.configure(limit)
+        try:
+            yield self
+        finally:
+            self.configure(previous)
+
+    def values(self, result_type='int'):
+        """
+        Return the table, building it if it is shorter than the limit, and keep it up to date with the limit.
+
+        Args:
+            result_type (str): 'int' for Python integers or 'mpz' for GMP integers.
+
+        Returns:
+            tuple: At least F(0) .. F(limit - 1).
+        """
+        if result_type not in self.RESULT_TYPES:
+            raise ValueError(f"Unknown result type '{result_type}'")
+        self._result_types.add(result_type)
+        name = f'{result_type}_values'
+        if len(getattr(self, name)) < self.limit:
+            setattr(self, name, self._build(result_type, self.limit))
+        return getattr(self, name)
+
+
+# Shared default table
+small_n_table = SmallNTable()
+
+
 class FibonacciStrategy:
-    def __init__(self):
-        pass
+    """
+    Base class of all strategies.
 
-    def execute(self, n):
-        pass
+    Subclasses implement execute(n) and start it with the small_n_table check (see SmallNTable),
+    using mpz_values instead of int_values if they set RESULT_TYPE to 'mpz'. Strategies use
+    __slots__ to keep attribute access and construction cheap.
+    """
 
+    __slots__ = ()
 
+    RESULT_TYPE = 'int'
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Set up the table of the strategy's result type when the class is defined. That also happens
+        # when a spawned process unpickles a strategy, and it is never part of a timed call.
+        small_n_table.values(cls.RESULT_TYPE)
 
+    def execute(self, n):
+        pass
@@ -1,6 +1,6 @@
 import gmpy2
 
-from src.Strategies.FibonacciStrategy import FibonacciStrategy
+from src.Strategies.FibonacciStrategy import FibonacciStrategy, small_n_table
 
 
 class GMPDoublingFibonacci(FibonacciStrategy):
@@ -15,8 +15,17 @@ class GMPDoublingFibonacci(FibonacciStrategy):
     effectively doubling the index with each operation.
     """
 
+    __slots__ = ()
+    RESULT_TYPE = 'mpz'
+
+    # Preconstructed constants: the base case (F(0), F(1)) and the factor 2 of the doubling formula
+    BASE_CASE = (gmpy2.mpz(0), gmpy2.mpz(1))
+    MPZ_2 = gmpy2.mpz(2)
+
     def execute(self, n):
         """Execute the Fibonacci calculation for the given index."""
+        if 0 <= n < small_n_table.limit:
+            return small_n_table.mpz_values[n]
         return self.fibonacci_doubling_mpz(n)
 
     def fibonacci_doubling_mpz(self, n):
@@ -29,13 +38,15 @@ class GMPDoublingFibonacci(FibonacciStrategy):
         Returns:
             gmpy2.mpz: The nth Fibonacci number as a GMP integer.
         """
+        base_case, mpz_2 = self.BASE_CASE, self.MPZ_2
+
         def _fibonacci_doubling_mpz(n):
             if n == 0:
-                return (gmpy2.mpz(0), gmpy2.mpz(1))
+                return base_case
             else:
                 # Recursively compute F(n/2) and F(n/2 + 1)
                 a, b = _fibonacci_doubling_mpz(n >> 1)  # n >> 1 is equivalent to n // 2
-                c = a * (gmpy2.mpz(2) * b - a)  # Compute F(n) using the doubling formula
+                c = a * (mpz_2 * b - a)  # Compute F(n) using the doubling formula
                 d = a * a + b * b  # Compute F(n+1)
                 if n & 1:  # If n is odd
                     return (d, c + d)  # Return F(n+1) and F(n+2)
@@ -1,4 +1,4 @@
-from src.Strategies.FibonacciStrategy import FibonacciStrategy
+from src.Strategies.FibonacciStrategy import FibonacciStrategy, small_n_table
 import gmpy2
 
 class GMPDoublingFibonacciOptimized(FibonacciStrategy):
@@ -11,6 +11,9 @@ class GMPDoublingFibonacciOptimized(FibonacciStrategy):
     3. Using bit manipulation for faster operations.
     """
 
+    __slots__ = ('mpz_0', 'mpz_1', 'mpz_2')
+    RESULT_TYPE = 'mpz'
+
     def __init__(self):
         super().__init__()
         # Pre-compute commonly used GMP integers for efficiency
@@ -20,6 +23,8 @@ class GMPDoublingFibonacciOptimized(FibonacciStrategy):
 
     def execute(self, n):
         """Execute the Fibonacci calculation for the given index."""
+        if 0 <= n < small_n_table.limit:
+            return small_n_table.mpz_values[n]
         return self.fibonacci_doubling_mpz(n)
 
     def fibonacci_doubling_mpz(self, n):
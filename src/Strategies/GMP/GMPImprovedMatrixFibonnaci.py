@@ -1,6 +1,6 @@
 import gmpy2
 
-from src.Strategies.FibonacciStrategy import FibonacciStrategy
+from src.Strategies.FibonacciStrategy import FibonacciStrategy, small_n_table
 
 
 class GMPImprovedMatrixFibonnaci(FibonacciStrategy):
@@ -15,8 +15,16 @@ class GMPImprovedMatrixFibonnaci(FibonacciStrategy):
     GMP overhead, but it excels for large Fibonacci calculations.
     """
 
+    __slots__ = ()
+    RESULT_TYPE = 'mpz'
+
+    MPZ_0 = gmpy2.mpz(0)
+    MPZ_1 = gmpy2.mpz(1)
+
     def execute(self, n):
         """Execute the GMP modular arithmetic method to calculate the nth Fibonacci number."""
+        if 0 <= n < small_n_table.limit:
+            return small_n_table.mpz_values[n]
         return self.mat_fib_mpz(n)
 
     def mat_fib_mpz(self, n):
@@ -27,12 +35,9 @@ class GMPImprovedMatrixFibonnaci(FibonacciStrategy):
         combining the memory efficiency of ModularArithmeticFibonacci with GMP's
         ability to handle arbitrarily large integers.
         """
-        a = gmpy2.mpz(0)
-        b = gmpy2.mpz(1)
-        c = gmpy2.mpz(1)
-        d = gmpy2.mpz(1)
-        x = gmpy2.mpz(0)
-        z = gmpy2.mpz(1)
+        # mpz values are immutable, so the preconstructed constants can be shared
+        a, b, c, d = self.MPZ_0, self.MPZ_1, self.MPZ_1, self.MPZ_1
+        x, z = self.MPZ_0, self.MPZ_1
 
         while n > 0:
             n, r = divmod(n, 2)
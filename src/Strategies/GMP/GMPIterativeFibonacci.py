@@ -1,5 +1,5 @@
 
-from src.Strategies.FibonacciStrategy import FibonacciStrategy
+from src.Strategies.FibonacciStrategy import FibonacciStrategy, small_n_table
 import gmpy2
 
 class GMPIterativeFibonacci(FibonacciStrategy):
@@ -13,6 +13,12 @@ class GMPIterativeFibonacci(FibonacciStrategy):
     However, it becomes significantly faster and more memory-efficient for large Fibonacci numbers.
     """
 
+    __slots__ = ()
+    RESULT_TYPE = 'mpz'
+
+    MPZ_0 = gmpy2.mpz(0)
+    MPZ_1 = gmpy2.mpz(1)
+
     def execute(self, n):
         """
         Execute the Fibonacci calculation for the given number using GMP.
@@ -23,6 +29,8 @@ class GMPIterativeFibonacci(FibonacciStrategy):
         Returns:
             gmpy2.mpz: The nth Fibonacci number as a GMP integer.
         """
+        if 0 <= n < small_n_table.limit:
+            return small_n_table.mpz_values[n]
         return self.fib(n)
 
     def fib(self, n):
@@ -39,8 +47,8 @@ class GMPIterativeFibonacci(FibonacciStrategy):
         Returns:
             gmpy2.mpz: The nth Fibonacci number as a GMP integer.
         """
-        # Initialize a and b as GMP integers
-        a, b = gmpy2.mpz(0), gmpy2.mpz(1)
+        # Initialize a and b as (preconstructed) GMP integers
+        a, b = self.MPZ_0, self.MPZ_1
         for _ in range(n):
             # Update a and b using GMP arithmetic operations
             # This is similar to the standard iterative approach, but uses GMP's
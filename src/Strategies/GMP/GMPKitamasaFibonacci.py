@@ -0,0 +1,31 @@
+from src.Strategies.FibonacciStrategy import FibonacciStrategy, small_n_table
+from src.Strategies.LinearRecurrence import LinearRecurrence
+
+
+class GMPKitamasaFibonacci(FibonacciStrategy):
+    """
+    Calculates Fibonacci numbers with the general linear-recurrence engine on GMP integers.
+
+    This is KitamasaFibonacci with the engine's 'gmpy2' backend, for comparison with the
+    hand-written GMP strategies.
+    """
+
+    __slots__ = ('method', 'recurrence')
+    RESULT_TYPE = 'mpz'
+
+    def __init__(self, method='kitamasa'):
+        """
+        Initialize the strategy.
+
+        Args:
+            method (str): 'kitamasa' or 'matrix' (companion matrix power, like GMPMatrixFibonacci).
+        """
+        super().__init__()
+        self.method = method
+        self.recurrence = LinearRecurrence.fibonacci(backend='gmpy2')
+
+    def execute(self, n):
+        """Execute the linear-recurrence engine to calculate the nth Fibonacci number."""
+        if 0 <= n < small_n_table.limit:
+            return small_n_table.mpz_values[n]
+        return self.recurrence.term(n, self.method)
@@ -1,4 +1,4 @@
-from src.Strategies.FibonacciStrategy import FibonacciStrategy
+from src.Strategies.FibonacciStrategy import FibonacciStrategy, small_n_table
 import gmpy2
 
 class GMPMatrixFibonacci(FibonacciStrategy):
@@ -12,14 +12,22 @@ class GMPMatrixFibonacci(FibonacciStrategy):
     for small Fibonacci numbers but becomes significantly faster for large numbers.
     """
 
+    __slots__ = ()
+    RESULT_TYPE = 'mpz'
+
+    # Preconstructed, immutable base and identity matrices, so no mpz is created per call
+    BASE_MATRIX = ((gmpy2.mpz(1), gmpy2.mpz(1)), (gmpy2.mpz(1), gmpy2.mpz(0)))
+    IDENTITY = ((gmpy2.mpz(1), gmpy2.mpz(0)), (gmpy2.mpz(0), gmpy2.mpz(1)))
+
     def execute(self, n):
         """Execute the GMP matrix method to calculate the nth Fibonacci number."""
+        if 0 <= n < small_n_table.limit:
+            return small_n_table.mpz_values[n]
         return self.fibonacci_matrix(n)
 
     def fibonacci_matrix(self, n):
         """Calculate the nth Fibonacci number using GMP matrix exponentiation."""
-        F = [[gmpy2.mpz(1), gmpy2.mpz(1)], [gmpy2.mpz(1), gmpy2.mpz(0)]]  # Base matrix
-        result = self.matrix_pow(F, n)
+        result = self.matrix_pow(self.BASE_MATRIX, n)
         return result[0][1]  # The nth Fibonacci number
 
     @staticmethod
@@ -42,7 +50,7 @@ class GMPMatrixFibonacci(FibonacciStrategy):
         This method combines the efficiency of fast exponentiation with GMP's
         ability to handle arbitrarily large integers.
         """
-        result = [[gmpy2.mpz(1), gmpy2.mpz(0)], [gmpy2.mpz(0), gmpy2.mpz(1)]]  # Identity matrix
+        result = self.IDENTITY
         while p > 0:
             if p & 1:
                 result = self.matrix_mult(result, mat)
@@ -0,0 +1,166 @@
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import gmpy2
+
+from src.Strategies.FibonacciStrategy import FibonacciStrategy, small_n_table
+
+
+def _shared_product(input_name, a_offset, a_length, b_offset, b_length, output_name, output_offset):
+    """
+    Multiply two integers stored as raw little-endian limbs in shared memory.
+
+    Runs in a worker process. Operands are read from the input segment and the product is
+    written back into the output segment, so no megabyte-sized integer is ever pickled.
+
+    Returns:
+        int: Number of bytes written at output_offset.
+    """
+    source = shared_memory.SharedMemory(name=input_name)
+    target = shared_memory.SharedMemory(name=output_name)
+    try:
+        a = gmpy2.mpz.from_bytes(source.buf[a_offset:a_offset + a_length], 'little')
+        b = gmpy2.mpz.from_bytes(source.buf[b_offset:b_offset + b_length], 'little')
+        product = a * b
+        length = (product.bit_length() + 7) // 8
+        target.buf[output_offset:output_offset + length] = product.to_bytes(length, 'little')
+        return length
+    finally:
+        source.close()
+        target.close()
+
+
+class GMPParallelDoublingFibonacci(FibonacciStrategy):
+    """
+    Parallel version of the bit-walking doubling method for a single huge n.
+
+    Every doubling step needs three independent products: F(k)^2, F(k+1)^2 and
+    F(k) * (2*F(k+1) - F(k)). Once the operands exceed the size threshold these products are
+    computed concurrently in worker processes. Operands and results travel through shared
+    memory as raw bytes rather than being pickled. Below the threshold, and with zero
+    workers, the steps run serially exactly like GMPDoublingFibonacciOptimized.
+
+    The worker pool and shared memory are created lazily on first use; call close() (or use
+    the strategy as a context manager) to release them.
+    """
+
+    __slots__ = ('workers', 'threshold_bits', 'mpz_0', 'mpz_1', '_executor', '_input', '_output')
+    RESULT_TYPE = 'mpz'
+
+    def __init__(self, workers=3, threshold_bits=1_000_000):
+        """
+        Initialize the strategy.
+
+        Args:
+            workers (int): Number of worker processes; 0 computes everything serially. More than
+                three workers do not help since each step has only three independent products.
+            threshold_bits (int): Operand size from which the products are computed in parallel.
+        """
+        super().__init__()
+        self.workers = workers
+        self.threshold_bits = threshold_bits
+        self.mpz_0 = gmpy2.mpz(0)
+        self.mpz_1 = gmpy2.mpz(1)
+        self._executor = None
+        self._input = None
+        self._output = None
+
+    def __getstate__(self):
+        # Pools and shared memory segments belong to the creating process
+        return {'workers': self.workers, 'threshold_bits': self.threshold_bits}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Shut down the worker pool and release the shared memory segments."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        for segment in (self._input, self._output):
+            if segment is not None:
+                segment.close()
+                segment.unlink()
+        self._input = self._output = None
+
+    def execute(self, n):
+        """Execute the Fibonacci calculation for the given index."""
+        if 0 <= n < small_n_table.limit:
+            return small_n_table.mpz_values[n]
+        return self.fibonacci_doubling_mpz(n)
+
+    def fibonacci_doubling_mpz(self, n):
+        """
+        Calculate the nth Fibonacci number using the doubling method, parallelizing large steps.
+
+        Args:
+            n (int): The index of the Fibonacci number to calculate.
+
+        Returns:
+            gmpy2.mpz: The nth Fibonacci number as a GMP integer.
+        """
+        if n == 0:
+            return self.mpz_0
+
+        a, b = self.mpz_0, self.mpz_1
+        for i in range(n.bit_length() - 1, -1, -1):
+            t = (b << 1) - a
+            if self.workers and a.bit_length() >= self.threshold_bits:
+                a_squared, b_squared, c = self._parallel_products(a, b, t)
+            else:
+                a_squared, b_squared, c = a * a, b * b, a * t
+            # F(2k) = F(k) * [2*F(k+1) - F(k)], F(2k+1) = F(k+1)^2 + F(k)^2
+            d = a_squared + b_squared
+
+            if (n >> i) & 1:
+                a, b = d, c + d
+            else:
+                a, b = c, d
+
+        return a
+
+    @staticmethod
+    def _ensure_segment(segment, size):
+        """Return a shared memory segment of at least the given size, replacing a smaller one."""
+        if segment is None:
+            return shared_memory.SharedMemory(create=True, size=size)
+        if segment.size >= size:
+            return segment
+        # Grow geometrically so the segments are only reallocated a few times per calculation
+        size = max(size, 2 * segment.size)
+        segment.close()
+        segment.unlink()
+        return shared_memory.SharedMemory(create=True, size=size)
+
+    def _parallel_products(self, a, b, t):
+        """Compute a*a, b*b and a*t concurrently in the worker pool."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+
+        operands = [x.to_bytes((x.bit_length() + 7) // 8, 'little') for x in (a, b, t)]
+        offsets = [0, len(operands[0]), len(operands[0]) + len(operands[1])]
+        self._input = self._ensure_segment(self._input, offsets[2] + len(operands[2]))
+        for offset, data in zip(offsets, operands):
+            self._input.buf[offset:offset + len(data)] = data
+
+        # Each product has at most as many bytes as its two factors together
+        pairs = [(0, 0), (1, 1), (0, 2)]
+        capacities = [len(operands[x]) + len(operands[y]) for x, y in pairs]
+        output_offsets = [0, capacities[0], capacities[0] + capacities[1]]
+        self._output = self._ensure_segment(self._output, sum(capacities))
+
+        futures = [
+            self._executor.submit(_shared_product, self._input.name, offsets[x], len(operands[x]),
+                                  offsets[y], len(operands[y]), self._output.name, output_offset)
+            for (x, y), output_offset in zip(pairs, output_offsets)
+        ]
+        return [
+            gmpy2.mpz.from_bytes(self._output.buf[offset:offset + future.result()], 'little')
+            for future, offset in zip(futures, output_offsets)
+        ]
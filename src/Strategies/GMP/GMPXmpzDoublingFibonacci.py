@@ -0,0 +1,61 @@
+import gmpy2
+
+from src.Strategies.FibonacciStrategy import FibonacciStrategy, small_n_table
+from src.Strategies.GMP.XmpzRegisters import fibonacci_limbs, preallocated_xmpz
+
+
+class GMPXmpzDoublingFibonacci(FibonacciStrategy):
+    """
+    Implements the bit-walking doubling method using mutable GMP integers (gmpy2.xmpz).
+
+    Each step of GMPDoublingFibonacciOptimized allocates 2*b, 2*b - a, the three products and
+    two sums. Here the same formulas are evaluated in place on three preallocated registers,
+    so no big integer is allocated or freed inside the loop.
+    """
+
+    __slots__ = ()
+    RESULT_TYPE = 'mpz'
+
+    def execute(self, n):
+        """Execute the Fibonacci calculation for the given index."""
+        if 0 <= n < small_n_table.limit:
+            return small_n_table.mpz_values[n]
+        return self.fibonacci_doubling_xmpz(n)
+
+    def fibonacci_doubling_xmpz(self, n):
+        """
+        Calculate the nth Fibonacci number using the in-place doubling method.
+
+        Args:
+            n (int): The index of the Fibonacci number to calculate.
+
+        Returns:
+            gmpy2.mpz: The nth Fibonacci number as a GMP integer.
+        """
+        if n == 0:
+            return gmpy2.mpz(0)
+
+        limbs = fibonacci_limbs(n + 2)
+        a, b, t = preallocated_xmpz(limbs), preallocated_xmpz(limbs), preallocated_xmpz(limbs)
+        b += 1
+
+        # Iterate through the bits of n from left to right
+        for i in range(n.bit_length() - 1, -1, -1):
+            # t = F(2k) = F(k) * [2*F(k+1) - F(k)]
+            t ^= t
+            t += b
+            t <<= 1
+            t -= a
+            t *= a
+            # b = F(2k+1) = F(k+1)^2 + F(k)^2
+            a *= a
+            b *= b
+            b += a
+            a, t = t, a
+
+            if (n >> i) & 1:
+                # Shift to F(2k+1), F(2k+2)
+                a += b
+                a, b = b, a
+
+        return gmpy2.mpz(a)
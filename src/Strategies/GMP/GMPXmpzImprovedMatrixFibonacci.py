@@ -0,0 +1,71 @@
+import gmpy2
+
+from src.Strategies.FibonacciStrategy import FibonacciStrategy, small_n_table
+from src.Strategies.GMP.XmpzRegisters import fibonacci_limbs, preallocated_xmpz
+
+
+class GMPXmpzImprovedMatrixFibonacci(FibonacciStrategy):
+    """
+    Implements the optimized matrix method using mutable GMP integers (gmpy2.xmpz).
+
+    This performs exactly the same multiplications as GMPImprovedMatrixFibonnaci, but every
+    product and sum is written in place into preallocated registers instead of allocating
+    fresh mpz objects, which matters once the matrix entries are megabytes large.
+    """
+
+    __slots__ = ()
+    RESULT_TYPE = 'mpz'
+
+    def execute(self, n):
+        """Execute the in-place GMP matrix method to calculate the nth Fibonacci number."""
+        if 0 <= n < small_n_table.limit:
+            return small_n_table.mpz_values[n]
+        return self.mat_fib_xmpz(n)
+
+    def mat_fib_xmpz(self, n):
+        """
+        Calculate the nth Fibonacci number using in-place matrix exponentiation.
+
+        The matrix [[a, b], [c, d]] and the vector [x, z] live in six registers and three more
+        serve as scratch space. Registers are swapped by rebinding names, never copied.
+        """
+        limbs = fibonacci_limbs(n + 1)
+        a, b, c, d, x, z, s, t, u = (preallocated_xmpz(limbs) for _ in range(9))
+        b += 1
+        c += 1
+        d += 1
+        z += 1
+
+        while n > 0:
+            n, r = divmod(n, 2)
+            if r:  # If n is odd
+                # x, z = a*x + b*z, c*x + d*z
+                t ^= t
+                t += a
+                t *= x  # t = a*x
+                u ^= u
+                u += b
+                u *= z  # u = b*z
+                t += u  # t = new x
+                u ^= u
+                u += c
+                u *= x  # u = c*x
+                z *= d
+                z += u  # z = new z
+                x, t = t, x
+            if n:  # If n is not zero
+                # a, b, c, d = a*a + b*c, b*(a + d), c*(a + d), c*b + d*d
+                s ^= s
+                s += a
+                s += d  # s = a + d
+                t ^= t
+                t += b
+                t *= c  # t = b*c
+                a *= a
+                a += t
+                d *= d
+                d += t
+                b *= s
+                c *= s
+
+        return gmpy2.mpz(x)  # x holds the nth Fibonacci number
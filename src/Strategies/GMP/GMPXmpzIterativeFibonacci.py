@@ -0,0 +1,53 @@
+from src.Strategies.FibonacciStrategy import FibonacciStrategy, small_n_table
+import gmpy2
+
+from src.Strategies.GMP.XmpzRegisters import fibonacci_limbs, preallocated_xmpz
+
+
+class GMPXmpzIterativeFibonacci(FibonacciStrategy):
+    """
+    Implements the iterative approach using mutable GMP integers (gmpy2.xmpz).
+
+    GMPIterativeFibonacci creates a new mpz object for every addition. This variant keeps two
+    xmpz registers, preallocated to the size of F(n), and updates them in place, so the loop
+    performs no big-integer allocations at all.
+    """
+
+    __slots__ = ()
+    RESULT_TYPE = 'mpz'
+
+    def execute(self, n):
+        """
+        Execute the Fibonacci calculation for the given number using in-place GMP arithmetic.
+
+        Args:
+            n (int): The position of the Fibonacci number to calculate.
+
+        Returns:
+            gmpy2.mpz: The nth Fibonacci number as a GMP integer.
+        """
+        if 0 <= n < small_n_table.limit:
+            return small_n_table.mpz_values[n]
+        return self.fib(n)
+
+    def fib(self, n):
+        """
+        Calculate the nth Fibonacci number iteratively with in-place additions.
+
+        Instead of rebinding a, b = b, a + b (which allocates the sum), the sum is accumulated
+        into a and the two register names are swapped.
+
+        Args:
+            n (int): The position of the Fibonacci number to calculate.
+
+        Returns:
+            gmpy2.mpz: The nth Fibonacci number as a GMP integer.
+        """
+        limbs = fibonacci_limbs(n + 1)
+        a, b = preallocated_xmpz(limbs), preallocated_xmpz(limbs)
+        b += 1
+        for _ in range(n):
+            a += b  # a now holds F(k+2)
+            a, b = b, a  # Swap the registers, not the values
+        return gmpy2.mpz(a)
+
@@ -0,0 +1,33 @@
+import gmpy2
+
+
+def fibonacci_limbs(n):
+    """
+    Upper bound on the number of limbs needed to hold 2 * F(n + 1).
+
+    F(n) has roughly n * log2(phi) ~= 0.6943 * n bits; the doubling and matrix formulas briefly
+    hold values up to twice that size, which the small extra margin covers.
+
+    Args:
+        n (int): The largest Fibonacci index that will be stored.
+
+    Returns:
+        int: Number of limbs to preallocate.
+    """
+    return (int(n * 0.6943) + 2 * gmpy2.mp_limbsize()) // gmpy2.mp_limbsize() + 2
+
+
+def preallocated_xmpz(limbs):
+    """
+    Create an xmpz equal to zero whose buffer can already hold the given number of limbs.
+
+    Args:
+        limbs (int): Capacity to reserve.
+
+    Returns:
+        gmpy2.xmpz: A zero-valued register that will not reallocate until it outgrows the capacity.
+    """
+    register = gmpy2.xmpz(0)
+    register.limbs_modify(limbs)
+    register.limbs_finish(0)
+    return register
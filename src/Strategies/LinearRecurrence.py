@@ -0,0 +1,185 @@
+class LinearRecurrence:
+    """
+    Computes terms of an order-k linear recurrence with constant coefficients:
+
+        a(n) = c1 * a(n-1) + c2 * a(n-2) + ... + ck * a(n-k)
+
+    The default method is Kitamasa's (Fiduccia's) algorithm: a(n) is a linear combination of
+    the initial values a(0..k-1) whose weights are the coefficients of x^n modulo the
+    characteristic polynomial x^k - c1 x^(k-1) - ... - ck. Computing x^n by repeated squaring
+    costs O(k^2 log n) coefficient operations, compared to O(k^3 log n) for raising the k x k
+    companion matrix to the nth power, which is kept as the 'matrix' method for comparison.
+
+    For k = 2 with coefficients (1, 1) and initial values (0, 1) this is the Fibonacci sequence,
+    and the 'matrix' method is exactly what MatrixFibonacci does.
+
+    Three arithmetic backends are supported: 'int' (Python integers), 'gmpy2' (GMP integers)
+    and 'mod' (Python integers reduced modulo the given modulus after every step).
+    """
+
+    BACKENDS = ('int', 'gmpy2', 'mod')
+    METHODS = ('kitamasa', 'matrix')
+
+    def __init__(self, coefficients, initial_values, backend='int', modulus=None):
+        """
+        Initialize the recurrence.
+
+        Args:
+            coefficients (list): c1..ck, the weight of a(n-1) first.
+            initial_values (list): a(0)..a(k-1).
+            backend (str): One of 'int', 'gmpy2' and 'mod'.
+            modulus (int): Modulus for the 'mod' backend.
+        """
+        if not coefficients or len(coefficients) != len(initial_values):
+            raise ValueError("A recurrence of order k needs k coefficients and k initial values.")
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown backend '{backend}'. Choose one of {', '.join(self.BACKENDS)}.")
+        if (backend == 'mod') != (modulus is not None):
+            raise ValueError("A modulus is required for, and only allowed with, the 'mod' backend.")
+
+        if backend == 'gmpy2':
+            import gmpy2
+            convert = gmpy2.mpz
+        elif backend == 'mod':
+            convert = lambda value: value % modulus  # noqa: E731
+        else:
+            convert = int
+
+        self.backend = backend
+        self.modulus = modulus
+        self.order = len(coefficients)
+        self.coefficients = [convert(c) for c in coefficients]
+        self.initial_values = [convert(a) for a in initial_values]
+        self.zero = convert(0)
+        self.one = convert(1)
+
+    @classmethod
+    def fibonacci(cls, **kwargs):
+        """F(n): 0, 1, 1, 2, 3, 5, ..."""
+        return cls([1, 1], [0, 1], **kwargs)
+
+    @classmethod
+    def lucas(cls, **kwargs):
+        """L(n): 2, 1, 3, 4, 7, 11, ..."""
+        return cls([1, 1], [2, 1], **kwargs)
+
+    @classmethod
+    def pell(cls, **kwargs):
+        """P(n): 0, 1, 2, 5, 12, 29, ..."""
+        return cls([2, 1], [0, 1], **kwargs)
+
+    @classmethod
+    def tribonacci(cls, **kwargs):
+        """T(n): 0, 0, 1, 1, 2, 4, 7, ..."""
+        return cls([1, 1, 1], [0, 0, 1], **kwargs)
+
+    def _reduce(self, value):
+        """Reduce a value for the 'mod' backend; identity otherwise."""
+        return value % self.modulus if self.modulus is not None else value
+
+    def term(self, n, method='kitamasa'):
+        """
+        Calculate the nth term of the recurrence.
+
+        Args:
+            n (int): Index of the term (n >= 0).
+            method (str): 'kitamasa' (polynomial exponentiation) or 'matrix' (companion matrix power).
+
+        Returns:
+            The nth term in the backend's integer type.
+        """
+        if n < 0:
+            raise ValueError("n must be non-negative.")
+        if method not in self.METHODS:
+            raise ValueError(f"Unknown method '{method}'. Choose one of {', '.join(self.METHODS)}.")
+        if n < self.order:
+            return self.initial_values[n]
+        if method == 'matrix':
+            return self._matrix_term(n)
+
+        weights = self._power_of_x(n)
+        total = self.zero
+        for weight, value in zip(weights, self.initial_values):
+            total += weight * value
+        return self._reduce(total)
+
+    def _reduce_polynomial(self, product):
+        """
+        Reduce a polynomial of degree < 2k modulo the characteristic polynomial.
+
+        Uses x^k = c1 x^(k-1) + ... + ck to eliminate the coefficients from the top down.
+        """
+        k = self.order
+        coefficients = self.coefficients
+        for degree in range(len(product) - 1, k - 1, -1):
+            top = product[degree]
+            if top:
+                for j in range(k):
+                    product[degree - 1 - j] += top * coefficients[j]
+        return [self._reduce(value) for value in product[:k]]
+
+    def _square(self, polynomial):
+        """Square a polynomial of degree < k modulo the characteristic polynomial."""
+        k = self.order
+        product = [self.zero] * (2 * k - 1)
+        for i in range(k):
+            p_i = polynomial[i]
+            if not p_i:
+                continue
+            product[2 * i] += p_i * p_i
+            doubled = p_i << 1
+            for j in range(i + 1, k):
+                product[i + j] += doubled * polynomial[j]
+        return self._reduce_polynomial(product)
+
+    def _times_x(self, polynomial):
+        """Multiply a polynomial of degree < k by x modulo the characteristic polynomial."""
+        top = polynomial[-1]
+        shifted = [self.zero] + polynomial[:-1]
+        return [self._reduce(value + top * c) for value, c in zip(shifted, reversed(self.coefficients))]
+
+    def _power_of_x(self, n):
+        """Return the coefficients of x^n modulo the characteristic polynomial (lowest degree first)."""
+        k = self.order
+        polynomial = [self.zero] * k
+        polynomial[0] = self.one
+        for bit in bin(n)[2:]:
+            polynomial = self._square(polynomial)
+            if bit == '1':
+                polynomial = self._times_x(polynomial)
+        return polynomial
+
+    def _matrix_multiply(self, A, B):
+        """Multiply two k x k matrices."""
+        k = self.order
+        result = []
+        for i in range(k):
+            row = []
+            for j in range(k):
+                total = self.zero
+                for m in range(k):
+                    total += A[i][m] * B[m][j]
+                row.append(self._reduce(total))
+            result.append(row)
+        return result
+
+    def _matrix_term(self, n):
+        """Calculate the nth term by raising the companion matrix to the power n - k + 1."""
+        k = self.order
+        # Companion matrix mapping [a(m+k-1), ..., a(m)] to [a(m+k), ..., a(m+1)]
+        companion = [list(self.coefficients)] + [
+            [self.one if j == i else self.zero for j in range(k)] for i in range(k - 1)
+        ]
+        result = [[self.one if i == j else self.zero for j in range(k)] for i in range(k)]
+        p = n - k + 1
+        while p > 0:
+            if p & 1:
+                result = self._matrix_multiply(result, companion)
+            companion = self._matrix_multiply(companion, companion)
+            p >>= 1
+
+        state = list(reversed(self.initial_values))  # [a(k-1), ..., a(0)]
+        total = self.zero
+        for weight, value in zip(result[0], state):
+            total += weight * value
+        return self._reduce(total)
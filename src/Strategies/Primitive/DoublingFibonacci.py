@@ -1,18 +1,30 @@
-from src.Strategies.FibonacciStrategy import FibonacciStrategy
+from src.Strategies.FibonacciStrategy import FibonacciStrategy, small_n_table
+from src.Strategies.Primitive.MultiplicationBackend import NativeMultiplication
 
 
 class DoublingFibonacci(FibonacciStrategy):
+    __slots__ = ('multiplication',)
+
+    def __init__(self, multiplication=None):
+        super().__init__()
+        self.multiplication = multiplication or NativeMultiplication()
+
     def execute(self, n):
+        if 0 <= n < small_n_table.limit:
+            return small_n_table.int_values[n]
         return self.fibonacci_doubling(n)
 
     def fibonacci_doubling(self, n):
+        multiply = self.multiplication.multiply
+        square = self.multiplication.square
+
         def _fibonacci_doubling(n):
             if n == 0:
                 return (0, 1)
             else:
                 a, b = _fibonacci_doubling(n >> 1)
-                c = a * (2 * b - a)
-                d = a * a + b * b
+                c = multiply(a, 2 * b - a)
+                d = square(a) + square(b)
                 if n & 1:
                     return (d, c + d)
                 else:
@@ -1,4 +1,5 @@
-from src.Strategies.FibonacciStrategy import FibonacciStrategy
+from src.Strategies.FibonacciStrategy import FibonacciStrategy, small_n_table
+from src.Strategies.Primitive.MultiplicationBackend import NativeMultiplication
 
 
 class ImprovedMatrixFibonnaci(FibonacciStrategy):
@@ -10,8 +11,23 @@ class ImprovedMatrixFibonnaci(FibonacciStrategy):
     matrix elements instead of full matrices.
     """
 
+    __slots__ = ('multiplication',)
+
+    def __init__(self, multiplication=None):
+        """
+        Initialize the strategy.
+
+        Args:
+            multiplication: Multiplication backend for the big-integer products, e.g.
+                NTTMultiplication for huge n. Defaults to CPython's built-in multiplication.
+        """
+        super().__init__()
+        self.multiplication = multiplication or NativeMultiplication()
+
     def execute(self, n):
         """Execute the modular arithmetic method to calculate the nth Fibonacci number."""
+        if 0 <= n < small_n_table.limit:
+            return small_n_table.int_values[n]
         return self.mat_fib(n)
 
     def mat_fib(self, n):
@@ -22,13 +38,15 @@ class ImprovedMatrixFibonnaci(FibonacciStrategy):
         operations using individual variables instead of full matrices,
         reducing memory usage and improving cache efficiency.
         """
+        mul = self.multiplication.multiply
+        sq = self.multiplication.square
         a, b, c, d = 0, 1, 1, 1  # Initial matrix [[0, 1], [1, 1]]
         x, z = 0, 1  # Initial vector [0, 1]
         while n:
             n, r = divmod(n, 2)
             if r:  # If n is odd
-                x, z = a*x + b*z, c*x + d*z  # Multiply current matrix with vector
+                x, z = mul(a, x) + mul(b, z), mul(c, x) + mul(d, z)  # Multiply current matrix with vector
             if n:  # If n is not zero
                 # Square the current matrix
-                a, b, c, d = a*a + b*c, b*(a + d), c*(a + d), c*b + d*d
+                a, b, c, d = sq(a) + mul(b, c), mul(b, a + d), mul(c, a + d), mul(c, b) + sq(d)
         return x  # x holds the nth Fibonacci number
@@ -0,0 +1,55 @@
+from src.Strategies.FibonacciStrategy import FibonacciStrategy, small_n_table
+from src.Strategies.Primitive.MultiplicationBackend import NativeMultiplication
+
+
+class IterativeDoublingFibonacci(FibonacciStrategy):
+    """
+    Stack-free version of DoublingFibonacci.
+
+    Performs exactly the same multiplications as DoublingFibonacci, but walks the bits of n
+    from the most significant one down in a loop instead of recursing through a nested
+    closure, so no function object or Python frame is created per bit. Benchmarked side by
+    side with DoublingFibonacci, the difference is the cost of the recursion itself.
+    """
+
+    __slots__ = ('multiplication',)
+
+    def __init__(self, multiplication=None):
+        """
+        Initialize the strategy.
+
+        Args:
+            multiplication: Multiplication backend (defaults to NativeMultiplication).
+        """
+        super().__init__()
+        self.multiplication = multiplication or NativeMultiplication()
+
+    def execute(self, n):
+        """Execute the Fibonacci calculation for the given index."""
+        if 0 <= n < small_n_table.limit:
+            return small_n_table.int_values[n]
+        return self.fibonacci_doubling(n)
+
+    def fibonacci_doubling(self, n):
+        """
+        Calculate the nth Fibonacci number by walking the bits of n.
+
+        Args:
+            n (int): The index of the Fibonacci number to calculate.
+
+        Returns:
+            int: The nth Fibonacci number.
+        """
+        multiply = self.multiplication.multiply
+        square = self.multiplication.square
+
+        # (a, b) = (F(k), F(k+1)) for the prefix k of the bits of n processed so far
+        a, b = 0, 1
+        for i in range(n.bit_length() - 1, -1, -1):
+            c = multiply(a, 2 * b - a)  # F(2k)
+            d = square(a) + square(b)  # F(2k+1)
+            if (n >> i) & 1:
+                a, b = d, c + d
+            else:
+                a, b = c, d
+        return a
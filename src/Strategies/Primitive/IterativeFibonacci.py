@@ -1,4 +1,4 @@
-from src.Strategies.FibonacciStrategy import FibonacciStrategy
+from src.Strategies.FibonacciStrategy import FibonacciStrategy, small_n_table
 class IterativeFibonacci(FibonacciStrategy):
     """
     Implements an iterative approach to calculate Fibonacci numbers.
@@ -8,6 +8,8 @@ class IterativeFibonacci(FibonacciStrategy):
     as it avoids the overhead of function calls and potential stack overflow issues.
     """
 
+    __slots__ = ()
+
     def execute(self, n):
         """
         Execute the Fibonacci calculation for the given number.
@@ -18,6 +20,8 @@ class IterativeFibonacci(FibonacciStrategy):
         Returns:
             int: The nth Fibonacci number.
         """
+        if 0 <= n < small_n_table.limit:
+            return small_n_table.int_values[n]
         return self.fib(n)
 
     def fib(self, n):
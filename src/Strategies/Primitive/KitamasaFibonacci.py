@@ -0,0 +1,31 @@
+from src.Strategies.FibonacciStrategy import FibonacciStrategy, small_n_table
+from src.Strategies.LinearRecurrence import LinearRecurrence
+
+
+class KitamasaFibonacci(FibonacciStrategy):
+    """
+    Calculates Fibonacci numbers as a special case of the general linear-recurrence engine.
+
+    The engine computes x^n modulo the characteristic polynomial x^2 - x - 1 (Kitamasa's
+    method). Benchmarking it against MatrixFibonacci and DoublingFibonacci shows the cost of
+    the generality compared to the hand-written 2x2 strategies.
+    """
+
+    __slots__ = ('method', 'recurrence')
+
+    def __init__(self, method='kitamasa'):
+        """
+        Initialize the strategy.
+
+        Args:
+            method (str): 'kitamasa' or 'matrix' (companion matrix power, like MatrixFibonacci).
+        """
+        super().__init__()
+        self.method = method
+        self.recurrence = LinearRecurrence.fibonacci()
+
+    def execute(self, n):
+        """Execute the linear-recurrence engine to calculate the nth Fibonacci number."""
+        if 0 <= n < small_n_table.limit:
+            return small_n_table.int_values[n]
+        return self.recurrence.term(n, self.method)
@@ -1,4 +1,5 @@
-from src.Strategies.FibonacciStrategy import FibonacciStrategy
+from src.Strategies.FibonacciStrategy import FibonacciStrategy, small_n_table
+from src.Strategies.Primitive.MultiplicationBackend import NativeMultiplication
 
 class MatrixFibonacci(FibonacciStrategy):
     """
@@ -9,8 +10,23 @@ class MatrixFibonacci(FibonacciStrategy):
     to compute the matrix power efficiently, reducing the time complexity to O(log n).
     """
 
+    __slots__ = ('multiplication',)
+
+    def __init__(self, multiplication=None):
+        """
+        Initialize the strategy.
+
+        Args:
+            multiplication: Multiplication backend for the big-integer products, e.g.
+                NTTMultiplication for huge n. Defaults to CPython's built-in multiplication.
+        """
+        super().__init__()
+        self.multiplication = multiplication or NativeMultiplication()
+
     def execute(self, n):
         """Execute the matrix method to calculate the nth Fibonacci number."""
+        if 0 <= n < small_n_table.limit:
+            return small_n_table.int_values[n]
         return self.fibonacci_matrix(n)
 
     def fibonacci_matrix(self, n):
@@ -19,16 +35,16 @@ class MatrixFibonacci(FibonacciStrategy):
         result = self.matrix_pow(F, n)
         return result[0][1]  # The nth Fibonacci number is in this position
 
-    @staticmethod
-    def matrix_mult(A, B):
+    def matrix_mult(self, A, B):
         """
         Multiply two 2x2 matrices.
 
         This is a key operation in the matrix method, used in the exponentiation process.
         """
+        mul = self.multiplication.multiply
         return [
-            [A[0][0] * B[0][0] + A[0][1] * B[1][0], A[0][0] * B[0][1] + A[0][1] * B[1][1]],
-            [A[1][0] * B[0][0] + A[1][1] * B[1][0], A[1][0] * B[0][1] + A[1][1] * B[1][1]]
+            [mul(A[0][0], B[0][0]) + mul(A[0][1], B[1][0]), mul(A[0][0], B[0][1]) + mul(A[0][1], B[1][1])],
+            [mul(A[1][0], B[0][0]) + mul(A[1][1], B[1][0]), mul(A[1][0], B[0][1]) + mul(A[1][1], B[1][1])]
         ]
 
     def matrix_pow(self, mat, p):
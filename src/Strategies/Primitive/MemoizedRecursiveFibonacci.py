@@ -0,0 +1,50 @@
+from src.Strategies.Primitive.RecursiveFibonacci import RecursiveFibonacci
+
+
+class MemoizedRecursiveFibonacci(RecursiveFibonacci):
+    """
+    Memoized top-down mode of RecursiveFibonacci that runs without recursion.
+
+    Instead of F(n) = F(n-1) + F(n-2), each value is defined through the two values around
+    half its index:
+
+        F(2k)   = F(k) * (2 F(k+1) - F(k))
+        F(2k+1) = F(k)^2 + F(k+1)^2
+
+    Resolved top-down with memoization, halving only ever visits O(log n) distinct indices
+    (at most three per level), so the memo stays that small. The pending indices are kept on
+    an explicit stack instead of the Python call stack, so any n can be calculated without
+    raising the recursion limit.
+    """
+
+    __slots__ = ()
+
+    def fib(self, n):
+        """
+        Calculate the Fibonacci number at position n top-down, using an explicit stack.
+
+        Args:
+            n (int): The position in the Fibonacci sequence to calculate.
+
+        Returns:
+            int: The Fibonacci number at position n.
+        """
+        memo = {0: 0, 1: 1, 2: 1}
+        stack = [n]
+        while stack:
+            m = stack[-1]
+            if m in memo:
+                stack.pop()
+                continue
+
+            k = m >> 1
+            missing = [i for i in (k, k + 1) if i not in memo]
+            if missing:
+                # Resolve the halves first; m is revisited once they are known
+                stack.extend(missing)
+                continue
+
+            stack.pop()
+            a, b = memo[k], memo[k + 1]
+            memo[m] = a * a + b * b if m & 1 else a * (2 * b - a)
+        return memo[n]
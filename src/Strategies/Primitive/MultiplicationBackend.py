@@ -0,0 +1,199 @@
+import logging
+import operator
+
+
+def _numpy():
+    """
+    Import NumPy on first use, so only the NTT backend depends on it.
+
+    The module is looked up on every call rather than kept on the backend, which would make
+    strategies using the backend unpicklable.
+
+    Returns:
+        module: The numpy module.
+    """
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError("NTTMultiplication requires numpy. Install it with 'pip install numpy'.") from e
+    return numpy
+
+
+class NativeMultiplication:
+    """
+    Multiplication backend that uses CPython's built-in int multiplication (Karatsuba for large operands).
+
+    This is the default backend of the Primitive strategies.
+    """
+
+    __slots__ = ()
+
+    multiply = staticmethod(operator.mul)
+
+    @staticmethod
+    def square(a):
+        """Square a Python integer."""
+        return a * a
+
+
+class NTTMultiplication:
+    """
+    Multiplication backend based on a NumPy number-theoretic transform (NTT).
+
+    Operands are split into 16-bit limbs and convolved exactly modulo two NTT-friendly primes;
+    the Chinese remainder theorem then recovers every convolution coefficient, and the carries
+    are resolved by recombining the coefficients as a handful of Python integers. This runs in
+    O(n log n) instead of Karatsuba's O(n^1.58), so it pays off for operands of millions of bits.
+
+    Operands below the threshold are multiplied natively, where CPython is faster. Products too
+    large for the two primes are multiplied natively as well; `fallbacks` counts them and the
+    first one is logged.
+    """
+
+    # Primes of the form c * 2^k + 1 with primitive root 3; their product exceeds every
+    # coefficient of a convolution of up to MAX_LIMBS 16-bit limbs (MAX_LIMBS * (2^16)^2 < P1 * P2).
+    P1 = 998244353   # 119 * 2^23 + 1
+    P2 = 469762049   # 7 * 2^26 + 1
+    ROOT = 3
+    MAX_LIMBS = 1 << 23
+
+    __slots__ = ('threshold_bits', 'fallbacks', '_twiddles', '_permutations', '_p1_inverse')
+
+    def __init__(self, threshold_bits=2_000_000):
+        """
+        Initialize the NTT backend.
+
+        Args:
+            threshold_bits (int): Size of the smaller operand, in bits, from which the NTT is used.
+        """
+        # Fail on creation rather than on the first large product if NumPy is missing
+        _numpy()
+        self.threshold_bits = threshold_bits
+        self.fallbacks = 0
+        self._twiddles = {}
+        self._permutations = {}
+        self._p1_inverse = pow(self.P1, -1, self.P2)
+
+    def multiply(self, a, b):
+        """Multiply two Python integers, switching to the NTT above the size threshold."""
+        if min(a.bit_length(), b.bit_length()) < self.threshold_bits:
+            return a * b
+        if a < 0 or b < 0:
+            sign = -1 if (a < 0) != (b < 0) else 1
+            return sign * self.multiply(abs(a), abs(b))
+        return self._ntt_multiply(a, b, square=False)
+
+    def square(self, a):
+        """Square a Python integer, sharing the forward transform of both factors."""
+        if a.bit_length() < self.threshold_bits:
+            return a * a
+        return self._ntt_multiply(abs(a), abs(a), square=True)
+
+    def _to_limbs(self, x):
+        """Split a non-negative integer into little-endian 16-bit limbs."""
+        data = x.to_bytes((x.bit_length() + 15) // 16 * 2 or 2, 'little')
+        np = _numpy()
+        return np.frombuffer(data, dtype='<u2').astype(np.uint64)
+
+    def _from_coefficients(self, coefficients):
+        """
+        Evaluate sum(coefficients[i] * 2^(16 i)) exactly.
+
+        Each coefficient is below 2^64, so it is split into four 16-bit digits; the digits of the
+        same weight form valid limb arrays and the whole sum reduces to four shifted additions.
+        """
+        np = _numpy()
+        result = 0
+        for shift in (48, 32, 16, 0):
+            digits = ((coefficients >> np.uint64(shift)) & np.uint64(0xFFFF)).astype('<u2')
+            result = (result << 16) + int.from_bytes(digits.tobytes(), 'little')
+        return result
+
+    def _bit_reversal(self, size):
+        """Return the bit-reversal permutation of range(size) for a power-of-two size."""
+        if size not in self._permutations:
+            np = _numpy()
+            indices = np.arange(size, dtype=np.int64)
+            reversed_indices = np.zeros(size, dtype=np.int64)
+            bits = size.bit_length() - 1
+            for bit in range(bits):
+                reversed_indices |= ((indices >> bit) & 1) << (bits - 1 - bit)
+            self._permutations[size] = reversed_indices
+        return self._permutations[size]
+
+    def _stage_twiddles(self, prime, half, invert):
+        """Return [w^0, ..., w^(half-1)] modulo prime for the primitive (2 * half)-th root of unity w."""
+        key = (prime, half, invert)
+        if key not in self._twiddles:
+            np = _numpy()
+            root = pow(self.ROOT, (prime - 1) // (2 * half), prime)
+            if invert:
+                root = pow(root, -1, prime)
+            twiddles = np.ones(half, dtype=np.uint64)
+            filled, power = 1, root
+            while filled < half:
+                # Extend by doubling: w^(filled + j) = w^j * w^filled
+                twiddles[filled:2 * filled] = twiddles[:filled] * np.uint64(power) % np.uint64(prime)
+                filled *= 2
+                power = power * power % prime
+            self._twiddles[key] = twiddles
+        return self._twiddles[key]
+
+    def _transform(self, values, prime, invert, permutation):
+        """Iterative radix-2 NTT of values (length a power of two) modulo prime."""
+        np = _numpy()
+        p = np.uint64(prime)
+        values = values[permutation]
+        size = len(values)
+        half = 1
+        while half < size:
+            blocks = values.reshape(-1, 2 * half)
+            twiddles = self._stage_twiddles(prime, half, invert)
+            upper = blocks[:, :half].copy()
+            lower = blocks[:, half:] * twiddles % p
+            blocks[:, :half] = (upper + lower) % p
+            blocks[:, half:] = (upper + p - lower) % p
+            half *= 2
+        if invert:
+            values = values * np.uint64(pow(size, -1, prime)) % p
+        return values
+
+    def _convolve(self, a_limbs, b_limbs, prime, size, permutation, square):
+        """Cyclic convolution of the zero-padded limb arrays modulo prime."""
+        np = _numpy()
+        p = np.uint64(prime)
+        fa = np.zeros(size, dtype=np.uint64)
+        fa[:len(a_limbs)] = a_limbs
+        fa = self._transform(fa, prime, False, permutation)
+        if square:
+            fb = fa
+        else:
+            fb = np.zeros(size, dtype=np.uint64)
+            fb[:len(b_limbs)] = b_limbs
+            fb = self._transform(fb, prime, False, permutation)
+        return self._transform(fa * fb % p, prime, True, permutation)
+
+    def _ntt_multiply(self, a, b, square):
+        """Multiply two non-negative integers with the two-prime NTT and CRT reconstruction."""
+        np = _numpy()
+        a_limbs = self._to_limbs(a)
+        b_limbs = a_limbs if square else self._to_limbs(b)
+        result_limbs = len(a_limbs) + len(b_limbs) - 1
+        size = 1 << (result_limbs - 1).bit_length()
+        if size > self.MAX_LIMBS:
+            # Beyond the exact range of the two primes; fall back to CPython
+            if not self.fallbacks:
+                logging.warning(f"NTT product of {result_limbs} limbs exceeds the exact range of "
+                                f"{self.MAX_LIMBS} limbs; multiplying natively instead")
+            self.fallbacks += 1
+            return a * b
+
+        permutation = self._bit_reversal(size)
+        r1 = self._convolve(a_limbs, b_limbs, self.P1, size, permutation, square)[:result_limbs]
+        r2 = self._convolve(a_limbs, b_limbs, self.P2, size, permutation, square)[:result_limbs]
+
+        # Garner: x = r1 + P1 * ((r2 - r1) * P1^-1 mod P2), exact because x < P1 * P2 < 2^64
+        p2 = np.uint64(self.P2)
+        difference = (r2 + p2 - r1 % p2) % p2
+        coefficients = r1 + np.uint64(self.P1) * (difference * np.uint64(self._p1_inverse) % p2)
+        return self._from_coefficients(coefficients)
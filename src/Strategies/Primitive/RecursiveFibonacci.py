@@ -1,4 +1,4 @@
-from src.Strategies.FibonacciStrategy import FibonacciStrategy
+from src.Strategies.FibonacciStrategy import FibonacciStrategy, small_n_table
 
 
 class RecursiveFibonacci(FibonacciStrategy):
@@ -13,6 +13,8 @@ class RecursiveFibonacci(FibonacciStrategy):
     F(n) = F(n-1) + F(n-2), with base cases F(0) = 0 and F(1) = 1.
     """
 
+    __slots__ = ()
+
     def execute(self, n):
         """
         Execute the Fibonacci calculation for a given number.
@@ -23,6 +25,8 @@ class RecursiveFibonacci(FibonacciStrategy):
         Returns:
             int: The Fibonacci number at position n.
         """
+        if 0 <= n < small_n_table.limit:
+            return small_n_table.int_values[n]
         return self.fib(n)
 
     def fib(self, n):
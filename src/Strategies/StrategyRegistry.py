@@ -0,0 +1,131 @@
+import importlib
+import sys
+from typing import Any, Dict, List, Union
+
+# Entry point group under which installed packages can publish additional strategies, e.g.
+# [project.entry-points.fibonacci_strategies] MyFibonacci = "my_package.module:MyFibonacci"
+ENTRY_POINT_GROUP = 'fibonacci_strategies'
+
+BUILTIN_STRATEGIES = {
+    'RecursiveFibonacci': 'src.Strategies.Primitive.RecursiveFibonacci:RecursiveFibonacci',
+    'MemoizedRecursiveFibonacci': 'src.Strategies.Primitive.MemoizedRecursiveFibonacci:MemoizedRecursiveFibonacci',
+    'IterativeFibonacci': 'src.Strategies.Primitive.IterativeFibonacci:IterativeFibonacci',
+    'MatrixFibonacci': 'src.Strategies.Primitive.MatrixFibonacci:MatrixFibonacci',
+    'ImprovedMatrixFibonnaci': 'src.Strategies.Primitive.ImprovedMatrixFibonnaci:ImprovedMatrixFibonnaci',
+    'DoublingFibonacci': 'src.Strategies.Primitive.DoublingFibonacci:DoublingFibonacci',
+    'IterativeDoublingFibonacci': 'src.Strategies.Primitive.IterativeDoublingFibonacci:IterativeDoublingFibonacci',
+    'KitamasaFibonacci': 'src.Strategies.Primitive.KitamasaFibonacci:KitamasaFibonacci',
+    'GMPIterativeFibonacci': 'src.Strategies.GMP.GMPIterativeFibonacci:GMPIterativeFibonacci',
+    'GMPMatrixFibonacci': 'src.Strategies.GMP.GMPMatrixFibonacci:GMPMatrixFibonacci',
+    'GMPImprovedMatrixFibonnaci': 'src.Strategies.GMP.GMPImprovedMatrixFibonnaci:GMPImprovedMatrixFibonnaci',
+    'GMPDoublingFibonacci': 'src.Strategies.GMP.GMPDoublingFibonacci:GMPDoublingFibonacci',
+    'GMPDoublingFibonacciOptimized': 'src.Strategies.GMP.GMPDoublingFibonacciOptimized:GMPDoublingFibonacciOptimized',
+    'GMPIterativeDoublingFibonacci': 'src.Strategies.GMP.GMPIterativeDoublingFibonacci:GMPIterativeDoublingFibonacci',
+    'GMPParallelDoublingFibonacci': 'src.Strategies.GMP.GMPParallelDoublingFibonacci:GMPParallelDoublingFibonacci',
+    'GMPXmpzIterativeFibonacci': 'src.Strategies.GMP.GMPXmpzIterativeFibonacci:GMPXmpzIterativeFibonacci',
+    'GMPXmpzImprovedMatrixFibonacci': 'src.Strategies.GMP.GMPXmpzImprovedMatrixFibonacci:GMPXmpzImprovedMatrixFibonacci',
+    'GMPXmpzDoublingFibonacci': 'src.Strategies.GMP.GMPXmpzDoublingFibonacci:GMPXmpzDoublingFibonacci',
+    'GMPKitamasaFibonacci': 'src.Strategies.GMP.GMPKitamasaFibonacci:GMPKitamasaFibonacci',
+}
+
+
+class UnknownStrategyError(KeyError):
+    """Raised when a strategy name is neither built in, registered nor published as a plugin."""
+
+
+class StrategyRegistry:
+    """
+    Maps strategy names to their classes without importing any strategy module up front.
+
+    Strategies are registered as "module:ClassName" strings and only imported when they are
+    first requested, so listing strategies or running a single one never pays for importing
+    gmpy2 or the other strategies. Installed packages can contribute strategies through the
+    ``fibonacci_strategies`` entry point group; entry points are discovered on first lookup
+    and likewise loaded lazily.
+    """
+
+    def __init__(self, strategies: Dict[str, str] = None, discover_entry_points: bool = True):
+        """
+        Initialize the StrategyRegistry.
+
+        :param strategies: Mapping of strategy name to "module:ClassName"; defaults to the built-in strategies.
+        :param discover_entry_points: Whether to look up plugins in the entry point group.
+        """
+        self._specs: Dict[str, Union[str, type]] = dict(BUILTIN_STRATEGIES if strategies is None else strategies)
+        self._discover = discover_entry_points
+        self._discovered = False
+
+    def register(self, name: str, target: Union[str, type]) -> None:
+        """
+        Register a strategy.
+
+        :param name: Name under which the strategy is looked up.
+        :param target: The strategy class, or a "module:ClassName" string to import lazily.
+        """
+        self._specs[name] = target
+
+    def _discover_entry_points(self) -> None:
+        """Add the strategies published by installed packages, without importing them."""
+        if self._discovered or not self._discover:
+            return
+        self._discovered = True
+        from importlib import metadata
+
+        if sys.version_info >= (3, 10):
+            entry_points = metadata.entry_points(group=ENTRY_POINT_GROUP)
+        else:
+            entry_points = metadata.entry_points().get(ENTRY_POINT_GROUP, [])
+        for entry_point in entry_points:
+            # Built-in and explicitly registered strategies take precedence over plugins
+            self._specs.setdefault(entry_point.name, entry_point.value)
+
+    def names(self) -> List[str]:
+        """
+        List the names of all available strategies.
+
+        :return: Strategy names in registration order.
+        """
+        self._discover_entry_points()
+        return list(self._specs)
+
+    def load(self, name: str) -> type:
+        """
+        Import and return a strategy class.
+
+        :param name: Name of the strategy.
+        :return: The strategy class.
+        """
+        if name not in self._specs:
+            self._discover_entry_points()
+        if name not in self._specs:
+            raise UnknownStrategyError(f"Unknown strategy '{name}'. Available strategies: {', '.join(self.names())}")
+
+        target = self._specs[name]
+        if isinstance(target, str):
+            module_name, _, attribute = target.partition(':')
+            target = getattr(importlib.import_module(module_name), attribute or name)
+            self._specs[name] = target
+        return target
+
+    def create(self, name: str, **kwargs: Any) -> Any:
+        """
+        Instantiate a strategy by name.
+
+        :param name: Name of the strategy.
+        :param kwargs: Keyword arguments for the strategy's constructor.
+        :return: The strategy object.
+        """
+        return self.load(name)(**kwargs)
+
+    def create_all(self, names: List[str]) -> List[Any]:
+        """
+        Instantiate several strategies by name.
+
+        :param names: Names of the strategies.
+        :return: The strategy objects in the given order.
+        """
+        return [self.create(name) for name in names]
+
+
+# Shared default registry
+registry = StrategyRegistry()
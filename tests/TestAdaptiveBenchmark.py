@@ -0,0 +1,164 @@
+import json
+import os
+import random
+import statistics
+import tempfile
+import time
+import unittest
+
+from AdaptiveBenchmark import AdaptiveBenchmark, CurveFit
+
+
+class ConstantCost:
+    """Takes 4 ms regardless of n."""
+
+    def execute(self, n):
+        time.sleep(0.004)
+
+
+class LinearCost:
+    """Takes 20 microseconds per unit of n, so it overtakes ConstantCost at n = 200."""
+
+    def execute(self, n):
+        time.sleep(n * 0.00002)
+
+
+class ExponentialCost:
+    """Takes 1 ms at n = 0 and ten times longer every 100 n, like RecursiveFibonacci on a coarse grid."""
+
+    def execute(self, n):
+        time.sleep(0.001 * 10 ** (n / 100))
+
+
+class SimulatedConstantCost:
+    """Reports 4 ms regardless of n."""
+
+    def execute(self, n):
+        return 0.004
+
+
+class SimulatedLinearCost:
+    """Reports 20 microseconds per unit of n, so it overtakes SimulatedConstantCost at n = 200."""
+
+    def execute(self, n):
+        return n * 0.00002
+
+
+class SimulatedBenchmark:
+    """
+    Stands in for FibonacciBenchmark: reports the time a strategy returns, with 2% seeded noise,
+    instead of measuring it.
+    """
+
+    disable_gc = False
+    table_limit = 0
+
+    def __init__(self, seed=0):
+        self.rng = random.Random(seed)
+
+    def measure_range(self, func, start, stop):
+        return [(start, func(start) * self.rng.gauss(1, 0.02))], True
+
+
+class TestAdaptiveBenchmark(unittest.TestCase):
+    def test_curve_fit(self):
+        """
+        Tests that a power law is recovered from exact points.
+        """
+        fit = CurveFit([(n, 3e-6 * n ** 1.5) for n in (10, 100, 1000, 10000)], noise=0.01)
+        self.assertAlmostEqual(fit.exponent, 1.5)
+        self.assertAlmostEqual(fit.scale, 3e-6)
+        predicted, log_variance = fit.predict(500)
+        self.assertAlmostEqual(predicted, 3e-6 * 500 ** 1.5)
+        self.assertGreater(log_variance, 0)
+
+    def test_locates_crossover_within_budget(self):
+        """
+        Tests that the crossover is found and the run stays within its budget.
+        """
+        benchmark = AdaptiveBenchmark(max_n=400, spread=20, timeout=1, budget=3, tolerance=0.1)
+        benchmark.benchmark = SimulatedBenchmark()
+        report = benchmark.run([SimulatedConstantCost(), SimulatedLinearCost()])
+
+        self.assertLess(report['elapsed'], 3.5)
+        self.assertGreater(report['measurements'], 0)
+        self.assertEqual(report['target_reached'], report['confidence'] >= 0.95)
+        crossovers = report['crossovers']
+        self.assertEqual(len(crossovers), 1)
+        self.assertEqual((crossovers[0]['faster_below'], crossovers[0]['faster_above']),
+                         ('SimulatedLinearCost', 'SimulatedConstantCost'))
+        low, high = crossovers[0]['between']
+        self.assertLessEqual(low, 200)
+        self.assertGreaterEqual(high, 200)
+
+        # The flat curve is predicted from its fit rather than measured at every n
+        self.assertLess(len(benchmark.samples['SimulatedConstantCost']), len(benchmark.grid))
+
+    def test_long_grid_is_scheduled_on_a_subset(self):
+        """
+        Tests that long grids are scored and measured on at most max_schedule_points n values, and
+        that the scheduling time is reported.
+        """
+        benchmark = AdaptiveBenchmark(max_n=100000, spread=1, timeout=1, budget=3, target_confidence=0.999,
+                                      max_schedule_points=50)
+        benchmark.benchmark = SimulatedBenchmark()
+        report = benchmark.run([SimulatedConstantCost(), SimulatedLinearCost()])
+
+        self.assertLessEqual(len(benchmark.schedule_grid), 50)
+        measured = set(benchmark.samples['SimulatedConstantCost']) | set(benchmark.samples['SimulatedLinearCost'])
+        self.assertTrue(measured <= set(benchmark.schedule_grid))
+        self.assertGreater(report['scheduling_time'], 0)
+        self.assertLess(report['scheduling_time'], report['elapsed'])
+        self.assertLess(report['elapsed'], 3.5)
+
+    def test_json_output(self):
+        """
+        Tests that the JSON file holds one median time per n, keeps the samples and can be plotted.
+        """
+        from BenchmarkVisualizer import BenchmarkVisualizer
+
+        benchmark = AdaptiveBenchmark(max_n=400, spread=100, timeout=1, budget=1, target_confidence=0.5,
+                                      tolerance=0.5)
+        benchmark.benchmark = SimulatedBenchmark()
+        with tempfile.TemporaryDirectory() as directory:
+            json_filename = os.path.join(directory, 'adaptive.json')
+            benchmark.run([SimulatedConstantCost(), SimulatedLinearCost()], json_filename=json_filename)
+            with open(json_filename) as file:
+                results = json.load(file)['results']
+            visualizer = BenchmarkVisualizer(json_filename)
+            visualizer.load_data()
+
+        result = results['SimulatedLinearCost']
+        self.assertEqual(len(result['n']), len(result['times']))
+        self.assertEqual(len(result['n']), len(result['samples']))
+        for median, samples in zip(result['times'], result['samples']):
+            self.assertEqual(median, statistics.median(samples))
+        self.assertEqual(sorted(visualizer.data[visualizer.data['strategy'] == 'SimulatedLinearCost']['n']), result['n'])
+
+    def test_slow_strategy_cannot_exceed_budget(self):
+        """
+        Tests that the budget holds when a strategy takes far longer than the budget at large n.
+        """
+        benchmark = AdaptiveBenchmark(max_n=3001, spread=100, timeout=60, budget=2, target_confidence=0.999)
+        started = time.perf_counter()
+        report = benchmark.run([ConstantCost(), ExponentialCost()])
+
+        self.assertLess(time.perf_counter() - started, 3)
+        self.assertFalse(report['target_reached'])
+        # Seeding starts at small n, so the slow strategy was measured before it became too slow
+        self.assertIn(0, benchmark.samples['ExponentialCost'])
+        self.assertLessEqual(max(benchmark.samples['ExponentialCost']), 300)
+
+    def test_stops_at_target_confidence(self):
+        """
+        Tests that the run ends early once the target confidence is reached.
+        """
+        benchmark = AdaptiveBenchmark(max_n=400, spread=100, timeout=1, budget=30, target_confidence=0.5,
+                                      tolerance=0.5)
+        report = benchmark.run([ConstantCost(), LinearCost()])
+        self.assertTrue(report['target_reached'])
+        self.assertLess(report['elapsed'], 30)
+
+
+if __name__ == '__main__':
+    unittest.main()
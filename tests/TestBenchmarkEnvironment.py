@@ -0,0 +1,109 @@
+import contextlib
+import csv
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from BenchmarkEnvironment import (COMPATIBILITY_KEYS, capture_environment, incompatibilities, read_metadata,
+                                  skip_comment_lines, write_metadata_header)
+from merger import merge_csv_files_builtin
+
+
+def write_result_file(filename, metadata, rows):
+    """
+    Writes a CSV result file with an optional metadata line.
+
+    Args:
+        filename (str): Path of the file.
+        metadata (dict): Metadata to embed, or None for a file without metadata.
+        rows (list): (strategy, n, time) rows.
+    """
+    with open(filename, 'w', newline='') as file:
+        if metadata is not None:
+            write_metadata_header(file, metadata)
+        writer = csv.writer(file)
+        writer.writerow(['strategy', 'n', 'time'])
+        writer.writerows(rows)
+
+
+class TestBenchmarkEnvironment(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def path(self, filename):
+        return os.path.join(self.directory.name, filename)
+
+    def test_metadata_round_trip(self):
+        """
+        Tests that captured metadata survives being embedded in CSV and JSON result files.
+        """
+        metadata = capture_environment()
+        for key in COMPATIBILITY_KEYS:
+            self.assertIn(key, metadata)
+
+        write_result_file(self.path('run.csv'), metadata, [('A', 0, 1.0)])
+        self.assertEqual(read_metadata(self.path('run.csv')), metadata)
+        with open(self.path('run.csv')) as file:
+            self.assertEqual(list(csv.DictReader(skip_comment_lines(file))), [{'strategy': 'A', 'n': '0', 'time': '1.0'}])
+
+        with open(self.path('run.json'), 'w') as file:
+            json.dump({'metadata': metadata, 'results': {}}, file)
+        self.assertEqual(read_metadata(self.path('run.json')), metadata)
+
+        write_result_file(self.path('old.csv'), None, [('A', 0, 1.0)])
+        self.assertIsNone(read_metadata(self.path('old.csv')))
+
+    def test_incompatibilities(self):
+        """
+        Tests that only the compatibility-relevant properties make runs incompatible.
+        """
+        metadata = capture_environment()
+        other = dict(metadata, hostname='elsewhere', timestamp='later', load_average=[9.0, 9.0, 9.0])
+        self.assertEqual(incompatibilities(metadata, other), [])
+
+        other['python_version'] = '2.7.18'
+        differences = incompatibilities(metadata, other)
+        self.assertEqual(len(differences), 1)
+        self.assertTrue(differences[0].startswith('python_version'))
+
+    def test_merge_refuses_incompatible_runs_unless_forced(self):
+        """
+        Tests that incompatible runs are only merged with force, averaging duplicate points.
+        """
+        metadata = capture_environment()
+        write_result_file(self.path('a.csv'), metadata, [('A', 0, 1.0), ('A', 1, 2.0)])
+        write_result_file(self.path('b.csv'), dict(metadata, cpu_model='Other CPU'), [('A', 0, 3.0)])
+        output = self.path('merged.csv')
+
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()) as errors:
+            self.assertFalse(merge_csv_files_builtin([self.path('a.csv'), self.path('b.csv')], output))
+        self.assertIn('cpu_model', errors.getvalue())
+        self.assertFalse(os.path.exists(output))
+
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+            self.assertTrue(merge_csv_files_builtin([self.path('a.csv'), self.path('b.csv')], output, force=True))
+        self.assertEqual(read_metadata(output)['merged_from'], [self.path('a.csv'), self.path('b.csv')])
+        with open(output) as file:
+            rows = [(row['strategy'], row['n'], float(row['time'])) for row in csv.DictReader(skip_comment_lines(file))]
+        self.assertEqual(rows, [('A', '0', 2.0), ('A', '1', 2.0)])
+
+    def test_merge_command_exit_code(self):
+        """
+        Tests that a refused merge makes the merge command exit with a non-zero status.
+        """
+        from FibonacciCLI import main
+
+        write_result_file(self.path('a.csv'), capture_environment(), [('A', 0, 1.0)])
+        write_result_file(self.path('b.csv'), None, [('A', 0, 3.0)])
+        arguments = ['merge', self.path('a.csv'), self.path('b.csv'), '-o', self.path('merged.csv')]
+
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+            self.assertEqual(main(arguments), 1)
+            self.assertEqual(main(arguments + ['--force']), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,191 @@
+import contextlib
+import io
+import json
+import multiprocessing
+import socket
+import threading
+import time
+import unittest
+
+from DistributedBenchmark import BenchmarkCoordinator, run_worker
+
+
+def abandon_shard(host: str, port: int) -> None:
+    """
+    Connects like a worker, accepts one shard and disconnects without answering.
+
+    Args:
+        host (str): Host of the coordinator.
+        port (int): Port of the coordinator.
+    """
+    with socket.create_connection((host, port)) as connection, connection.makefile('rwb') as stream:
+        stream.write(json.dumps({'type': 'hello', 'worker': 'flaky', 'environment': {}}).encode() + b'\n')
+        stream.flush()
+        stream.readline()
+
+
+def send_malformed_result(host: str, port: int) -> None:
+    """
+    Connects like a worker, accepts one shard and answers it with a malformed result.
+
+    Args:
+        host (str): Host of the coordinator.
+        port (int): Port of the coordinator.
+    """
+    with socket.create_connection((host, port)) as connection, connection.makefile('rwb') as stream:
+        stream.write(json.dumps({'type': 'hello', 'worker': 'broken', 'environment': {}}).encode() + b'\n')
+        stream.flush()
+        shard = json.loads(stream.readline())
+        result = {'type': 'result', 'shard_id': shard['shard_id'], 'measurements': [[0, 'fast']], 'complete': True}
+        stream.write(json.dumps(result).encode() + b'\n')
+        stream.flush()
+        stream.readline()
+
+
+def report_errors(host: str, port: int, messages: list) -> None:
+    """
+    Connects like a worker and answers every shard with an error until the coordinator is done.
+
+    Args:
+        host (str): Host of the coordinator.
+        port (int): Port of the coordinator.
+        messages (list): Receives every message from the coordinator.
+    """
+    with socket.create_connection((host, port)) as connection, connection.makefile('rwb') as stream:
+        stream.write(json.dumps({'type': 'hello', 'worker': 'failing', 'environment': {}}).encode() + b'\n')
+        stream.flush()
+        while True:
+            message = json.loads(stream.readline())
+            messages.append(message)
+            if message['type'] == 'done':
+                return
+            result = {'type': 'result', 'shard_id': message['shard_id'], 'error': 'ImportError: no gmpy2'}
+            stream.write(json.dumps(result).encode() + b'\n')
+            stream.flush()
+
+
+class TestDistributedBenchmark(unittest.TestCase):
+    STRATEGIES = ['IterativeFibonacci', 'GMPDoublingFibonacciOptimized']
+    MAX_N = 400
+    SPREAD = 10
+
+    def _coordinator(self) -> BenchmarkCoordinator:
+        coordinator = BenchmarkCoordinator(self.STRATEGIES, self.MAX_N, self.SPREAD, timeout=10, shard_size=5,
+                                           host='127.0.0.1', port=0)
+        coordinator.start()
+        return coordinator
+
+    def _assert_complete(self, results) -> None:
+        for strategy in self.STRATEGIES:
+            self.assertEqual(sorted(results[strategy]), list(range(0, self.MAX_N, self.SPREAD)))
+
+    def test_local_workers(self):
+        """
+        Tests that shards are spread over several local worker processes and merged.
+        """
+        coordinator = self._coordinator()
+        workers = [multiprocessing.Process(target=run_worker, args=('127.0.0.1', coordinator.port)) for _ in range(2)]
+        for worker in workers:
+            worker.start()
+        results = coordinator.run(None, None)
+        for worker in workers:
+            worker.join(timeout=10)
+
+        self._assert_complete(results)
+        self.assertEqual(len(coordinator.nodes), 2)
+        self.assertEqual(coordinator.metadata['nodes'].keys(), coordinator.nodes.keys())
+
+    def test_lost_worker_shard_is_reassigned(self):
+        """
+        Tests that the shard of a worker that disconnects mid-shard is measured by another worker.
+        """
+        coordinator = self._coordinator()
+        abandon_shard('127.0.0.1', coordinator.port)
+        runner = threading.Thread(target=coordinator.run, args=(None, None))
+        runner.start()
+        worker = multiprocessing.Process(target=run_worker, args=('127.0.0.1', coordinator.port))
+        worker.start()
+        runner.join(timeout=60)
+        worker.join(timeout=10)
+
+        self.assertFalse(runner.is_alive())
+        self._assert_complete(coordinator.results)
+        self.assertNotIn('flaky', {node for by_n in coordinator.results.values() for _, node in by_n.values()})
+
+    def test_malformed_result_shard_is_reassigned(self):
+        """
+        Tests that the shard of a worker sending a malformed result is measured by another worker.
+        """
+        coordinator = self._coordinator()
+        send_malformed_result('127.0.0.1', coordinator.port)
+        self.assertEqual(coordinator.total_shards, len(coordinator.pending))
+        self.assertEqual(coordinator.in_flight, {})
+
+        runner = threading.Thread(target=coordinator.run, args=(None, None))
+        runner.start()
+        worker = multiprocessing.Process(target=run_worker, args=('127.0.0.1', coordinator.port))
+        worker.start()
+        runner.join(timeout=60)
+        worker.join(timeout=10)
+
+        self.assertFalse(runner.is_alive())
+        self._assert_complete(coordinator.results)
+        self.assertNotIn('broken', {node for by_n in coordinator.results.values() for _, node in by_n.values()})
+
+    def test_unknown_strategy_is_rejected(self):
+        """
+        Tests that unknown strategy names are rejected before any worker is served, with exit status 2 in the CLI.
+        """
+        from FibonacciCLI import main
+        from src.Strategies.StrategyRegistry import UnknownStrategyError
+
+        with self.assertRaises(UnknownStrategyError):
+            BenchmarkCoordinator(['IterativeFibonacci', 'Typo'], self.MAX_N, self.SPREAD, timeout=10)
+        with contextlib.redirect_stderr(io.StringIO()) as errors:
+            self.assertEqual(main(['coordinator', '-s', 'IterativeFibonacci,Typo', '--port', '0',
+                                   '--local-workers', '2', '--csv', '']), 2)
+        self.assertIn('Typo', errors.getvalue())
+
+    def test_failing_shards_are_dropped(self):
+        """
+        Tests that shards a worker reports errors for are retried max_attempts times and then dropped,
+        while the worker stays connected.
+        """
+        coordinator = BenchmarkCoordinator(['IterativeFibonacci'], 20, self.SPREAD, timeout=10, shard_size=1,
+                                           host='127.0.0.1', port=0, max_attempts=2)
+        coordinator.start()
+        messages = []
+        client = threading.Thread(target=report_errors, args=('127.0.0.1', coordinator.port, messages))
+        client.start()
+        started = time.monotonic()
+        with self.assertLogs(level='ERROR'):
+            results = coordinator.run(None, None)
+        client.join(timeout=10)
+
+        self.assertLess(time.monotonic() - started, 10)
+        self.assertEqual(results, {'IterativeFibonacci': {}})
+        self.assertEqual(sorted(coordinator.failed), [0, 1])
+        self.assertTrue(all('no gmpy2' in reason for reason in coordinator.failed.values()))
+        self.assertEqual([message['type'] for message in messages], ['shard'] * 4 + ['done'])
+        self.assertFalse(coordinator.metadata['benchmark']['complete'])
+        self.assertEqual(coordinator.metadata['benchmark']['failed_shards'], [0, 1])
+
+    def test_gives_up_without_workers(self):
+        """
+        Tests that the run ends with the results so far once no worker has been connected for the idle timeout.
+        """
+        coordinator = BenchmarkCoordinator(self.STRATEGIES, self.MAX_N, self.SPREAD, timeout=10, shard_size=5,
+                                           host='127.0.0.1', port=0, idle_timeout=0.5)
+        coordinator.start()
+        abandon_shard('127.0.0.1', coordinator.port)
+        started = time.monotonic()
+        results = coordinator.run(None, None)
+
+        self.assertLess(time.monotonic() - started, 10)
+        self.assertTrue(coordinator.gave_up)
+        self.assertEqual(results, {strategy: {} for strategy in self.STRATEGIES})
+        self.assertFalse(coordinator.metadata['benchmark']['complete'])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+import gc
+import json
+import os
+import tempfile
+import time
+import unittest
+
+from FibonacciBenchmark import FibonacciBenchmark
+from src.Strategies.FibonacciStrategy import WORD_TABLE_LIMIT, small_n_table
+
+
+class SleepingStrategy:
+    """Takes far longer than any timeout used in these tests."""
+
+    def execute(self, n):
+        time.sleep(30)
+
+
+class RecordingStrategy:
+    """Records every call and whether the garbage collector was enabled during it."""
+
+    def __init__(self, calls):
+        self.calls = calls
+
+    def execute(self, n):
+        self.calls.append((type(self).__name__, n, gc.isenabled()))
+
+
+class FirstRecordingStrategy(RecordingStrategy):
+    pass
+
+
+class SecondRecordingStrategy(RecordingStrategy):
+    pass
+
+
+class TestFibonacciBenchmark(unittest.TestCase):
+    def test_noise_controls(self):
+        """
+        Tests a short run with interleaving, the garbage collector disabled and drift calibration.
+        """
+        calls = []
+        benchmark = FibonacciBenchmark(max_n=40, spread=2, timeout=5, disable_gc=True, interleave=True, seed=1,
+                                       calibration_interval=4)
+        with tempfile.TemporaryDirectory() as directory:
+            json_filename = os.path.join(directory, 'run.json')
+            benchmark.run_benchmark([FirstRecordingStrategy(calls), SecondRecordingStrategy(calls)], None, json_filename)
+            with open(json_filename) as file:
+                content = json.load(file)
+
+        # Every n is measured for both strategies before the next n, in varying order
+        self.assertEqual([n for _, n, _ in calls], [n for n in range(0, 40, 2) for _ in range(2)])
+        orders = {tuple(name for name, n_called, _ in calls if n_called == n) for n in range(0, 40, 2)}
+        self.assertEqual(len(orders), 2)
+        self.assertFalse(any(enabled for _, _, enabled in calls))
+        self.assertTrue(gc.isenabled())
+
+        self.assertEqual(len(benchmark.results['FirstRecordingStrategy']['times']), 20)
+        self.assertEqual(len(benchmark.metadata['calibration']['samples']), 40 // 4)
+        self.assertEqual(content['metadata']['benchmark']['interleave'], True)
+        self.assertEqual(content['metadata']['benchmark']['disable_gc'], True)
+        self.assertEqual(content['metadata']['benchmark']['calibration_interval'], 4)
+
+    def test_small_n_table_is_disabled_by_default(self):
+        """
+        Tests that runs time small n without the small-n table unless asked to, and record its limit.
+        """
+        from src.Strategies.Primitive.IterativeFibonacci import IterativeFibonacci
+
+        class LimitRecordingStrategy:
+            def __init__(self, limits):
+                self.limits = limits
+
+            def execute(self, n):
+                self.limits.append(small_n_table.limit)
+                return IterativeFibonacci().execute(n)
+
+        for use_small_n_table, expected in ((False, 0), (True, WORD_TABLE_LIMIT)):
+            limits = []
+            benchmark = FibonacciBenchmark(max_n=10, spread=5, timeout=5, use_small_n_table=use_small_n_table)
+            benchmark.run_benchmark([LimitRecordingStrategy(limits)], None, None)
+            self.assertEqual(set(limits), {expected})
+            self.assertEqual(benchmark.metadata['small_n_table_limit'], expected)
+            self.assertEqual(small_n_table.limit, WORD_TABLE_LIMIT)
+
+    def test_visualizer_uses_spread_and_n_lists(self):
+        """
+        Tests that plotted n values follow the spread of the run or the n lists of sparse results.
+        """
+        from BenchmarkVisualizer import BenchmarkVisualizer
+
+        visualizer = BenchmarkVisualizer({
+            'metadata': {'benchmark': {'spread': 10}},
+            'results': {'Dense': {'times': [1.0, 2.0, 3.0]}, 'Sparse': {'n': [5, 50], 'times': [4.0, 5.0]}},
+        })
+        visualizer.load_data()
+        by_strategy = {strategy: list(group['n']) for strategy, group in visualizer.grouped}
+        self.assertEqual(by_strategy, {'Dense': [0, 10, 20], 'Sparse': [5, 50]})
+
+    def test_memory_benchmark_survives_timeouts_and_errors(self):
+        """
+        Tests that a timed-out or failing measurement neither aborts the run nor blocks later ones.
+        """
+        from src.Strategies.Primitive.IterativeFibonacci import IterativeFibonacci
+        from src.Strategies.Primitive.RecursiveFibonacci import RecursiveFibonacci
+
+        benchmark = FibonacciBenchmark(max_n=0, spread=1, timeout=2)
+        started = time.perf_counter()
+        peaks = benchmark.run_memory_benchmark(
+            [SleepingStrategy(), RecursiveFibonacci(), IterativeFibonacci()], [5000, 6000], None)
+
+        self.assertLess(time.perf_counter() - started, 20)
+        self.assertEqual(peaks['SleepingStrategy'], {})
+        self.assertEqual(peaks['RecursiveFibonacci'], {})
+        self.assertEqual(sorted(peaks['IterativeFibonacci']), [5000, 6000])
+        self.assertTrue(all(peak >= 0 for peak in peaks['IterativeFibonacci'].values()))
+
+    def test_memory_benchmark_with_small_n_table(self):
+        """
+        Tests that strategies unpickled in spawned processes serve small n from a complete table.
+        """
+        from src.Strategies.GMP.GMPIterativeFibonacci import GMPIterativeFibonacci
+        from src.Strategies.Primitive.IterativeFibonacci import IterativeFibonacci
+
+        benchmark = FibonacciBenchmark(max_n=0, spread=1, timeout=30, use_small_n_table=True)
+        peaks = benchmark.run_memory_benchmark([GMPIterativeFibonacci(), IterativeFibonacci()], [5, 93], None)
+        self.assertEqual(sorted(peaks['GMPIterativeFibonacci']), [5, 93])
+        self.assertEqual(sorted(peaks['IterativeFibonacci']), [5, 93])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,6 +2,7 @@ import unittest
 import os
 from typing import List
 from src.Strategies import FibonacciStrategy
+from src.Strategies.FibonacciStrategy import WORD_TABLE_LIMIT, small_n_table
 from src.Strategies.Primitive.IterativeFibonacci import IterativeFibonacci
 from src.Strategies.GMP.GMPIterativeFibonacci import GMPIterativeFibonacci
 from src.Strategies.Primitive.MatrixFibonacci import MatrixFibonacci
@@ -10,7 +11,17 @@ from src.Strategies.GMP.GMPDoublingFibonacci import GMPDoublingFibonacci
 from src.Strategies.Primitive.DoublingFibonacci import DoublingFibonacci
 from src.Strategies.GMP.GMPDoublingFibonacciOptimized import GMPDoublingFibonacciOptimized
 from src.Strategies.Primitive.ImprovedMatrixFibonnaci import ImprovedMatrixFibonnaci
+from src.Strategies.Primitive.MultiplicationBackend import NTTMultiplication
 from src.Strategies.GMP.GMPImprovedMatrixFibonnaci import GMPImprovedMatrixFibonnaci
+from src.Strategies.GMP.GMPXmpzIterativeFibonacci import GMPXmpzIterativeFibonacci
+from src.Strategies.GMP.GMPXmpzImprovedMatrixFibonacci import GMPXmpzImprovedMatrixFibonacci
+from src.Strategies.GMP.GMPXmpzDoublingFibonacci import GMPXmpzDoublingFibonacci
+from src.Strategies.GMP.GMPParallelDoublingFibonacci import GMPParallelDoublingFibonacci
+from src.Strategies.GMP.GMPKitamasaFibonacci import GMPKitamasaFibonacci
+from src.Strategies.Primitive.KitamasaFibonacci import KitamasaFibonacci
+from src.Strategies.Primitive.IterativeDoublingFibonacci import IterativeDoublingFibonacci
+from src.Strategies.Primitive.MemoizedRecursiveFibonacci import MemoizedRecursiveFibonacci
+from src.Strategies.GMP.GMPIterativeDoublingFibonacci import GMPIterativeDoublingFibonacci
 
 # Configuration
 MAX_FIB_NUMBER = 10000  # Adjust this to change the number of Fibonacci numbers to compare
@@ -74,6 +85,16 @@ class TestFibonacciStrategies(unittest.TestCase):
             GMPImprovedMatrixFibonnaci(),
             GMPMatrixFibonacci(),
             GMPIterativeFibonacci(),
+            GMPXmpzIterativeFibonacci(),
+            GMPXmpzImprovedMatrixFibonacci(),
+            GMPXmpzDoublingFibonacci(),
+            DoublingFibonacci(NTTMultiplication(threshold_bits=2048)),
+            KitamasaFibonacci(),
+            KitamasaFibonacci(method='matrix'),
+            GMPKitamasaFibonacci(),
+            IterativeDoublingFibonacci(),
+            GMPIterativeDoublingFibonacci(),
+            MemoizedRecursiveFibonacci(),
         ]
 
     def test_fibonacci_strategies(self):
@@ -81,12 +102,116 @@ class TestFibonacciStrategies(unittest.TestCase):
         Tests the validity of all Fibonacci strategies.
         """
         for idx, strategy in enumerate(self.strategies):
-            with self.subTest(f"Testing strategy {type(strategy).__name__}"):
+            # Disable the small-n table so the arithmetic itself is verified for every n
+            with self.subTest(f"Testing strategy {type(strategy).__name__}"), small_n_table.override(0):
                 self.assertTrue(
                     verify_fibonacci_strategy(strategy, self.reference_sequence),
                     f"Strategy {type(strategy).__name__} failed Fibonacci verification"
                 )
                 print(f"Strategy {type(strategy).__name__} passed Fibonacci verification")
 
+    def test_parallel_doubling_products(self):
+        """
+        Tests the shared-memory worker path of the parallel doubling strategy.
+        """
+        with GMPParallelDoublingFibonacci(workers=2, threshold_bits=64) as strategy:
+            for n in range(0, len(self.reference_sequence), 997):
+                self.assertEqual(strategy.execute(n), self.reference_sequence[n])
+
+    def test_stack_free_strategies_at_large_n(self):
+        """
+        Tests that the stack-free strategies handle n far beyond the recursion limit.
+        """
+        import sys
+        import gmpy2
+
+        n = 50 * sys.getrecursionlimit() + 1
+        for strategy in [IterativeDoublingFibonacci(), GMPIterativeDoublingFibonacci(), MemoizedRecursiveFibonacci()]:
+            with self.subTest(f"Testing strategy {type(strategy).__name__}"):
+                self.assertEqual(strategy.execute(n), gmpy2.fib(n))
+
+    def test_ntt_matrix_strategies(self):
+        """
+        Tests the matrix strategies with the NTT multiplication backend.
+        """
+        for strategy in [MatrixFibonacci(NTTMultiplication(threshold_bits=2048)),
+                         ImprovedMatrixFibonnaci(NTTMultiplication(threshold_bits=2048))]:
+            with self.subTest(f"Testing strategy {type(strategy).__name__}"):
+                for n in range(0, len(self.reference_sequence), 97):
+                    self.assertEqual(strategy.execute(n), self.reference_sequence[n])
+
+    def test_ntt_strategies_pickle(self):
+        """
+        Tests that strategies with the NTT backend survive a pickle round trip, as spawned processes require.
+        """
+        import pickle
+        import gmpy2
+
+        strategy = DoublingFibonacci(NTTMultiplication(threshold_bits=2048))
+        # Fill the transform caches, which are pickled along with the backend
+        strategy.execute(50000)
+        restored = pickle.loads(pickle.dumps(strategy))
+        self.assertEqual(restored.execute(50000), gmpy2.fib(50000))
+        self.assertEqual(restored.execute(9999), self.reference_sequence[9999])
+
+    def test_ntt_products(self):
+        """
+        Tests NTT products and squares against native multiplication, including the native
+        fallback for products beyond the exact range of the two primes.
+        """
+        import random
+
+        class SmallNTTMultiplication(NTTMultiplication):
+            MAX_LIMBS = 1 << 10
+
+        rng = random.Random(42)
+        backend = NTTMultiplication(threshold_bits=2048)
+        for _ in range(20):
+            a = rng.getrandbits(rng.randint(2048, 200000)) * rng.choice([1, -1])
+            b = rng.getrandbits(rng.randint(2048, 200000)) * rng.choice([1, -1])
+            self.assertEqual(backend.multiply(a, b), a * b)
+            self.assertEqual(backend.square(a), a * a)
+        self.assertEqual(backend.fallbacks, 0)
+
+        backend = SmallNTTMultiplication(threshold_bits=2048)
+        a, b = rng.getrandbits(2048), rng.getrandbits(6000)
+        self.assertEqual(backend.multiply(a, b), a * b)
+        self.assertEqual(backend.fallbacks, 0)
+        a, b = rng.getrandbits(20000), rng.getrandbits(30000)
+        with self.assertLogs(level='WARNING'):
+            self.assertEqual(backend.multiply(a, b), a * b)
+        self.assertEqual(backend.square(b), b * b)
+        self.assertEqual(backend.fallbacks, 2)
+
+    def test_small_n_table(self):
+        """
+        Tests that small n are served from the shared table with each strategy's result type.
+        """
+        import gmpy2
+
+        for strategy in [IterativeFibonacci(), GMPIterativeFibonacci(), GMPXmpzDoublingFibonacci()]:
+            with self.subTest(f"Testing strategy {type(strategy).__name__}"):
+                arithmetic_type = type(strategy.execute(WORD_TABLE_LIMIT))
+                for n in range(WORD_TABLE_LIMIT):
+                    self.assertEqual(strategy.execute(n), self.reference_sequence[n])
+                    self.assertIs(type(strategy.execute(n)), arithmetic_type)
+
+        # The limit is read on every call, so changing it applies to existing strategies
+        strategy = GMPDoublingFibonacci()
+        with small_n_table.override(1000):
+            self.assertIs(strategy.execute(999), small_n_table.mpz_values[999])
+            self.assertIs(small_n_table.values('int'), small_n_table.int_values)
+            self.assertEqual(len(small_n_table.int_values), 1000)
+            self.assertEqual(strategy.execute(999), gmpy2.fib(999))
+        self.assertEqual(small_n_table.limit, WORD_TABLE_LIMIT)
+        with small_n_table.override(0):
+            self.assertIsNot(strategy.execute(50), small_n_table.mpz_values[50])
+            self.assertEqual(strategy.execute(50), small_n_table.mpz_values[50])
+            # Strategies created while the table is disabled still find it complete once it is enabled
+            created_disabled = GMPIterativeFibonacci()
+            small_n_table.configure(200)
+            self.assertEqual(created_disabled.execute(150), gmpy2.fib(150))
+            self.assertIs(created_disabled.execute(150), small_n_table.mpz_values[150])
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
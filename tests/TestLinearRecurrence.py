@@ -0,0 +1,74 @@
+import unittest
+from typing import List
+
+from src.Strategies.LinearRecurrence import LinearRecurrence
+
+
+def naive_terms(coefficients: List[int], initial_values: List[int], count: int) -> List[int]:
+    """
+    Generates the first terms of a linear recurrence by direct iteration.
+
+    Args:
+        coefficients (List[int]): c1..ck.
+        initial_values (List[int]): a(0)..a(k-1).
+        count (int): Number of terms to generate.
+
+    Returns:
+        List[int]: a(0)..a(count-1).
+    """
+    terms = list(initial_values)
+    while len(terms) < count:
+        terms.append(sum(c * terms[-1 - i] for i, c in enumerate(coefficients)))
+    return terms[:count]
+
+
+class TestLinearRecurrence(unittest.TestCase):
+    CASES = {
+        'fibonacci': ([1, 1], [0, 1]),
+        'lucas': ([1, 1], [2, 1]),
+        'pell': ([2, 1], [0, 1]),
+        'tribonacci': ([1, 1, 1], [0, 0, 1]),
+        'order five': ([3, -1, 0, 2, 5], [1, -2, 0, 7, 4]),
+    }
+
+    def test_methods_and_backends(self):
+        """
+        Tests both methods on all backends against direct iteration.
+        """
+        for name, (coefficients, initial_values) in self.CASES.items():
+            reference = naive_terms(coefficients, initial_values, 300)
+            for backend in ('int', 'gmpy2'):
+                recurrence = LinearRecurrence(coefficients, initial_values, backend=backend)
+                for method in LinearRecurrence.METHODS:
+                    with self.subTest(f"{name} ({backend}, {method})"):
+                        self.assertEqual([recurrence.term(n, method) for n in range(300)], reference)
+
+            modular = LinearRecurrence(coefficients, initial_values, backend='mod', modulus=10 ** 9 + 7)
+            for method in LinearRecurrence.METHODS:
+                with self.subTest(f"{name} (mod, {method})"):
+                    self.assertEqual([modular.term(n, method) for n in range(300)],
+                                     [value % (10 ** 9 + 7) for value in reference])
+
+    def test_named_sequences(self):
+        """
+        Tests the named constructors against well-known terms.
+        """
+        self.assertEqual(LinearRecurrence.fibonacci().term(100), 354224848179261915075)
+        self.assertEqual(LinearRecurrence.lucas().term(10), 123)
+        self.assertEqual(LinearRecurrence.pell().term(10), 2378)
+        self.assertEqual(LinearRecurrence.tribonacci().term(10), 81)
+
+    def test_invalid_arguments(self):
+        """
+        Tests that inconsistent configurations are rejected.
+        """
+        with self.assertRaises(ValueError):
+            LinearRecurrence([1, 1], [0])
+        with self.assertRaises(ValueError):
+            LinearRecurrence([1, 1], [0, 1], backend='mod')
+        with self.assertRaises(ValueError):
+            LinearRecurrence.fibonacci().term(-1)
+
+
+if __name__ == "__main__":
+    unittest.main()
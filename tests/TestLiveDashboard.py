@@ -0,0 +1,144 @@
+import json
+import os
+import tempfile
+import unittest
+import urllib.request
+
+from BenchmarkEnvironment import capture_environment, write_metadata_header
+from FibonacciBenchmark import FibonacciBenchmark
+from LiveDashboard import LiveDashboard, ResultTailer
+from src.Strategies.Primitive.DoublingFibonacci import DoublingFibonacci
+from src.Strategies.Primitive.IterativeFibonacci import IterativeFibonacci
+
+
+class TestLiveDashboard(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.filename = os.path.join(directory.name, 'data.csv')
+
+    def _start_file(self, strategies, max_n=100, spread=10):
+        metadata = capture_environment()
+        metadata['benchmark'] = {'max_n': max_n, 'spread': spread, 'strategies': strategies, 'interleave': False}
+        with open(self.filename, 'w', newline='') as file:
+            write_metadata_header(file, metadata)
+            file.write('strategy,n,time\n')
+
+    def _append(self, text):
+        with open(self.filename, 'a', newline='') as file:
+            file.write(text)
+
+    def test_tailer_reads_only_complete_new_rows(self):
+        """
+        Tests that rows are returned once, and only when their line is complete.
+        """
+        self._start_file(['A'])
+        tailer = ResultTailer(self.filename)
+        self.assertEqual(tailer.poll(), ([], False))
+        self.assertEqual(tailer.metadata['benchmark']['strategies'], ['A'])
+
+        self._append('A,0,0.5\nA,10,0.')
+        rows, replaced = tailer.poll()
+        self.assertEqual(rows, [{'strategy': 'A', 'n': '0', 'time': '0.5'}])
+        self.assertFalse(replaced)
+
+        self._append('75\n')
+        self.assertEqual(tailer.poll()[0], [{'strategy': 'A', 'n': '10', 'time': '0.75'}])
+
+        # Replacing the file starts over
+        os.replace(self._copy_with_rows('A,0,1.0\n'), self.filename)
+        rows, replaced = tailer.poll()
+        self.assertTrue(replaced)
+        self.assertEqual(rows, [{'strategy': 'A', 'n': '0', 'time': '1.0'}])
+
+    def _copy_with_rows(self, rows):
+        replacement = self.filename + '.new'
+        with open(self.filename, 'r') as source, open(replacement, 'w', newline='') as target:
+            target.write(source.readline())
+            target.write('strategy,n,time\n' + rows)
+        return replacement
+
+    def test_aggregates_progress_and_crossovers(self):
+        """
+        Tests the incremental aggregates, the progress estimate and crossover detection.
+        """
+        self._start_file(['Slow', 'Fast', 'Pending'])
+        dashboard = LiveDashboard(self.filename, bins=10)
+        self._append(''.join(f'Slow,{n},{1 + n / 100}\n' for n in range(0, 100, 10)))
+        self.assertEqual(dashboard.update(), 10)
+        self._append(''.join(f'Fast,{n},{n / 20}\n' for n in range(0, 60, 10)))
+        self.assertEqual(dashboard.update(), 6)
+        self.assertEqual(dashboard.update(), 0)
+
+        slow = dashboard.aggregates['Slow']
+        self.assertEqual((slow.count, slow.last_n, slow.minimum, slow.maximum), (10, 90, 1.0, 1.9))
+        self.assertAlmostEqual(slow.mean, 1.45)
+
+        progress = dashboard.progress()
+        self.assertEqual((progress['done'], progress['expected']), (16, 30))
+        self.assertGreater(progress['remaining_seconds'], 0)
+
+        # Fast is faster up to n = 20 and slower from n = 30 on
+        crossovers = dashboard.crossovers()
+        self.assertEqual(len(crossovers), 1)
+        self.assertEqual((crossovers[0]['faster_below'], crossovers[0]['faster_above']), ('Fast', 'Slow'))
+        self.assertEqual(crossovers[0]['n'], 35)
+
+        # A strategy dropped at a timeout counts as finished once the next strategy starts
+        self.assertFalse(dashboard._finished('Fast'))
+        self._append('Pending,0,0.1\n')
+        dashboard.update()
+        self.assertTrue(dashboard._finished('Fast'))
+        self.assertEqual(dashboard.progress()['expected'], 26)
+
+    def test_follows_running_benchmark(self):
+        """
+        Tests that the streamed file is tailed and the final file is recognized as complete.
+        """
+        dashboard = LiveDashboard(self.filename, refresh=0)
+        strategies = [IterativeFibonacci(), DoublingFibonacci()]
+        benchmark = FibonacciBenchmark(max_n=200, spread=10, timeout=10)
+        streamed = []
+        original = benchmark._stream_row
+
+        def stream_row(strategy_name, n, execution_time):
+            original(strategy_name, n, execution_time)
+            streamed.append(dashboard.update())
+
+        benchmark._stream_row = stream_row
+        benchmark.run_benchmark(strategies, self.filename, None)
+
+        self.assertEqual(sum(streamed), 40)
+        self.assertFalse(dashboard.complete)
+        dashboard.update()
+        self.assertTrue(dashboard.complete)
+        self.assertEqual(dashboard.progress()['fraction'], 1.0)
+        self.assertEqual({name: a.count for name, a in dashboard.aggregates.items()},
+                         {'IterativeFibonacci': 20, 'DoublingFibonacci': 20})
+
+    def test_serves_page_and_status(self):
+        """
+        Tests the web page, the plot and the JSON status.
+        """
+        self._start_file(['A', 'B'])
+        self._append('A,0,0.1\nB,0,0.2\n')
+        dashboard = LiveDashboard(self.filename)
+        dashboard.update()
+        server = dashboard.serve(port=0)
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        base = f"http://127.0.0.1:{server.server_address[1]}"
+
+        with urllib.request.urlopen(base + '/') as response:
+            # A counts as finished with its single point once B has started
+            self.assertIn('2 / 11 measurements', response.read().decode())
+        with urllib.request.urlopen(base + '/plot.png') as response:
+            self.assertEqual(response.read()[:8], b'\x89PNG\r\n\x1a\n')
+        with urllib.request.urlopen(base + '/status.json') as response:
+            status = json.loads(response.read())
+        self.assertEqual(status['strategies']['B']['points'], 1)
+        self.assertFalse(status['complete'])
+
+
+if __name__ == '__main__':
+    unittest.main()
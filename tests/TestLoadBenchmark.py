@@ -0,0 +1,132 @@
+import os
+import tempfile
+import unittest
+from collections import Counter
+
+from LoadBenchmark import FibonacciLoadBenchmark, TraceDistribution, UniformDistribution, ZipfDistribution
+
+
+class FailingStrategy:
+    """Fails every request with an odd n."""
+
+    def execute(self, n):
+        if n % 2:
+            raise ValueError(n)
+        return n
+
+
+class TestLoadBenchmark(unittest.TestCase):
+    def test_uniform_distribution(self):
+        """
+        Tests that uniform samples stay within the bounds, cover them and are reproducible per client.
+        """
+        distribution = UniformDistribution(10, 20)
+        sampler = distribution.sampler(0, 2, seed=1)
+        values = [sampler() for _ in range(2000)]
+        self.assertEqual(set(values), set(range(10, 21)))
+
+        replay = distribution.sampler(0, 2, seed=1)
+        self.assertEqual([replay() for _ in range(2000)], values)
+        other_client = distribution.sampler(1, 2, seed=1)
+        self.assertNotEqual([other_client() for _ in range(2000)], values)
+
+        with self.assertRaises(ValueError):
+            UniformDistribution(5, 4)
+
+    def test_zipf_distribution(self):
+        """
+        Tests that Zipf samples are offset, bounded and favour small ranks with the expected weights.
+        """
+        distribution = ZipfDistribution(max_n=100, exponent=1.0, offset=50)
+        sampler = distribution.sampler(0, 1, seed=3)
+        counts = Counter(sampler() for _ in range(20000))
+        self.assertGreaterEqual(min(counts), 50)
+        self.assertLess(max(counts), 150)
+        # Rank 1 is drawn twice as often as rank 2 and ten times as often as rank 10
+        self.assertAlmostEqual(counts[50] / counts[51], 2, delta=0.3)
+        self.assertAlmostEqual(counts[50] / counts[59], 10, delta=3)
+
+        with self.assertRaises(ValueError):
+            ZipfDistribution(max_n=0)
+
+    def test_trace_distribution(self):
+        """
+        Tests that a trace is replayed in order from evenly spaced offsets and wraps around.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'trace.txt')
+            with open(filename, 'w') as file:
+                file.write('1,2\n3\n4')
+            distribution = TraceDistribution.from_file(filename)
+
+        first, second = distribution.sampler(0, 2, seed=0), distribution.sampler(1, 2, seed=0)
+        self.assertEqual([first() for _ in range(6)], [1, 2, 3, 4, 1, 2])
+        self.assertEqual([second() for _ in range(6)], [3, 4, 1, 2, 3, 4])
+
+        with self.assertRaises(ValueError):
+            TraceDistribution([])
+
+    def test_percentile_and_summary(self):
+        """
+        Tests the nearest-rank percentiles and the aggregated statistics.
+        """
+        values = [float(i) for i in range(1, 101)]
+        self.assertEqual(FibonacciLoadBenchmark._percentile(values, 50), 50.0)
+        self.assertEqual(FibonacciLoadBenchmark._percentile(values, 99.9), 100.0)
+        self.assertEqual(FibonacciLoadBenchmark._percentile(values, 0), 1.0)
+        self.assertEqual(FibonacciLoadBenchmark._percentile([7.0], 99), 7.0)
+
+        benchmark = FibonacciLoadBenchmark(clients=2, duration=4, distribution=UniformDistribution(0, 1))
+        summary = benchmark._summarize(list(reversed(values)), errors=3)
+        self.assertEqual(summary['requests'], 100)
+        self.assertEqual(summary['errors'], 3)
+        self.assertEqual(summary['throughput'], 25)
+        self.assertEqual(summary['mean'], 50.5)
+        self.assertEqual((summary['p50'], summary['p90'], summary['p99'], summary['p999'], summary['max']),
+                         (50.0, 90.0, 99.0, 100.0, 100.0))
+
+        empty = benchmark._summarize([], errors=0)
+        self.assertEqual(empty['requests'], 0)
+        self.assertIsNone(empty['mean'])
+        self.assertIsNone(empty['p99'])
+
+    def test_thread_mode_run(self):
+        """
+        Tests a short threaded run, including failed requests, and its CSV and JSON output.
+        """
+        from src.Strategies.Primitive.IterativeFibonacci import IterativeFibonacci
+
+        benchmark = FibonacciLoadBenchmark(clients=2, duration=0.3, distribution=UniformDistribution(0, 300),
+                                           warmup=0.05)
+        with tempfile.TemporaryDirectory() as directory:
+            csv_filename = os.path.join(directory, 'load.csv')
+            json_filename = os.path.join(directory, 'load.json')
+            with self.assertLogs(level='WARNING') as logs:
+                benchmark.run_load_benchmark([IterativeFibonacci(), FailingStrategy()], csv_filename, json_filename)
+            with open(csv_filename) as file:
+                header = file.readline().strip().split(',')
+                rows = file.read().splitlines()
+            self.assertTrue(os.path.exists(json_filename))
+
+        self.assertEqual(header, ['strategy', 'clients', 'requests', 'errors', 'throughput', 'mean',
+                                  'p50', 'p90', 'p99', 'p999', 'max'])
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(set(benchmark.results), {'IterativeFibonacci', 'FailingStrategy'})
+
+        result = benchmark.results['IterativeFibonacci']
+        self.assertEqual(result['clients'], 2)
+        self.assertGreater(result['requests'], 0)
+        self.assertEqual(result['errors'], 0)
+        self.assertAlmostEqual(result['throughput'], result['requests'] / 0.3)
+        self.assertLessEqual(result['p50'], result['p90'])
+        self.assertLessEqual(result['p90'], result['p99'])
+        self.assertLessEqual(result['p99'], result['p999'])
+        self.assertLessEqual(result['p999'], result['max'])
+        self.assertIsNone(result['first_error'])
+        self.assertGreater(benchmark.results['FailingStrategy']['errors'], 0)
+        self.assertTrue(benchmark.results['FailingStrategy']['first_error'].startswith('ValueError: '))
+        self.assertTrue(any('FailingStrategy: requests failed, first error: ValueError' in line for line in logs.output))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+import csv
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from BenchmarkEnvironment import read_metadata, skip_comment_lines
+from MicroBenchmark import MicroBenchmark, NullFibonacci, UncheckedNullFibonacci, format_micro_results
+from src.Strategies.FibonacciStrategy import WORD_TABLE_LIMIT, small_n_table
+
+
+class TestMicroBenchmark(unittest.TestCase):
+    def test_short_run(self):
+        """
+        Tests the rows and CSV columns of a short run, which always includes the table limit.
+        """
+        benchmark = MicroBenchmark(n_values=[10, 200], min_time=0.001, repeat=2)
+        with tempfile.TemporaryDirectory() as directory:
+            csv_filename = os.path.join(directory, 'micro.csv')
+            results = benchmark.run(['IterativeFibonacci', 'GMPIterativeFibonacci'], csv_filename)
+            with open(csv_filename) as file:
+                rows = list(csv.DictReader(skip_comment_lines(file)))
+            metadata = read_metadata(csv_filename)
+
+        self.assertEqual(benchmark.n_values, [10, WORD_TABLE_LIMIT, 200])
+        self.assertEqual([(row['strategy'], row['n']) for row in results],
+                         [(name, n) for name in ['IterativeFibonacci', 'GMPIterativeFibonacci', 'NullFibonacci',
+                                                 'UncheckedNullFibonacci'] for n in [10, WORD_TABLE_LIMIT, 200]])
+        self.assertEqual(list(rows[0]), ['strategy', 'n', 'table_ns', 'no_table_ns', 'dispatch_ns', 'arithmetic_ns'])
+        self.assertEqual(len(rows), len(results))
+        self.assertTrue(all(row['table_ns'] > 0 and row['no_table_ns'] > 0 and row['arithmetic_ns'] >= 0
+                            for row in results))
+        self.assertEqual(metadata['benchmark']['n_values'], [10, WORD_TABLE_LIMIT, 200])
+        self.assertEqual(metadata['small_n_table_limit'], WORD_TABLE_LIMIT)
+        self.assertIn('NullFibonacci', format_micro_results(results))
+
+    def test_table_limit_is_restored(self):
+        """
+        Tests that the table limit is restored when timing fails.
+        """
+        benchmark = MicroBenchmark(n_values=[10], table_limit=500, min_time=0.001, repeat=1)
+        with mock.patch.object(benchmark, '_per_call', side_effect=RuntimeError('interrupted')):
+            with self.assertRaises(RuntimeError):
+                benchmark.run(['IterativeFibonacci'])
+        self.assertEqual(small_n_table.limit, WORD_TABLE_LIMIT)
+
+    def test_null_strategies(self):
+        """
+        Tests that only NullFibonacci checks the table.
+        """
+        self.assertEqual(NullFibonacci().execute(10), 55)
+        self.assertEqual(NullFibonacci().execute(WORD_TABLE_LIMIT), WORD_TABLE_LIMIT)
+        self.assertEqual(UncheckedNullFibonacci().execute(10), 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
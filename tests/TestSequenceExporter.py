@@ -0,0 +1,64 @@
+import json
+import os
+import tempfile
+import unittest
+
+import gmpy2
+
+from SequenceExporter import INDEX_FILENAME, SequenceExporter, read_sequence
+
+
+class TestSequenceExporter(unittest.TestCase):
+    COUNT = 2500
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+
+    def test_round_trip(self):
+        """
+        Tests every format and compression against GMP's Fibonacci numbers.
+        """
+        expected = [gmpy2.fib(n) for n in range(self.COUNT)]
+        for output_format in ('decimal', 'binary'):
+            for compression in ('none', 'gzip', 'bz2', 'lzma'):
+                with self.subTest(f"Testing {output_format} with compression {compression}"):
+                    directory = os.path.join(self.directory, f"{output_format}_{compression}")
+                    exporter = SequenceExporter(directory, chunk_size=300, output_format=output_format,
+                                                compression=compression, workers=2, max_in_flight=3)
+                    summary = exporter.export(self.COUNT)
+                    self.assertEqual(summary['chunks'], 9)
+                    self.assertGreater(summary['raw_mb_per_s'], 0)
+                    self.assertEqual(list(read_sequence(directory)), expected)
+
+    def test_index_and_partial_read(self):
+        """
+        Tests the index file and reading from an index in the middle of a chunk.
+        """
+        summary = SequenceExporter(self.directory, chunk_size=1000, workers=2).export(self.COUNT)
+        with open(os.path.join(self.directory, INDEX_FILENAME)) as file:
+            index = json.load(file)
+
+        self.assertEqual(index['count'], self.COUNT)
+        self.assertEqual([(chunk['start'], chunk['stop']) for chunk in index['chunks']],
+                         [(0, 1000), (1000, 2000), (2000, 2500)])
+        self.assertEqual(sum(chunk['bytes'] for chunk in index['chunks']), summary['bytes'])
+        for chunk in index['chunks']:
+            self.assertEqual(os.path.getsize(os.path.join(self.directory, chunk['file'])), chunk['bytes'])
+
+        self.assertEqual(list(read_sequence(self.directory, start=1995)),
+                         [gmpy2.fib(n) for n in range(1995, self.COUNT)])
+
+    def test_rejects_unknown_options(self):
+        """
+        Tests that unknown formats and compressions are rejected up front.
+        """
+        with self.assertRaises(ValueError):
+            SequenceExporter(self.directory, output_format='hex')
+        with self.assertRaises(ValueError):
+            SequenceExporter(self.directory, compression='zip')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+import contextlib
+import csv
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from BenchmarkEnvironment import capture_environment, write_metadata_header
+from FibonacciCLI import build_parser, command_run, main
+from src.Strategies.StrategyRegistry import StrategyRegistry, UnknownStrategyError, registry
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class RegisteredStrategy:
+    pass
+
+
+class PluginStrategy:
+    pass
+
+
+def write_result_file(filename, metadata, rows):
+    """
+    Writes a CSV result file preceded by a metadata line.
+
+    Args:
+        filename (str): Path of the file.
+        metadata (dict): Metadata to embed.
+        rows (list): (strategy, n, time) rows.
+    """
+    with open(filename, 'w', newline='') as file:
+        write_metadata_header(file, metadata)
+        writer = csv.writer(file)
+        writer.writerow(['strategy', 'n', 'time'])
+        writer.writerows(rows)
+
+
+class TestStrategyRegistry(unittest.TestCase):
+    def test_listing_does_not_import_strategies(self):
+        """
+        Tests that listing strategies, in the registry and through the CLI, imports neither gmpy2 nor any strategy.
+        """
+        script = ("import sys; from src.Strategies.StrategyRegistry import registry; names = registry.names(); "
+                  "import FibonacciCLI, contextlib, io\n"
+                  "with contextlib.redirect_stdout(io.StringIO()): FibonacciCLI.main(['list'])\n"
+                  "print(len(names), 'gmpy2' in sys.modules, any(m.startswith('src.Strategies.GMP') for m in sys.modules))")
+        output = subprocess.run([sys.executable, '-c', script], cwd=PROJECT_ROOT, capture_output=True, text=True,
+                                check=True).stdout.split()
+        self.assertEqual(output, [str(len(registry.names())), 'False', 'False'])
+
+    def test_unknown_strategy(self):
+        """
+        Tests that unknown names raise UnknownStrategyError and make the CLI exit with status 2.
+        """
+        with self.assertRaises(UnknownStrategyError) as context:
+            registry.load('NoSuchFibonacci')
+        self.assertIn('IterativeFibonacci', context.exception.args[0])
+        self.assertIsInstance(context.exception, KeyError)
+
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()) as errors:
+            self.assertEqual(main(['run', '-s', 'NoSuchFibonacci', '--csv', '']), 2)
+        self.assertIn('NoSuchFibonacci', errors.getvalue())
+
+    def test_registered_and_builtin_strategies_take_precedence_over_plugins(self):
+        """
+        Tests that plugins are loaded lazily but never shadow built-in or registered strategies.
+        """
+        entry_points = [
+            SimpleNamespace(name='Registered', value='tests.TestStrategyRegistry:PluginStrategy'),
+            SimpleNamespace(name='IterativeFibonacci', value='tests.TestStrategyRegistry:PluginStrategy'),
+            SimpleNamespace(name='Plugin', value='tests.TestStrategyRegistry:PluginStrategy'),
+        ]
+        strategies = StrategyRegistry({'IterativeFibonacci': 'src.Strategies.Primitive.IterativeFibonacci'})
+        strategies.register('Registered', RegisteredStrategy)
+        with mock.patch('importlib.metadata.entry_points', return_value=entry_points) as discover:
+            self.assertEqual(strategies.names(), ['IterativeFibonacci', 'Registered', 'Plugin'])
+            strategies.names()
+        discover.assert_called_once()
+
+        self.assertIs(strategies.load('Registered'), RegisteredStrategy)
+        self.assertIs(strategies.load('Plugin'), PluginStrategy)
+        self.assertEqual(strategies.load('IterativeFibonacci').__name__, 'IterativeFibonacci')
+        self.assertIsInstance(strategies.create('Plugin'), PluginStrategy)
+
+    def test_parse_run_arguments(self):
+        """
+        Tests parsing of the run subcommand, including the comma-separated strategy list.
+        """
+        args = build_parser().parse_args(['run', '-s', 'IterativeFibonacci, GMPIterativeFibonacci,', '--max-n', '500',
+                                          '--spread', '5', '--interleave', '--pin-core'])
+        self.assertIs(args.handler, command_run)
+        self.assertEqual(args.strategies, ['IterativeFibonacci', 'GMPIterativeFibonacci'])
+        self.assertEqual((args.max_n, args.spread, args.timeout), (500, 5, 60))
+        self.assertTrue(args.interleave)
+        self.assertEqual(args.pin_core, -1)
+
+        with contextlib.redirect_stderr(io.StringIO()), self.assertRaises(SystemExit):
+            build_parser().parse_args(['run', '--max-n', 'many'])
+
+    def test_compare_command(self):
+        """
+        Tests the compare output on two small result files, and its refusal of incompatible runs.
+        """
+        metadata = capture_environment()
+        with tempfile.TemporaryDirectory() as directory:
+            baseline, candidate, other = (os.path.join(directory, name) for name in ('a.csv', 'b.csv', 'c.csv'))
+            write_result_file(baseline, metadata, [('A', 0, 1.0), ('A', 10, 2.0), ('B', 0, 1.0), ('C', 0, 1.0)])
+            write_result_file(candidate, metadata, [('A', 0, 2.0), ('A', 10, 8.0), ('A', 20, 1.0), ('B', 0, 0.5)])
+            write_result_file(other, dict(metadata, gmp_version='0.0'), [('A', 0, 1.0)])
+
+            with contextlib.redirect_stdout(io.StringIO()) as output:
+                self.assertEqual(main(['compare', baseline, candidate]), 0)
+            with contextlib.redirect_stderr(io.StringIO()) as errors:
+                self.assertEqual(main(['compare', baseline, other]), 1)
+
+        lines = output.getvalue().splitlines()
+        self.assertEqual(lines[0].split(), ['strategy', 'points', 'median', 'geomean'])
+        self.assertEqual(lines[1].split(), ['A', '2', '3.000x', '2.828x'])
+        self.assertEqual(lines[2].split(), ['B', '1', '0.500x', '0.500x'])
+        self.assertEqual(len(lines), 3)
+        self.assertIn('gmp_version', errors.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()